@@ -0,0 +1,85 @@
+"""Invitation fan-out time against the chat.postMessage rate-limit floor.
+
+Run from the repository root::
+
+    python -m benchmarks.invitation_fanout [--members 200] [--latency 0.05]
+
+A fake Slack client sleeps *latency* seconds per ``chat.postMessage`` and
+answers HTTP 429 (``Retry-After: 1``) whenever more calls arrive than the
+budget allows in a one-second window.  The floor is ``members / rate``; the
+old serial loop needed about ``members * latency``.
+"""
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web import SlackResponse
+
+from src.slack_bot.invitations import InvitationDispatcher
+
+
+class _FakeSlack:
+    def __init__(self, latency: float, per_second: float) -> None:
+        self._latency = latency
+        self._per_second = per_second
+        self._lock = threading.Lock()
+        self._window = 0
+        self._count = 0
+        self.throttled = 0
+
+    def chat_postMessage(self, **_kwargs) -> None:  # noqa: N802 – Slack API name
+        with self._lock:
+            window = int(time.monotonic())
+            if window != self._window:
+                self._window, self._count = window, 0
+            self._count += 1
+            over = self._count > self._per_second
+            if over:
+                self.throttled += 1
+        time.sleep(self._latency)
+        if over:
+            response = SlackResponse(
+                client=None,
+                http_verb="POST",
+                api_url="chat.postMessage",
+                req_args={},
+                data={"ok": False, "error": "ratelimited"},
+                headers={"Retry-After": "1"},
+                status_code=429,
+            )
+            raise SlackApiError("ratelimited", response)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--rate", type=float, default=6000.0, help="per minute")
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    client = _FakeSlack(args.latency, args.rate / 60)
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        dispatcher = InvitationDispatcher(
+            executor=pool,
+            concurrency=args.concurrency,
+            rate_per_minute=args.rate,
+        )
+        users = [f"U{i:05d}" for i in range(args.members)]
+        tally = dispatcher.send(client, users, text="hi", blocks=[])
+
+    floor = args.members / (args.rate / 60)
+    print(f"{'members':>8} {'serial s':>9} {'floor s':>8} {'actual s':>9} 429s")
+    print(
+        f"{args.members:>8} {args.members * args.latency:>9.2f} {floor:>8.2f} "
+        f"{tally.elapsed_seconds:>9.2f} {client.throttled:>4}"
+    )
+    assert tally.sent == args.members, tally
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Heap vs timing-wheel scheduler engines at 1k, 100k and 1M timers.
+
+Run from the repository root::
+
+    python -m benchmarks.scheduler_timers [--sizes 1000 100000]
+
+The engines are driven directly, on a simulated clock, without the scheduler
+thread or lock.  For every size the benchmark inserts that many timers spread
+over one hour, cancels half of them (as when sessions finish early) and then
+advances the clock one second at a time, dispatching what is due – the work
+the scheduler thread does.  Figures are microseconds per timer.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Dict, List, Tuple
+
+from src.scheduler import DEFAULT_RESOLUTION, _HeapQueue, _ScheduledItem, _TimingWheel
+
+SIZES = (1_000, 100_000, 1_000_000)
+HORIZON = 3600.0  # seconds the timers are spread over
+_NO_KWARGS: Dict[str, object] = {}
+
+
+def _run(engine: str, count: int, seed: int = 1) -> Tuple[float, float, float]:
+    rnd = random.Random(seed)
+    start = 1_000_000.0
+    if engine == "wheel":
+        queue = _TimingWheel(DEFAULT_RESOLUTION, now=start)
+    else:
+        queue = _HeapQueue()
+    items: List[_ScheduledItem] = [
+        _ScheduledItem(start + rnd.uniform(0, HORIZON), i, print, (), _NO_KWARGS)
+        for i in range(count)
+    ]
+
+    t0 = time.perf_counter()
+    for item in items:
+        queue.push(item)
+    t1 = time.perf_counter()
+    for item in items[::2]:
+        queue.remove(item)
+    t2 = time.perf_counter()
+    fired = 0
+    now = start
+    while now < start + HORIZON + 1:
+        now += 1.0
+        fired += len(queue.pop_due(now))
+    t3 = time.perf_counter()
+
+    assert fired == count - len(items[::2]), fired
+    return (
+        (t1 - t0) / count * 1e6,
+        (t2 - t1) / len(items[::2]) * 1e6,
+        (t3 - t2) / fired * 1e6,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    args = parser.parse_args()
+
+    print(
+        f"{'timers':>9} {'engine':>6} {'insert us':>10} {'cancel us':>10} "
+        f"{'dispatch us':>12}"
+    )
+    for count in args.sizes:
+        for engine in ("heap", "wheel"):
+            insert, cancel, dispatch = _run(engine, count)
+            print(
+                f"{count:>9,} {engine:>6} {insert:>10.2f} {cancel:>10.2f} "
+                f"{dispatch:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
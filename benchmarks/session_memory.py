@@ -0,0 +1,82 @@
+"""Memory used per :class:`SessionData` for different target group sizes.
+
+Run from the repository root::
+
+    python -m benchmarks.session_memory
+
+Each row allocates ``--sessions`` sessions (after one participant in three has
+submitted) and reports the bytes tracemalloc attributes to one session.  User
+IDs are built fresh for every session, as they would be when parsed from
+separate Slack payloads; interning means only the first session keeps them.
+``legacy`` is the former membership layout alone – a list of IDs plus
+``pending`` and ``submitted`` sets – while ``compact`` is a whole session.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, List
+
+from src.session_data import SessionData
+
+SIZES = (10, 500, 5000)
+
+
+def _user_ids(count: int) -> List[str]:
+    # "".join builds new string objects, like json.loads does for each payload.
+    return ["".join(("U0", format(i, "09d"))) for i in range(count)]
+
+
+def _compact(count: int) -> object:
+    session = SessionData("S", "U_init", "C", _user_ids(count))
+    for user_id in session.target_user_ids[::3]:
+        session.pending_users.discard(user_id)
+        session.submitted_users.add(user_id)
+    return session
+
+
+def _legacy(count: int) -> object:
+    targets = _user_ids(count)
+    pending = set(targets)
+    submitted = set()
+    for user_id in targets[::3]:
+        pending.discard(user_id)
+        submitted.add(user_id)
+    return targets, pending, submitted
+
+
+def bytes_per_session(
+    build: Callable[[int], object], members: int, sessions: int
+) -> float:
+    """Average tracemalloc bytes retained by ``build(members)``."""
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = [build(members) for _ in range(sessions)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kept
+    return (after - before) / sessions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'members':>8} {'compact B':>12} {'legacy B':>12} {'saving':>7}")
+    for members in SIZES:
+        compact = bytes_per_session(_compact, members, args.sessions)
+        legacy = bytes_per_session(_legacy, members, args.sessions)
+        print(
+            f"{members:>8} {compact:>12,.0f} {legacy:>12,.0f} "
+            f"{1 - compact / legacy:>7.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
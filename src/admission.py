@@ -0,0 +1,149 @@
+"""Priority-aware admission control for the executor lanes.
+
+Every lane already has a hard limit (see :mod:`src.executor_lanes`).  On top
+of that, work is admitted by :class:`Priority`: each priority may only fill a
+*share* of a lane's capacity, so the last slots stay free for work that
+finishes something already in progress.
+
+• ``HIGH`` – completing reports; may use the whole lane.
+• ``NORMAL`` – everything else; ``ADMISSION_NORMAL_SHARE`` (default 0.9).
+• ``LOW`` – creating new sessions; ``ADMISSION_LOW_SHARE`` (default 0.75).
+  New sessions eventually produce reports, so ``LOW`` work is also refused
+  while the ``reporting`` lane is past its share.
+
+Refused work raises :class:`Overloaded` straight away – callers tell the user
+to retry instead of leaving them waiting behind a long queue – and is
+counted in :meth:`AdmissionController.stats`.
+"""
+from __future__ import annotations
+
+import enum
+import logging
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from src.executor_lanes import ExecutorLane, LaneFullError
+
+__all__ = [
+    "AdmissionController",
+    "Overloaded",
+    "Priority",
+    "shares_from_env",
+]
+
+_logger = logging.getLogger(__name__)
+
+# Lane whose backlog also holds back new sessions
+_REPORTING_LANE = "reporting"
+
+
+class Priority(enum.IntEnum):
+    """How important a unit of background work is (higher wins)."""
+
+    LOW = 0
+    NORMAL = 1
+    HIGH = 2
+
+
+DEFAULT_SHARES: Dict[Priority, float] = {
+    Priority.LOW: 0.75,
+    Priority.NORMAL: 0.9,
+    Priority.HIGH: 1.0,
+}
+
+
+class Overloaded(LaneFullError):
+    """Work was shed by admission control; ask the user to retry later."""
+
+
+class AdmissionController:
+    """Admit or shed work for a set of :class:`ExecutorLane` objects."""
+
+    def __init__(
+        self,
+        lanes: Mapping[str, ExecutorLane],
+        shares: Optional[Mapping[Priority, float]] = None,
+    ) -> None:
+        """Guard *lanes*; *shares* overrides :data:`DEFAULT_SHARES`."""
+        self._lanes = lanes
+        self._shares = {**DEFAULT_SHARES, **(shares or {})}
+        self._lock = threading.Lock()
+        self._shed: Dict[str, int] = {}
+
+    def submit(
+        self,
+        lane: str,
+        priority: Priority,
+        fn: Callable[..., Any],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Future:
+        """Submit ``fn(*args, **kwargs)`` to *lane* if *priority* is admitted.
+
+        Raises:
+            Overloaded: If the work was shed (counted in :meth:`stats`).
+        """
+        share = self._shares[priority]
+        checked = [lane]
+        if priority is Priority.LOW and lane != _REPORTING_LANE:
+            checked.append(_REPORTING_LANE)
+        for name in checked:
+            target = self._lanes.get(name)
+            if target is not None and not target.has_room(share):
+                self._record_shed(lane, priority)
+                raise Overloaded(
+                    f"Shed {priority.name} work for lane '{lane}': "
+                    f"lane '{name}' is past {share:.0%} of its capacity"
+                )
+        try:
+            return self._lanes[lane].submit(fn, *args, **kwargs)
+        except LaneFullError as exc:
+            self._record_shed(lane, priority)
+            raise Overloaded(str(exc)) from exc
+
+    def _record_shed(self, lane: str, priority: Priority) -> None:
+        key = f"{lane}.{priority.name.lower()}"
+        with self._lock:
+            self._shed[key] = self._shed.get(key, 0) + 1
+        _logger.warning(
+            "admission_shed", extra={"lane": lane, "priority": priority.name}
+        )
+
+    @property
+    def shed_total(self) -> int:  # noqa: D401 – property
+        """Units of work shed so far."""
+        with self._lock:
+            return sum(self._shed.values())
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the shed counters, total and per ``lane.priority``."""
+        with self._lock:
+            return {"shed_total": sum(self._shed.values()), "shed": dict(self._shed)}
+
+
+def _parse_share(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        parsed = float(raw)
+    except ValueError:
+        _logger.warning("Ignoring non-numeric %s '%s'", name, raw)
+        return default
+    if not 0 < parsed <= 1:
+        _logger.warning("Ignoring %s=%s (must be in (0, 1])", name, raw)
+        return default
+    return parsed
+
+
+def shares_from_env() -> Dict[Priority, float]:
+    """Read ``ADMISSION_LOW_SHARE`` / ``ADMISSION_NORMAL_SHARE``."""
+    return {
+        Priority.LOW: _parse_share("ADMISSION_LOW_SHARE", DEFAULT_SHARES[Priority.LOW]),
+        Priority.NORMAL: _parse_share(
+            "ADMISSION_NORMAL_SHARE", DEFAULT_SHARES[Priority.NORMAL]
+        ),
+    }
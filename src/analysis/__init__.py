@@ -1,4 +1,4 @@
 # Public API re-exports
-from .anonymize import anonymize_quotes  # noqa: F401
-from .summary import generate_summary  # noqa: F401
-from .themes import extract_themes  # noqa: F401
+from .anonymize import aanonymize_quotes, anonymize_quotes  # noqa: F401
+from .summary import agenerate_summary, generate_summary  # noqa: F401
+from .themes import aextract_themes, extract_themes  # noqa: F401
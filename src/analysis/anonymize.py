@@ -4,13 +4,17 @@ from __future__ import annotations
 import json
 import logging
 import re
-from typing import List
+from typing import Any, Dict, List
 
-from src.openai_client import chat_completion
+from src.analysis.concurrency import CallOutcome, afan_out, fan_out
+from src.openai_client import achat_completion, chat_completion
 
 # Module logger
 logger = logging.getLogger(__name__)
 
+# Marks a quote returned verbatim because anonymization failed
+UNREDACTED_PREFIX = "[unredacted] "
+
 # Capture first JSON array (themes logic reused)
 _ARRAY_RE = re.compile(r"\[[^\]]*\]")
 
@@ -33,34 +37,81 @@ def _parse(content: str) -> List[str]:
     return arr
 
 
+def _build_messages(batch: List[str]) -> List[Dict[str, str]]:
+    user_prompt = "Please anonymize the following quotes:\n" + "\n".join(batch)
+    return [
+        {"role": "system", "content": _PROMPT_SYSTEM},
+        {"role": "user", "content": user_prompt},
+    ]
+
+
+def _check_batch(batch: List[str], resp: Dict[str, Any]) -> List[str]:
+    rewritten = _parse(resp["choices"][0]["message"]["content"])
+    if len(rewritten) != len(batch):
+        raise ValueError("Length mismatch")
+    return rewritten
+
+
+def _anonymize_batch(batch: List[str], temperature: float) -> List[str]:
+    resp = chat_completion(_build_messages(batch), temperature=temperature)
+    return _check_batch(batch, resp)
+
+
+async def _aanonymize_batch(batch: List[str], temperature: float) -> List[str]:
+    resp = await achat_completion(_build_messages(batch), temperature=temperature)
+    return _check_batch(batch, resp)
+
+
+def _chunk(quotes: List[str]) -> List[List[str]]:
+    # Chunk up to 10 quotes per request.
+    return [quotes[i : i + 10] for i in range(0, len(quotes), 10)]
+
+
+def _merge(
+    batches: List[List[str]], outcomes: List[CallOutcome[List[str]]]
+) -> List[str]:
+    out: List[str] = []
+    for batch, outcome in zip(batches, outcomes):
+        if outcome.ok and outcome.value is not None:
+            out.extend(outcome.value)
+            continue
+        # Log the root cause so we can debug why anonymization failed but continue gracefully.
+        logger.warning(
+            "Quote anonymization failed for batch: %s",
+            outcome.error,
+            exc_info=outcome.error,
+        )
+        out.extend([f"{UNREDACTED_PREFIX}{q}" for q in batch])
+    return out
+
+
 def anonymize_quotes(quotes: List[str], *, temperature: float = 0.3) -> List[str]:
     """Rewrite *quotes* removing personal identifiers.
 
-    If OpenAI fails, returns original quote prefixed with "[unredacted] ".
+    Chunks are sent concurrently on the ``"anonymize"`` analysis pool.
+    If OpenAI fails, returns original quote prefixed with :data:`UNREDACTED_PREFIX`.
     """
 
     if not quotes:
         return []
 
-    # Chunk up to 10 quotes per request.
-    out: List[str] = []
-    for i in range(0, len(quotes), 10):
-        batch = quotes[i : i + 10]
-        user_prompt = "Please anonymize the following quotes:\n" + "\n".join(batch)
-        messages = [
-            {"role": "system", "content": _PROMPT_SYSTEM},
-            {"role": "user", "content": user_prompt},
-        ]
-        try:
-            resp = chat_completion(messages, temperature=temperature)
-            rewritten = _parse(resp["choices"][0]["message"]["content"])
-            if len(rewritten) != len(batch):
-                raise ValueError("Length mismatch")
-            out.extend(rewritten)
-        except Exception as exc:  # noqa: BLE001
-            # Log the root cause so we can debug why anonymization failed but continue gracefully.
-            logger.warning(
-                "Quote anonymization failed for batch: %s", exc, exc_info=True
-            )
-            out.extend([f"[unredacted] {q}" for q in batch])
-    return out
+    batches = _chunk(quotes)
+    outcomes = fan_out(
+        "anonymize", lambda batch: _anonymize_batch(batch, temperature), batches
+    )
+    return _merge(batches, outcomes)
+
+
+async def aanonymize_quotes(
+    quotes: List[str], *, temperature: float = 0.3
+) -> List[str]:
+    """Asyncio twin of :func:`anonymize_quotes` with the same fallback."""
+
+    if not quotes:
+        return []
+
+    batches = _chunk(quotes)
+    outcomes = await afan_out(
+        "anonymize", lambda batch: _aanonymize_batch(batch, temperature), batches
+    )
+    return _merge(batches, outcomes)
@@ -0,0 +1,194 @@
+"""Bounded-concurrency fan-out for per-item OpenAI calls.
+
+Analysis helpers that must issue several independent requests (sentiment
+batches, anonymization chunks, …) hand them to :func:`fan_out`, which runs them
+on a small thread pool dedicated to that *call type*.  Each call type has its
+own concurrency limit so a large anonymization job cannot starve sentiment
+scoring and vice versa.
+
+Limits are read from the environment when a pool is first used:
+
+• ``ANALYSIS_CONCURRENCY_<CALL_TYPE>`` – limit for one call type, e.g.
+  ``ANALYSIS_CONCURRENCY_SENTIMENT=8``.
+• ``ANALYSIS_CONCURRENCY`` – fallback limit for every call type (default 4).
+
+:func:`afan_out` is the asyncio twin used by the async analysis helpers; it
+applies the same per-call-type limits with a semaphore instead of a pool.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Generic, List, Optional, Sequence, TypeVar
+
+__all__ = [
+    "CallOutcome",
+    "afan_out",
+    "concurrency_limit",
+    "fan_out",
+    "shutdown_pools",
+    "submit",
+]
+
+_logger = logging.getLogger(__name__)
+
+_DEFAULT_LIMIT = 4
+_THREAD_PREFIX = "analysis"
+
+A = TypeVar("A")
+T = TypeVar("T")
+
+_pools: Dict[str, ThreadPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class CallOutcome(Generic[T]):
+    """Result of one fanned-out call: either a *value* or the raised *error*."""
+
+    value: Optional[T] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:  # noqa: D401 – property
+        """Return *True* if the call completed without raising."""
+        return self.error is None
+
+
+def _parse_limit(raw: Optional[str]) -> Optional[int]:
+    if not raw:
+        return None
+    try:
+        parsed = int(raw)
+    except ValueError:
+        _logger.warning("Ignoring non-integer analysis concurrency '%s'", raw)
+        return None
+    if parsed <= 0:
+        _logger.warning("Ignoring analysis concurrency %s (must be positive)", raw)
+        return None
+    return parsed
+
+
+def concurrency_limit(call_type: str) -> int:
+    """Return the configured maximum number of in-flight calls for *call_type*."""
+
+    specific = _parse_limit(os.getenv(f"ANALYSIS_CONCURRENCY_{call_type.upper()}"))
+    if specific is not None:
+        return specific
+    return _parse_limit(os.getenv("ANALYSIS_CONCURRENCY")) or _DEFAULT_LIMIT
+
+
+def _get_pool(call_type: str) -> ThreadPoolExecutor:
+    with _pools_lock:
+        pool = _pools.get(call_type)
+        if pool is None:
+            limit = concurrency_limit(call_type)
+            pool = ThreadPoolExecutor(
+                max_workers=limit,
+                thread_name_prefix=f"{_THREAD_PREFIX}-{call_type}",
+            )
+            _pools[call_type] = pool
+            _logger.debug("Created %s analysis pool (max_workers=%d)", call_type, limit)
+        return pool
+
+
+def _in_pool_thread(call_type: str) -> bool:
+    # Nested fan-out on the same pool could deadlock once every worker waits on
+    # queued children, so calls made from a pool worker run inline instead.
+    return threading.current_thread().name.startswith(f"{_THREAD_PREFIX}-{call_type}_")
+
+
+def _run_inline(func: Callable[[A], T], items: Sequence[A]) -> List[CallOutcome[T]]:
+    outcomes: List[CallOutcome[T]] = []
+    for item in items:
+        try:
+            outcomes.append(CallOutcome(value=func(item)))
+        except Exception as exc:  # noqa: BLE001 – reported via outcome
+            outcomes.append(CallOutcome(error=exc))
+    return outcomes
+
+
+def fan_out(
+    call_type: str, func: Callable[[A], T], items: Sequence[A]
+) -> List[CallOutcome[T]]:
+    """Apply *func* to every element of *items* with bounded concurrency.
+
+    Outcomes are returned in input order.  A call that raises is reported as a
+    failed :class:`CallOutcome`; it never cancels or hides its siblings.
+
+    Parameters
+    ----------
+    call_type
+        Name of the pool to run on (e.g. ``"sentiment"``, ``"anonymize"``).
+    func
+        Callable invoked once per item.
+    items
+        Inputs to process.
+    """
+
+    if len(items) <= 1 or _in_pool_thread(call_type):
+        return _run_inline(func, items)
+
+    pool = _get_pool(call_type)
+    futures = [pool.submit(func, item) for item in items]
+
+    outcomes: List[CallOutcome[T]] = []
+    for fut in futures:
+        try:
+            outcomes.append(CallOutcome(value=fut.result()))
+        except Exception as exc:  # noqa: BLE001 – reported via outcome
+            outcomes.append(CallOutcome(error=exc))
+    return outcomes
+
+
+def submit(call_type: str, func: Callable[..., T], *args, **kwargs) -> Future[T]:
+    """Run ``func(*args, **kwargs)`` on the *call_type* pool without waiting.
+
+    Used for fire-and-forget background analysis; the caller owns the returned
+    future and any error it carries.
+    """
+
+    return _get_pool(call_type).submit(func, *args, **kwargs)
+
+
+async def afan_out(
+    call_type: str, func: Callable[[A], Awaitable[T]], items: Sequence[A]
+) -> List[CallOutcome[T]]:
+    """Asyncio twin of :func:`fan_out` for coroutine functions.
+
+    At most ``concurrency_limit(call_type)`` calls are awaited at once;
+    outcomes keep input order and failures never cancel siblings.
+    """
+
+    limit = asyncio.Semaphore(concurrency_limit(call_type))
+
+    async def _guarded(item: A) -> T:
+        async with limit:
+            return await func(item)
+
+    results = await asyncio.gather(
+        *(_guarded(item) for item in items), return_exceptions=True
+    )
+    outcomes: List[CallOutcome[T]] = []
+    for res in results:
+        if isinstance(res, BaseException):
+            if not isinstance(res, Exception):  # cancellation etc. must propagate
+                raise res
+            outcomes.append(CallOutcome(error=res))
+        else:
+            outcomes.append(CallOutcome(value=res))
+    return outcomes
+
+
+def shutdown_pools(wait: bool = True) -> None:
+    """Shut down every analysis pool; they are recreated lazily on next use."""
+
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
@@ -1,10 +1,16 @@
 """Sentiment analysis utilities using OpenAI.
 
-This module provides a single public helper ``analyze_sentiment`` which calls
-OpenAI ChatCompletion via the central ``openai_client`` wrapper and returns a
-structured result.
+This module provides two public helpers which call OpenAI ChatCompletion via
+the central ``openai_client`` wrapper and return structured results:
 
-The prompt asks the model to respond *only* with a compact JSON payload to make
+• ``analyze_sentiment`` – classify a single text.
+• ``analyze_sentiments`` – classify many texts, packing several of them into
+  one prompt to save round trips.
+
+``aanalyze_sentiment`` / ``aanalyze_sentiments`` are asyncio-native twins used
+by the async report pipeline.
+
+The prompts ask the model to respond *only* with a compact JSON payload to make
 machine-parsing deterministic.
 """
 from __future__ import annotations
@@ -14,9 +20,10 @@ import logging
 import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Sequence
 
-from ..openai_client import chat_completion
+from ..openai_client import achat_completion, chat_completion
+from .concurrency import CallOutcome, afan_out, fan_out
 
 _logger = logging.getLogger(__name__)
 
@@ -41,19 +48,14 @@ class SentimentResult:
 
 
 _RESPONSE_RE = re.compile(r"\{[\s\S]*?\}")  # first JSON object in string
+_BATCH_RESPONSE_RE = re.compile(r"\[[\s\S]*\]")  # outermost JSON array in string
 
 
-def _parse_response(content: str) -> SentimentResult:
-    """Extract a ``SentimentResult`` from the model's raw string response."""
+def _result_from_payload(payload: Any) -> SentimentResult:
+    """Validate a decoded ``{"label": ..., "score": ...}`` object."""
 
-    match = _RESPONSE_RE.search(content)
-    if not match:
-        raise ValueError("Model response did not contain a JSON object")
-
-    try:
-        payload: Dict[str, Any] = json.loads(match.group(0))
-    except json.JSONDecodeError as exc:
-        raise ValueError("Failed to parse JSON from model response") from exc
+    if not isinstance(payload, dict):
+        raise ValueError("Sentiment payload was not a JSON object")
 
     label_raw = payload.get("label")
     score = payload.get("score")
@@ -70,24 +72,65 @@ def _parse_response(content: str) -> SentimentResult:
     return SentimentResult(label=label, score=score_f)
 
 
+def _parse_response(content: str) -> SentimentResult:
+    """Extract a ``SentimentResult`` from the model's raw string response."""
+
+    match = _RESPONSE_RE.search(content)
+    if not match:
+        raise ValueError("Model response did not contain a JSON object")
+
+    try:
+        payload: Dict[str, Any] = json.loads(match.group(0))
+    except json.JSONDecodeError as exc:
+        raise ValueError("Failed to parse JSON from model response") from exc
+
+    return _result_from_payload(payload)
+
+
+def _parse_batch_response(content: str, expected: int) -> List[SentimentResult]:
+    """Extract *expected* results from a batch response, checking input order.
+
+    Every element must carry the ``i`` index it was given in the prompt so a
+    dropped or reordered item is detected instead of silently shifting labels.
+    """
+
+    match = _BATCH_RESPONSE_RE.search(content)
+    if not match:
+        raise ValueError("Model response did not contain a JSON array")
+
+    try:
+        payload: Any = json.loads(match.group(0))
+    except json.JSONDecodeError as exc:
+        raise ValueError("Failed to parse JSON from model response") from exc
+
+    if not isinstance(payload, list):
+        raise ValueError("JSON payload was not an array")
+    if len(payload) != expected:
+        raise ValueError(f"Expected {expected} results, got {len(payload)}")
+
+    results: List[SentimentResult] = []
+    for idx, entry in enumerate(payload):
+        if not isinstance(entry, dict) or entry.get("i") != idx:
+            raise ValueError(f"Result {idx} is missing or out of order")
+        results.append(_result_from_payload(entry))
+    return results
+
+
 _PROMPT_SYSTEM = (
     "You are a precise sentiment analysis assistant. "
     'Return ONLY a minified JSON like {"label":"positive", "score":0.8}.'
 )
 
+_BATCH_PROMPT_SYSTEM = (
+    "You are a precise sentiment analysis assistant. You will receive a "
+    "numbered list of texts. Return ONLY a minified JSON array with exactly one "
+    "object per text, in the same order, each echoing the text number as "
+    '"i", e.g. [{"i":0,"label":"positive","score":0.8}].'
+)
 
-def analyze_sentiment(text: str, *, temperature: float = 0.0) -> SentimentResult:
-    """Classify *text* as positive/neutral/negative using OpenAI.
-
-    Parameters
-    ----------
-    text
-        The text to classify.
-    temperature
-        Optional temperature forwarded to the model (default 0 for determinism).
-    """
 
-    messages = [
+def _build_messages(text: str) -> List[Dict[str, str]]:
+    return [
         {"role": "system", "content": _PROMPT_SYSTEM},
         {
             "role": "user",
@@ -98,10 +141,174 @@ def analyze_sentiment(text: str, *, temperature: float = 0.0) -> SentimentResult
         },
     ]
 
-    response = chat_completion(messages, temperature=temperature)
+
+def _parse_completion(response: Dict[str, Any]) -> SentimentResult:
     try:
         content: str = response["choices"][0]["message"]["content"]
     except (KeyError, IndexError, TypeError) as exc:
         raise ValueError("Model response missing expected fields") from exc
-
     return _parse_response(content)
+
+
+def analyze_sentiment(text: str, *, temperature: float = 0.0) -> SentimentResult:
+    """Classify *text* as positive/neutral/negative using OpenAI.
+
+    Parameters
+    ----------
+    text
+        The text to classify.
+    temperature
+        Optional temperature forwarded to the model (default 0 for determinism).
+    """
+
+    response = chat_completion(_build_messages(text), temperature=temperature)
+    return _parse_completion(response)
+
+
+async def aanalyze_sentiment(text: str, *, temperature: float = 0.0) -> SentimentResult:
+    """Asyncio twin of :func:`analyze_sentiment`."""
+
+    response = await achat_completion(_build_messages(text), temperature=temperature)
+    return _parse_completion(response)
+
+
+def _build_batch_prompt(texts: Sequence[str]) -> str:
+    # JSON-encode each text so embedded newlines/quotes cannot blur item borders.
+    numbered = "\n".join(f"{idx}: {json.dumps(text)}" for idx, text in enumerate(texts))
+    return (
+        "Sentiment analysis request. For each text, identify the sentiment label"
+        " (positive, neutral or negative) and a score between -1 and 1"
+        f" (negative..positive).\n\nTexts ({len(texts)}):\n" + numbered
+    )
+
+
+def _batch_messages(texts: Sequence[str]) -> List[Dict[str, str]]:
+    return [
+        {"role": "system", "content": _BATCH_PROMPT_SYSTEM},
+        {"role": "user", "content": _build_batch_prompt(texts)},
+    ]
+
+
+def _classify_batch(
+    texts: Sequence[str], temperature: float
+) -> List[Optional[SentimentResult]]:
+    """Classify *texts* in one request, halving the batch if parsing fails."""
+
+    if len(texts) == 1:
+        try:
+            return [analyze_sentiment(texts[0], temperature=temperature)]
+        except Exception as exc:  # noqa: BLE001 – one bad item must not sink the rest
+            _logger.warning("Sentiment analysis failed for item: %s", exc)
+            return [None]
+
+    try:
+        response = chat_completion(_batch_messages(texts), temperature=temperature)
+        content: str = response["choices"][0]["message"]["content"]
+        return list(_parse_batch_response(content, len(texts)))
+    except (ValueError, KeyError, IndexError, TypeError) as exc:
+        # Malformed output usually affects one confusing item or an overly long
+        # batch – split in half and retry each side independently.
+        mid = len(texts) // 2
+        _logger.info(
+            "Sentiment batch of %d failed to parse (%s); splitting", len(texts), exc
+        )
+        return _classify_batch(texts[:mid], temperature) + _classify_batch(
+            texts[mid:], temperature
+        )
+    except Exception as exc:  # noqa: BLE001 – API failure, splitting will not help
+        _logger.warning(
+            "Sentiment analysis failed for batch of %d: %s", len(texts), exc
+        )
+        return [None] * len(texts)
+
+
+async def _aclassify_batch(
+    texts: Sequence[str], temperature: float
+) -> List[Optional[SentimentResult]]:
+    """Asyncio twin of :func:`_classify_batch`."""
+
+    if len(texts) == 1:
+        try:
+            return [await aanalyze_sentiment(texts[0], temperature=temperature)]
+        except Exception as exc:  # noqa: BLE001 – one bad item must not sink the rest
+            _logger.warning("Sentiment analysis failed for item: %s", exc)
+            return [None]
+
+    try:
+        response = await achat_completion(
+            _batch_messages(texts), temperature=temperature
+        )
+        content: str = response["choices"][0]["message"]["content"]
+        return list(_parse_batch_response(content, len(texts)))
+    except (ValueError, KeyError, IndexError, TypeError) as exc:
+        mid = len(texts) // 2
+        _logger.info(
+            "Sentiment batch of %d failed to parse (%s); splitting", len(texts), exc
+        )
+        return await _aclassify_batch(texts[:mid], temperature) + (
+            await _aclassify_batch(texts[mid:], temperature)
+        )
+    except Exception as exc:  # noqa: BLE001 – API failure, splitting will not help
+        _logger.warning(
+            "Sentiment analysis failed for batch of %d: %s", len(texts), exc
+        )
+        return [None] * len(texts)
+
+
+def analyze_sentiments(
+    texts: Sequence[str], *, batch_size: int = 20, temperature: float = 0.0
+) -> List[Optional[SentimentResult]]:
+    """Classify many *texts*, packing up to *batch_size* of them per request.
+
+    Batches are sent concurrently on the ``"sentiment"`` analysis pool (see
+    :mod:`src.analysis.concurrency`).  Results are returned in input order.  An
+    entry is ``None`` when its text could not be classified, even after the
+    batch was split down to a single item.
+
+    Parameters
+    ----------
+    texts
+        The texts to classify.
+    batch_size
+        Maximum number of texts sent in a single prompt (default 20).
+    temperature
+        Optional temperature forwarded to the model (default 0 for determinism).
+    """
+
+    batches = _make_batches(texts, batch_size)
+    outcomes = fan_out(
+        "sentiment", lambda batch: _classify_batch(batch, temperature), batches
+    )
+    return _merge_outcomes(batches, outcomes)
+
+
+async def aanalyze_sentiments(
+    texts: Sequence[str], *, batch_size: int = 20, temperature: float = 0.0
+) -> List[Optional[SentimentResult]]:
+    """Asyncio twin of :func:`analyze_sentiments`."""
+
+    batches = _make_batches(texts, batch_size)
+    outcomes = await afan_out(
+        "sentiment", lambda batch: _aclassify_batch(batch, temperature), batches
+    )
+    return _merge_outcomes(batches, outcomes)
+
+
+def _make_batches(texts: Sequence[str], batch_size: int) -> List[Sequence[str]]:
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    return [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+
+
+def _merge_outcomes(
+    batches: List[Sequence[str]],
+    outcomes: List[CallOutcome[List[Optional[SentimentResult]]]],
+) -> List[Optional[SentimentResult]]:
+    results: List[Optional[SentimentResult]] = []
+    for batch, outcome in zip(batches, outcomes):
+        if outcome.ok and outcome.value is not None:
+            results.extend(outcome.value)
+        else:
+            _logger.warning("Sentiment batch failed: %s", outcome.error)
+            results.extend([None] * len(batch))
+    return results
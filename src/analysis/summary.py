@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 import logging
-from typing import List
+from typing import Any, Dict, List
 
-from src.openai_client import chat_completion
+from src.openai_client import achat_completion, chat_completion
 
 _logger = logging.getLogger(__name__)
 
@@ -31,6 +31,25 @@ def _build_user_prompt(quotes: List[str], themes: List[str]) -> str:
     )
 
 
+def _build_messages(
+    quotes: List[str], themes: List[str] | None
+) -> List[Dict[str, str]]:
+    return [
+        {"role": "system", "content": _SYSTEM_PROMPT},
+        {"role": "user", "content": _build_user_prompt(quotes, themes or [])},
+    ]
+
+
+def _extract_summary(resp: Dict[str, Any], max_length_chars: int) -> str:
+    try:
+        content: str = resp["choices"][0]["message"]["content"].strip()
+    except (KeyError, IndexError, TypeError, AttributeError) as exc:
+        raise RuntimeError("OpenAI summary response malformed") from exc
+    if len(content) > max_length_chars:
+        content = content[:max_length_chars].rstrip() + "…"
+    return content
+
+
 def generate_summary(
     quotes: List[str],
     themes: List[str] | None = None,
@@ -42,32 +61,45 @@ def generate_summary(
     """Generate a concise textual summary of *quotes* guided by *themes*.
 
     Returns an empty string if *quotes* is empty.
-    Raises RuntimeError after two failed attempts.
+    Raises RuntimeError if the OpenAI call fails after the shared retries.
     """
 
     if not quotes:
         return ""
 
-    themes = themes or []
-    messages = [
-        {"role": "system", "content": _SYSTEM_PROMPT},
-        {"role": "user", "content": _build_user_prompt(quotes, themes)},
-    ]
+    # Retries/back-off are handled centrally by ``chat_completion``.
+    try:
+        resp = chat_completion(
+            _build_messages(quotes, themes),
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+    except Exception as exc:  # noqa: BLE001
+        _logger.warning("Summary generation failed: %s", exc)
+        raise RuntimeError("OpenAI summary generation failed") from exc
+    return _extract_summary(resp, max_length_chars)
+
+
+async def agenerate_summary(
+    quotes: List[str],
+    themes: List[str] | None = None,
+    *,
+    max_tokens: int = 250,
+    temperature: float = 0.4,
+    max_length_chars: int = 900,
+) -> str:
+    """Asyncio twin of :func:`generate_summary`."""
+
+    if not quotes:
+        return ""
 
-    attempts = 0
-    while attempts < 2:
-        attempts += 1
-        try:
-            resp = chat_completion(
-                messages, temperature=temperature, max_tokens=max_tokens
-            )
-            content: str = resp["choices"][0]["message"]["content"].strip()
-            if len(content) > max_length_chars:
-                content = content[:max_length_chars].rstrip() + "…"
-            return content
-        except Exception as exc:  # noqa: BLE001
-            _logger.warning("Summary generation attempt %d failed: %s", attempts, exc)
-            if attempts >= 2:
-                raise RuntimeError("OpenAI summary generation failed") from exc
-    # Should never get here, but satisfy mypy
-    return ""
+    try:
+        resp = await achat_completion(
+            _build_messages(quotes, themes),
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+    except Exception as exc:  # noqa: BLE001
+        _logger.warning("Summary generation failed: %s", exc)
+        raise RuntimeError("OpenAI summary generation failed") from exc
+    return _extract_summary(resp, max_length_chars)
@@ -3,9 +3,9 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Any, List
+from typing import Any, Dict, List
 
-from src.openai_client import chat_completion
+from src.openai_client import achat_completion, chat_completion
 
 # Regex to capture the first JSON array in the model response (robust to extra text)
 _RESPONSE_RE = re.compile(r"\[[^\]]*\]")
@@ -37,6 +37,18 @@ _PROMPT_SYSTEM = (
 )
 
 
+def _build_messages(feedback: List[str], max_themes: int) -> List[Dict[str, str]]:
+    joined = "\n".join(f"- {line}" for line in feedback)
+    user_prompt = (
+        f"Please extract up to {max_themes} high-level themes from the following "
+        "feedback list. Return ONLY a JSON array of strings.\n\nFeedback:\n" + joined
+    )
+    return [
+        {"role": "system", "content": _PROMPT_SYSTEM},
+        {"role": "user", "content": user_prompt},
+    ]
+
+
 def extract_themes(
     feedback: List[str], *, max_themes: int = 5, temperature: float = 0.0
 ) -> List[str]:
@@ -55,17 +67,23 @@ def extract_themes(
     if not feedback:
         return []
 
-    joined = "\n".join(f"- {line}" for line in feedback)
-    user_prompt = (
-        f"Please extract up to {max_themes} high-level themes from the following "
-        "feedback list. Return ONLY a JSON array of strings.\n\nFeedback:\n" + joined
+    response = chat_completion(
+        _build_messages(feedback, max_themes), temperature=temperature
     )
+    content: str = response["choices"][0]["message"]["content"]
+    return _parse_response(content)
 
-    messages = [
-        {"role": "system", "content": _PROMPT_SYSTEM},
-        {"role": "user", "content": user_prompt},
-    ]
 
-    response = chat_completion(messages, temperature=temperature)
+async def aextract_themes(
+    feedback: List[str], *, max_themes: int = 5, temperature: float = 0.0
+) -> List[str]:
+    """Asyncio twin of :func:`extract_themes`."""
+
+    if not feedback:
+        return []
+
+    response = await achat_completion(
+        _build_messages(feedback, max_themes), temperature=temperature
+    )
     content: str = response["choices"][0]["message"]["content"]
     return _parse_response(content)
@@ -1,26 +1,42 @@
 import atexit
 import logging
+import math
 import os
 import re
+import threading
 import uuid  # For generating unique session IDs
-from concurrent.futures import Future, ThreadPoolExecutor
-from typing import Any, Dict, Optional
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
 from slack_bolt import Ack, App, Respond
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
+from src.admission import AdmissionController, Overloaded, Priority, shares_from_env
+from src.analysis.concurrency import shutdown_pools as shutdown_analysis_pools
+from src.async_runtime import run_coroutine, shutdown_loop
+from src.executor_lanes import create_lanes, shutdown_lanes
+from src.openai_client import aclose_openai_client, close_openai_client
+from src.reporting import config as report_config
+from src.scheduler_journal import journal_from_env
+from src.session_backend import backend_from_env
 from src.session_data import SessionData  # For creating new sessions
 from src.session_store import ThreadSafeSessionStore
 from src.slack_bot.handlers import (  # For opening the modal and building invitation message
     handle_feedback_button_click,
     handle_feedback_modal_submission,
 )
+from src.slack_bot.invitations import (
+    METHOD_RATES,
+    InvitationDispatcher,
+    InvitationTally,
+)
 from src.slack_bot.views import (  # For opening the modal and building invitation message
     build_invitation_message,
 )
 
+from .scheduler import ENGINES as SCHEDULER_ENGINES
 from .scheduler import Scheduler
 
 # Load environment variables from .env file
@@ -72,14 +88,112 @@ def _get_max_sessions_from_env() -> Optional[int]:  # noqa: WPS430 – tiny help
         return None
 
 
+def _get_float_from_env(name: str, default: float) -> float:  # noqa: WPS430
+    raw_val = os.getenv(name)
+    if not raw_val:
+        return default
+    try:
+        parsed = float(raw_val)
+    except ValueError:
+        logger.warning("Invalid %s value '%s'; must be a number.", name, raw_val)
+        return default
+    if parsed < 0:
+        logger.warning("Ignoring %s=%s (must not be negative)", name, raw_val)
+        return default
+    return parsed
+
+
+# Sessions idle for longer than this are evicted by the sweeper (0 disables).
+SESSION_MAX_AGE_SECONDS = _get_float_from_env("SESSION_MAX_AGE_HOURS", 24.0) * 3600
+SESSION_SWEEP_INTERVAL_SECONDS = (
+    _get_float_from_env("SESSION_SWEEP_INTERVAL_SECONDS", 300.0) or 300.0
+)
+
+
+def _create_session_store():  # noqa: WPS430 – tiny helper
+    """Build the session store selected by ``SESSION_BACKEND``.
+
+    ``redis`` shares sessions between replicas through ``REDIS_URL``; every
+    other value keeps them in this process (optionally persisted, see
+    :func:`src.session_backend.backend_from_env`).
+    """
+    limits = {
+        "max_sessions": _get_max_sessions_from_env(),
+        "max_age_seconds": SESSION_MAX_AGE_SECONDS or None,
+    }
+    if os.getenv("SESSION_BACKEND", "").strip().lower() == "redis":
+        # Local import – the redis client is only needed for this backend.
+        from src.redis_session_store import RedisSessionStore
+
+        return RedisSessionStore.from_url(
+            os.getenv("REDIS_URL", "redis://localhost:6379/0"), **limits
+        )
+    return ThreadSafeSessionStore(backend=backend_from_env(), **limits)
+
+
 # Initialize session store with optional limit
-session_store = ThreadSafeSessionStore(max_sessions=_get_max_sessions_from_env())
+session_store = _create_session_store()
+
+# Thread pools ("lanes") per kind of work, so slow report generation cannot
+# starve slash commands; see src.executor_lanes for sizes and env overrides.
+lanes = create_lanes()
+
+# Sheds new work by priority before the lanes fill up, so reports for
+# sessions that are finishing are not stuck behind a burst of new sessions.
+admission = AdmissionController(lanes, shares_from_env())
+
+# Invitation DMs from every session share one chat.postMessage budget.
+invitations = InvitationDispatcher(
+    executor=lanes["fanout"],
+    concurrency=int(_get_float_from_env("INVITE_CONCURRENCY", 4) or 4),
+    rate_per_minute=_get_float_from_env(
+        "INVITE_RATE_PER_MINUTE", METHOD_RATES["chat.postMessage"]
+    )
+    or METHOD_RATES["chat.postMessage"],
+    max_attempts=int(_get_float_from_env("INVITE_MAX_ATTEMPTS", 4) or 4),
+)
+# Groups at least this large get progress updates while invitations go out.
+INVITE_PROGRESS_MIN_MEMBERS = 100
+
+
+def _create_scheduler() -> Scheduler:  # noqa: WPS430 – tiny helper
+    """Build the scheduler engine selected by ``SCHEDULER_ENGINE``."""
+    engine = os.getenv("SCHEDULER_ENGINE", "heap").strip().lower() or "heap"
+    if engine not in SCHEDULER_ENGINES:
+        logger.warning("Unknown SCHEDULER_ENGINE '%s'; using heap.", engine)
+        engine = "heap"
+    tick_ms = _get_float_from_env("SCHEDULER_TICK_MS", 10.0) or 10.0
+    return Scheduler(
+        lanes["timers"],
+        engine=engine,
+        resolution=tick_ms / 1000,
+        journal=journal_from_env(),
+        catchup_burst=int(_get_float_from_env("SCHEDULER_CATCHUP_BURST", 20) or 20),
+        catchup_interval=_get_float_from_env("SCHEDULER_CATCHUP_INTERVAL_SECONDS", 1.0),
+    )
 
-# Initialize a single thread pool for the application
-executor = ThreadPoolExecutor(max_workers=10)
 
 # Shared scheduler for non-blocking timers (e.g., session expiry reminders)
-scheduler = Scheduler(executor)
+scheduler = _create_scheduler()
+
+# session_id -> scheduler task ids of its expiry timer and reminder
+_session_timers: Dict[str, List[int]] = {}
+_session_timers_lock = threading.Lock()
+
+
+def _cancel_session_timers(session_id: str) -> None:
+    """Cancel the pending timers of a session that left the store.
+
+    Completion alone keeps them: the reminder skips complete sessions, and
+    the expiry still reports if posting the completion report fails.
+    """
+    with _session_timers_lock:
+        task_ids = _session_timers.pop(session_id, [])
+    for task_id in task_ids:
+        scheduler.cancel(task_id)
+
+
+session_store.add_close_listener(_cancel_session_timers)
 
 
 # ------------------------------------------------------------------
@@ -104,13 +218,11 @@ def _expire_feedback_session(
         target_channel = session.channel_id or initiator_user_id
 
         if has_feedback:
-            from src.reporting.aggregator import process_session  # local import
-            from src.reporting.render import post_report_to_slack  # local import
+            from src.reporting.render import dispatch_session_report  # local import
 
             try:
-                processed = process_session(session)
-                post_report_to_slack(
-                    processed=processed,
+                dispatch_session_report(
+                    session,
                     client=client,
                     channel=target_channel,
                 )
@@ -183,6 +295,118 @@ def _send_pending_reminder(session_id: str, client: WebClient) -> None:
         logger.exception("Error sending reminder for session %s", session_id)
 
 
+# Durable timer kinds – journaled tasks cannot carry a WebClient, so these
+# use the app's client.
+_EXPIRE_TASK = "expire_session"
+_REMINDER_TASK = "session_reminder"
+
+
+def _expire_session_task(session_id: str, initiator_user_id: str) -> None:
+    _expire_feedback_session(session_id, initiator_user_id, app.client)
+
+
+def _reminder_task(session_id: str) -> None:
+    _send_pending_reminder(session_id, app.client)
+
+
+# Expiry may post a full report, so it runs on the reporting lane.
+scheduler.register_task(_EXPIRE_TASK, _expire_session_task, lanes["reporting"])
+scheduler.register_task(_REMINDER_TASK, _reminder_task)
+
+
+def _track_session_timers(session_id: str, task_ids: List[int]) -> None:
+    with _session_timers_lock:
+        _session_timers.setdefault(session_id, []).extend(task_ids)
+
+
+def _schedule_session_timers(session: SessionData) -> None:
+    """Register the expiry timer (and 1-minute reminder) for *session*."""
+    delay_seconds = session.time_remaining()
+    if delay_seconds is None:
+        return
+    task_ids = [
+        scheduler.schedule_task(
+            _EXPIRE_TASK,
+            delay_seconds,
+            session.session_id,
+            session.initiator_user_id,
+        )
+    ]
+    if delay_seconds > 60:
+        task_ids.append(
+            scheduler.schedule_task(
+                _REMINDER_TASK, delay_seconds - 60, session.session_id
+            )
+        )
+    _track_session_timers(session.session_id, task_ids)
+
+
+def _recover_sessions() -> None:
+    """Reload persisted sessions and their timers after a restart.
+
+    Sessions are recovered first so replayed expiries find them.  Timers come
+    from the scheduler journal when one is configured; recovered sessions
+    without journaled timers get fresh ones.
+    """
+    try:
+        recovered = session_store.recover()
+    except Exception:  # pragma: no cover – start with an empty store instead
+        logger.exception("Failed to recover persisted sessions")
+        recovered = []
+    try:
+        replayed = scheduler.replay()
+    except Exception:  # pragma: no cover – fall back to fresh timers
+        logger.exception("Failed to replay the scheduler journal")
+        replayed = []
+    for task_id, kind, args in replayed:
+        if kind in (_EXPIRE_TASK, _REMINDER_TASK):
+            _track_session_timers(args[0], [task_id])
+    rescheduled = 0
+    for session in recovered:
+        if session.session_id not in _session_timers:
+            _schedule_session_timers(session)
+            rescheduled += 1
+    if recovered:
+        logger.info(
+            "Recovered %d session(s); re-registered timers for %d",
+            len(recovered),
+            rescheduled,
+        )
+
+
+_recover_sessions()
+
+
+def _sweep_abandoned_sessions() -> None:
+    """Evict sessions idle past ``SESSION_MAX_AGE_HOURS``; reschedules itself.
+
+    This is a safety net for sessions whose expiry timer never fired (e.g. it
+    was dropped from the scheduler queue during a shutdown), which would
+    otherwise stay in memory and count against ``MAX_CONCURRENT_SESSIONS``.
+    """
+    try:
+        evicted = session_store.evict_expired()
+        if evicted:
+            logger.info(
+                "Evicted %d abandoned session(s); stats=%s",
+                len(evicted),
+                session_store.eviction_stats(),
+            )
+    except Exception:  # pragma: no cover – ensure the sweep keeps running
+        logger.exception("Error sweeping abandoned sessions")
+    finally:
+        try:
+            scheduler.schedule(
+                SESSION_SWEEP_INTERVAL_SECONDS, _sweep_abandoned_sessions
+            )
+        except Exception:  # pragma: no cover – scheduler shut down
+            logger.debug("Session sweeper not rescheduled")
+
+
+if SESSION_MAX_AGE_SECONDS:
+    scheduler.schedule(SESSION_SWEEP_INTERVAL_SECONDS, _sweep_abandoned_sessions)
+
+
 def shutdown_executor():
     """Gracefully shut down scheduler and thread pool executor."""
     logger.info("Shutting down scheduler and thread pool executor...")
@@ -192,7 +416,19 @@ def shutdown_executor():
     except Exception:  # pragma: no cover – ensure shutdown continues
         logger.exception("Error shutting down scheduler")
 
-    executor.shutdown(wait=True)
+    shutdown_lanes(lanes, wait=True)
+    try:
+        session_store.close()
+    except Exception:  # pragma: no cover – ensure shutdown continues
+        logger.exception("Error closing session backend")
+    shutdown_analysis_pools()
+    close_openai_client()
+    if report_config.ASYNC_PIPELINE:
+        try:
+            run_coroutine(aclose_openai_client()).result(timeout=5)
+        except Exception:  # pragma: no cover – ensure shutdown continues
+            logger.exception("Error closing async OpenAI client")
+    shutdown_loop()
     logger.info("Scheduler and thread pool executor shut down gracefully.")
 
 
@@ -366,44 +602,16 @@ def process_gather_feedback_request(
                 channel_id=channel_id,
                 reason=reason,
             )
-            failures = 0
-            for target_user_id in member_user_ids:
-                try:
-                    client.chat_postMessage(
-                        channel=target_user_id,
-                        text="You have been invited to provide feedback.",
-                        blocks=invite_blocks,
-                    )
-                except SlackApiError as exc:
-                    failures += 1
-                    logger.warning(
-                        "Failed to send feedback invitation to %s in session %s: %s",
-                        target_user_id,
-                        session_id,
-                        exc.response.get("error", str(exc)),
-                    )
-
-            # Schedule expiry & reminders
-            delay_seconds = time_in_minutes * 60
-            scheduler.schedule(
-                delay_seconds,
-                _expire_feedback_session,
-                session_id,
-                initiator_user_id,
-                client,
-            )
-            if delay_seconds > 60:
-                scheduler.schedule(
-                    delay_seconds - 60,
-                    _send_pending_reminder,
-                    session_id,
-                    client,
-                )
-
             respond(
                 f"Okay, I've initiated a feedback session (ID: {session_id}) with {len(member_user_ids)} participant(s) "
                 f"for {time_in_minutes} minutes. I'll reach out to them shortly."
             )
+            tally = _send_invitations(client, new_session, invite_blocks, respond)
+
+            # Schedule expiry & reminders
+            _schedule_session_timers(new_session)
+
+            respond(_invitation_summary(session_id, tally))
             return
 
         user_group_id = match.group(1)
@@ -506,45 +714,6 @@ def process_gather_feedback_request(
             channel_id=channel_id,
             reason=reason,
         )
-        failures = 0
-        for target_user_id in member_user_ids:
-            try:
-                client.chat_postMessage(
-                    channel=target_user_id,
-                    text="You have been invited to provide feedback.",
-                    blocks=invite_blocks,
-                )
-                logger.info(
-                    "feedback_invitation_sent",
-                    extra={"session_id": session_id, "target_user_id": target_user_id},
-                )
-            except SlackApiError as exc:
-                failures += 1
-                logger.warning(
-                    "Failed to send feedback invitation to %s in session %s: %s",
-                    target_user_id,
-                    session_id,
-                    exc.response.get("error", str(exc)),
-                )
-
-        # Schedule automatic session expiry
-        delay_seconds = time_in_minutes * 60
-        scheduler.schedule(
-            delay_seconds,
-            _expire_feedback_session,
-            session_id,
-            initiator_user_id,
-            client,
-        )
-        # Schedule 1-minute reminder if time allows (>60s)
-        if delay_seconds > 60:
-            scheduler.schedule(
-                delay_seconds - 60,
-                _send_pending_reminder,
-                session_id,
-                client,
-            )
-
         time_desc_for_log = f"{time_in_minutes} minutes"
         logger.info(
             f"Created and stored session '{session_id}' for user group '{user_group_name_for_message}' "
@@ -558,6 +727,12 @@ def process_gather_feedback_request(
             f"{user_group_name_for_message} (with {len(member_user_ids)} member(s)), "
             f"{time_message_segment}. I'll reach out to them shortly."
         )
+        tally = _send_invitations(client, new_session, invite_blocks, respond)
+
+        # Schedule automatic session expiry and the 1-minute reminder
+        _schedule_session_timers(new_session)
+
+        respond(_invitation_summary(session_id, tally))
 
     except Exception as e:
         logger.error(
@@ -569,6 +744,58 @@ def process_gather_feedback_request(
         )
 
 
+# ------------------------------------------------------------------
+# Invitation fan-out
+# ------------------------------------------------------------------
+
+
+def _send_invitations(
+    client: WebClient,
+    session: SessionData,
+    invite_blocks: List[Dict[str, Any]],
+    respond: Respond,
+) -> InvitationTally:
+    """DM the invitation to every participant of *session*.
+
+    Large groups get a progress update through *respond* at each quarter.
+    """
+    total = len(session.target_user_ids)
+    progress_every = math.ceil(total / 4) if total >= INVITE_PROGRESS_MIN_MEMBERS else 0
+
+    def _progress(tally: InvitationTally) -> None:
+        respond(f"Sent {tally.sent} of {tally.total} invitations so far...")
+
+    tally = invitations.send(
+        client,
+        session.target_user_ids,
+        text="You have been invited to provide feedback.",
+        blocks=invite_blocks,
+        on_progress=_progress,
+        progress_every=progress_every,
+    )
+    logger.info(
+        "feedback_invitations_sent",
+        extra={
+            "session_id": session.session_id,
+            "sent": tally.sent,
+            "failed": tally.failed,
+            "throttled": tally.throttled,
+            "elapsed_seconds": tally.elapsed_seconds,
+        },
+    )
+    return tally
+
+
+def _invitation_summary(session_id: str, tally: InvitationTally) -> str:
+    """Final tally message for the initiator."""
+    message = (
+        f"Invitations for session {session_id}: " f"{tally.sent} of {tally.total} sent"
+    )
+    if tally.failed:
+        message += f", {tally.failed} could not be delivered"
+    return message + "."
+
+
 # ------------------------------------------------------------------
 # Thread helper utilities
 # ------------------------------------------------------------------
@@ -581,10 +808,31 @@ def _log_future_exception(fut: Future) -> None:  # noqa: WPS430 – small util
         logger.exception("Background task raised an exception: %s", exc, exc_info=exc)
 
 
-def submit_background(func, /, *args, **kwargs) -> Future:  # noqa: WPS110
-    """Submit *func* to the shared thread pool with automatic error logging."""
+def lane_stats() -> Dict[str, Dict[str, Any]]:
+    """Return :meth:`ExecutorLane.stats` for every lane, by name."""
+    return {name: lane.stats() for name, lane in lanes.items()}
+
+
+def admission_stats() -> Dict[str, Any]:
+    """Return :meth:`AdmissionController.stats` (shed counters)."""
+    return admission.stats()
+
 
-    fut = executor.submit(func, *args, **kwargs)
+def submit_background(
+    func,
+    /,
+    *args,
+    lane: str = "interactive",
+    priority: Priority = Priority.NORMAL,
+    **kwargs,
+) -> Future:  # noqa: WPS110
+    """Submit *func* to executor *lane* with automatic error logging.
+
+    Raises :class:`~src.admission.Overloaded` if admission control sheds the
+    work for *priority*.
+    """
+
+    fut = admission.submit(lane, priority, func, *args, **kwargs)
     fut.add_done_callback(_log_future_exception)
     return fut
 
@@ -600,18 +848,27 @@ def handle_gather_feedback_command(
     """Handles the gather-feedback slash command to initiate feedback collection."""
     ack()
     try:
-        # Submit the long-running task to the thread pool
+        # New sessions are the first work shed under load
         submit_background(
             process_gather_feedback_request,
             command=command,
             client=client,
             logger=logger,
             respond=respond,
+            priority=Priority.LOW,
         )
         logger.info(
             f"Submitted {GATHER_FEEDBACK_COMMAND} request for user '{command['user_id']}' to thread pool."
         )
 
+    except Overloaded as e:
+        logger.warning(
+            f"Shed {GATHER_FEEDBACK_COMMAND} for user '{command['user_id']}': {e}"
+        )
+        respond(
+            "I'm handling a lot of feedback requests right now, so I couldn't "
+            "start your session. Please try again in a minute."
+        )
     except Exception as e:
         logger.error(
             f"Error submitting {GATHER_FEEDBACK_COMMAND} for user '{command['user_id']}' to thread pool: {e}",
@@ -0,0 +1,83 @@
+"""Shared asyncio event loop running on a single background thread.
+
+The asyncio-native report pipeline (``abuild_report_context`` and friends)
+runs here so that dozens of in-flight report generations wait on the network
+as coroutines instead of each occupying a worker of the application's
+``ThreadPoolExecutor``.
+
+Usage from synchronous code::
+
+    from src.async_runtime import run_coroutine
+
+    future = run_coroutine(some_coroutine())  # concurrent.futures.Future
+"""
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+__all__ = [
+    "get_loop",
+    "run_coroutine",
+    "shutdown_loop",
+]
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop, starting its thread on first use."""
+
+    global _loop, _thread
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, daemon=True, name="async-runtime"
+            )
+            thread.start()
+            _loop, _thread = loop, thread
+            logger.info("Async runtime event loop started.")
+        return _loop
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+    """Schedule *coro* on the shared loop and return a thread-safe future."""
+
+    return asyncio.run_coroutine_threadsafe(coro, get_loop())
+
+
+def shutdown_loop(timeout: float = 5.0) -> None:
+    """Cancel outstanding tasks, stop the loop and join its thread."""
+
+    global _loop, _thread
+    with _lock:
+        loop, thread = _loop, _thread
+        _loop, _thread = None, None
+    if loop is None or thread is None:
+        return
+
+    async def _cancel_pending() -> None:
+        current = asyncio.current_task()
+        tasks = [t for t in asyncio.all_tasks() if t is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    try:
+        asyncio.run_coroutine_threadsafe(_cancel_pending(), loop).result(timeout)
+    except Exception:  # pragma: no cover – best-effort shutdown
+        logger.exception("Error cancelling async runtime tasks")
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout)
+    loop.close()
+    logger.info("Async runtime event loop shut down.")
@@ -0,0 +1,176 @@
+"""Named executor lanes with bounded queues.
+
+All background work used to share one ``ThreadPoolExecutor(max_workers=10)``,
+so ten slow report generations could hold every thread while new
+``/gather-feedback`` commands waited in an unbounded queue.  Work is now split
+into *lanes*, each a small thread pool with its own worker count and queue
+limit:
+
+• ``interactive`` – slash-command processing and other user-facing work.
+• ``fanout`` – bulk Slack calls such as invitation DMs.
+• ``reporting`` – report aggregation and posting (completion and expiry).
+• ``timers`` – light scheduler callbacks (reminders, sweeps).
+
+A lane rejects work with :class:`LaneFullError` once ``workers + queue`` tasks
+are outstanding instead of queueing without bound.  :meth:`ExecutorLane.stats`
+exposes a *saturation* ratio – outstanding tasks over capacity – so a lane
+that is about to shed work is visible before it does.
+
+Sizes are read from the environment when the lanes are created:
+
+• ``LANE_<NAME>_WORKERS`` – threads, e.g. ``LANE_REPORTING_WORKERS=2``.
+• ``LANE_<NAME>_QUEUE`` – tasks that may wait for a thread.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+__all__ = [
+    "DEFAULT_LANE_SIZES",
+    "ExecutorLane",
+    "LaneFullError",
+    "create_lanes",
+    "shutdown_lanes",
+]
+
+_logger = logging.getLogger(__name__)
+
+# name -> (workers, queue)
+DEFAULT_LANE_SIZES: Dict[str, Tuple[int, int]] = {
+    "interactive": (4, 100),
+    "fanout": (4, 200),
+    "reporting": (2, 50),
+    "timers": (4, 1000),
+}
+
+
+class LaneFullError(RuntimeError):
+    """Raised by :meth:`ExecutorLane.submit` when the lane's queue is full."""
+
+
+class ExecutorLane(Executor):
+    """Thread pool with a bounded queue and saturation metrics."""
+
+    def __init__(self, name: str, workers: int, queue: int) -> None:
+        """Create lane *name* with *workers* threads and *queue* waiting slots."""
+        if workers < 1 or queue < 0:
+            raise ValueError("workers must be positive and queue non-negative")
+        self.name = name
+        self.workers = workers
+        self.queue_limit = queue
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"lane-{name}"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+
+    @property
+    def capacity(self) -> int:  # noqa: D401 – property
+        """Tasks the lane holds at once (running plus queued)."""
+        return self.workers + self.queue_limit
+
+    @property
+    def saturation(self) -> float:  # noqa: D401 – property
+        """Outstanding tasks over :attr:`capacity` (1.0 means rejecting)."""
+        with self._lock:
+            return (self._queued + self._running) / self.capacity
+
+    def has_room(self, share: float = 1.0) -> bool:
+        """Whether one more task keeps the lane within *share* of its capacity."""
+        with self._lock:
+            return self._queued + self._running < self.capacity * share
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        """Run ``fn(*args, **kwargs)`` on the lane.
+
+        Raises:
+            LaneFullError: If ``capacity`` tasks are already outstanding.
+        """
+        with self._lock:
+            if self._queued + self._running >= self.capacity:
+                self._rejected += 1
+                raise LaneFullError(
+                    f"Executor lane '{self.name}' is full "
+                    f"({self.workers} running, {self.queue_limit} queued)"
+                )
+            self._queued += 1
+        try:
+            return self._pool.submit(self._run, fn, args, kwargs)
+        except BaseException:
+            with self._lock:
+                self._queued -= 1
+            raise
+
+    def _run(self, fn: Callable[..., Any], args: Tuple[Any, ...], kwargs: Any) -> Any:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue gauges, counters and :attr:`saturation`."""
+        with self._lock:
+            outstanding = self._queued + self._running
+            return {
+                "workers": self.workers,
+                "queue_limit": self.queue_limit,
+                "queued": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "saturation": round(outstanding / self.capacity, 3),
+            }
+
+
+def _parse_size(name: str, default: int, minimum: int) -> int:
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        parsed = int(raw)
+    except ValueError:
+        _logger.warning("Ignoring non-integer %s '%s'", name, raw)
+        return default
+    if parsed < minimum:
+        _logger.warning("Ignoring %s=%s (must be at least %d)", name, raw, minimum)
+        return default
+    return parsed
+
+
+def create_lanes(
+    sizes: Optional[Dict[str, Tuple[int, int]]] = None,
+) -> Dict[str, ExecutorLane]:
+    """Create one lane per entry of *sizes* (default :data:`DEFAULT_LANE_SIZES`).
+
+    ``LANE_<NAME>_WORKERS`` / ``LANE_<NAME>_QUEUE`` override the sizes.
+    """
+    lanes: Dict[str, ExecutorLane] = {}
+    for name, (workers, queue) in (sizes or DEFAULT_LANE_SIZES).items():
+        prefix = f"LANE_{name.upper()}"
+        lanes[name] = ExecutorLane(
+            name,
+            workers=_parse_size(f"{prefix}_WORKERS", workers, 1),
+            queue=_parse_size(f"{prefix}_QUEUE", queue, 0),
+        )
+    return lanes
+
+
+def shutdown_lanes(lanes: Dict[str, ExecutorLane], wait: bool = True) -> None:
+    """Shut down every lane in *lanes*."""
+    for lane in lanes.values():
+        lane.shutdown(wait=wait)
@@ -0,0 +1,126 @@
+"""Typed feedback submitted by one participant.
+
+The feedback modal collects three fields – a sentiment label plus *what went
+well* and *what could improve*.  They are stored as a :class:`FeedbackRecord`
+so reporting code reads the fields directly instead of re-parsing a flattened
+``"sentiment=..., well=..., improve=..."`` string (which broke as soon as a
+participant typed a comma or ``well=``).
+
+Plain strings are still accepted for free-text feedback and for sessions
+created before records existed; :func:`to_record` converts them once.
+"""
+from __future__ import annotations
+
+import dataclasses
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Union
+
+__all__ = [
+    "FeedbackEntry",
+    "FeedbackRecord",
+    "SENTIMENT_LABELS",
+    "entry_from_json",
+    "entry_to_json",
+    "to_record",
+]
+
+SENTIMENT_LABELS = frozenset({"positive", "neutral", "negative"})
+
+# Legacy "sentiment=..., well=..., improve=..." strings (every part optional)
+_LEGACY_RE = re.compile(
+    r"^(?:sentiment=(?P<sentiment>[^,]*),\s*)?"
+    r"(?:well=(?P<well>.*?))?"
+    r"(?:,?\s*improve=(?P<improve>.*))?$",
+    re.DOTALL,
+)
+
+
+def _clean(value: Optional[str]) -> Optional[str]:
+    """Normalise empty answers (and the literal ``"None"``) to *None*."""
+
+    if value is None:
+        return None
+    value = value.strip()
+    return value if value and value != "None" else None
+
+
+@dataclass(frozen=True, slots=True)
+class FeedbackRecord:
+    """One participant's submission."""
+
+    user_id: Optional[str]
+    sentiment: Optional[str] = None
+    well: Optional[str] = None
+    improve: Optional[str] = None
+    submitted_at: float = field(default_factory=time.time)
+    # Free-text feedback that is not split into well/improve answers
+    comment: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "well", _clean(self.well))
+        object.__setattr__(self, "improve", _clean(self.improve))
+        sentiment = _clean(self.sentiment)
+        object.__setattr__(
+            self, "sentiment", sentiment if sentiment in SENTIMENT_LABELS else None
+        )
+
+    @property
+    def free_text(self) -> str:
+        """Participant-written text, without the chosen sentiment label."""
+
+        if self.comment is not None:
+            return self.comment
+        parts = [
+            f"{name}={value}"
+            for name, value in (("well", self.well), ("improve", self.improve))
+            if value
+        ]
+        return ", ".join(parts)
+
+    def as_text(self) -> str:
+        """Flattened form used for raw-data display in reports."""
+
+        if self.comment is not None:
+            return self.comment
+        return ", ".join(
+            part for part in (f"sentiment={self.sentiment}", self.free_text) if part
+        )
+
+
+FeedbackEntry = Union[FeedbackRecord, str]
+
+
+def to_record(entry: FeedbackEntry) -> FeedbackRecord:
+    """Return *entry* as a :class:`FeedbackRecord`, parsing legacy strings."""
+
+    if isinstance(entry, FeedbackRecord):
+        return entry
+    match = _LEGACY_RE.match(entry)
+    if match is None or (match["well"] is None and match["improve"] is None):
+        return FeedbackRecord(user_id=None, comment=entry)
+    return FeedbackRecord(
+        user_id=None,
+        sentiment=match["sentiment"],
+        well=match["well"],
+        improve=match["improve"],
+    )
+
+
+def entry_to_json(entry: FeedbackEntry) -> str:
+    """Serialise *entry* for storage (see :func:`entry_from_json`)."""
+
+    if isinstance(entry, FeedbackRecord):
+        return json.dumps({"record": dataclasses.asdict(entry)})
+    return json.dumps({"text": entry})
+
+
+def entry_from_json(payload: str) -> FeedbackEntry:
+    """Inverse of :func:`entry_to_json`."""
+
+    data = json.loads(payload)
+    if "record" in data:
+        return FeedbackRecord(**data["record"])
+    return str(data["text"])
@@ -0,0 +1,87 @@
+"""Minimal in-process metrics: latency histograms.
+
+There is no metrics backend; components expose :class:`Histogram` snapshots
+through their ``stats()`` dicts, which are logged or inspected in tests.
+"""
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from typing import Any, Dict, Sequence
+
+__all__ = ["DEFAULT_LATENCY_BUCKETS", "Histogram"]
+
+# Upper bounds in seconds; a final +Inf bucket is implied.
+DEFAULT_LATENCY_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+class Histogram:
+    """Thread-safe fixed-bucket histogram (Prometheus-style upper bounds)."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self._bounds = tuple(sorted(buckets))
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation (negative values count as zero)."""
+
+        value = max(0.0, value)
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    @property
+    def count(self) -> int:  # noqa: D401 – property
+        """Number of observations."""
+        return self._count
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the *q* quantile (0 when empty)."""
+
+        with self._lock:
+            counts, total, peak = list(self._counts), self._count, self._max
+        if not total:
+            return 0.0
+        rank = math.ceil(q * total)
+        seen = 0
+        for bound, count in zip(self._bounds + (math.inf,), counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, peak)
+        return peak  # pragma: no cover – rank never exceeds total
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return count, sum, max, p50/p99 estimates and per-bucket counts."""
+
+        with self._lock:
+            counts, total = list(self._counts), self._count
+            stats: Dict[str, Any] = {
+                "count": total,
+                "sum": round(self._sum, 6),
+                "max": round(self._max, 6),
+            }
+        stats["p50"] = self.quantile(0.5)
+        stats["p99"] = self.quantile(0.99)
+        labels = [str(b) for b in self._bounds] + ["+Inf"]
+        stats["buckets"] = dict(zip(labels, counts))
+        return stats
@@ -0,0 +1,193 @@
+"""Content-addressed response cache for OpenAI chat completions.
+
+Responses are keyed by a SHA-256 hash of the model, messages and request
+parameters, so an identical deterministic request (``temperature=0``) never has
+to hit the network twice.  Two tiers are supported:
+
+• an in-memory LRU with a per-entry TTL (always on), and
+• an optional on-disk SQLite table that survives restarts, so re-running a
+  report after a crash is free.
+
+Entries are stored as JSON text; every hit returns a fresh copy so callers may
+mutate the result without corrupting the cache.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+__all__ = [
+    "ResponseCache",
+    "make_cache_key",
+]
+
+_logger = logging.getLogger(__name__)
+
+
+def make_cache_key(
+    model: str, messages: List[Dict[str, str]], params: Mapping[str, Any]
+) -> str:
+    """Return a stable hex digest identifying a chat completion request."""
+
+    canonical = json.dumps(
+        {"model": model, "messages": messages, "params": dict(params)},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Thread-safe LRU + TTL cache with an optional SQLite backing store."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        db_path: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Create a new cache.
+
+        Args:
+            max_entries: Maximum number of entries held in memory.
+            ttl_seconds: Lifetime of an entry in both tiers.
+            db_path: Optional SQLite file used as a persistent second tier.
+            clock: Wall-clock source (injectable for tests).
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (expires_at, json payload)
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, payload TEXT NOT NULL)"
+            )
+            self._db.commit()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached response for *key* or *None*."""
+
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                entry = self._db_get(key, now)
+                if entry is not None:
+                    self._remember(key, entry)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            payload = entry[1]
+        value: Dict[str, Any] = json.loads(payload)
+        return value
+
+    def set(self, key: str, value: Mapping[str, Any]) -> None:
+        """Store *value* under *key*; values that are not JSON-able are skipped."""
+
+        try:
+            payload = json.dumps(value)
+        except (TypeError, ValueError) as exc:
+            _logger.debug("Skipping cache store for %s: %s", key[:12], exc)
+            return
+        entry = (self._clock() + self._ttl, payload)
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, expires_at, payload) "
+                    "VALUES (?, ?, ?)",
+                    (key, entry[0], entry[1]),
+                )
+                self._db.commit()
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers and reset counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the SQLite connection, if any."""
+
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    @property
+    def hits(self) -> int:  # noqa: D401 – property
+        """Number of lookups served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:  # noqa: D401 – property
+        """Number of lookups that had to go to the network."""
+        return self._misses
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current in-memory size."""
+
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Internal helpers (caller holds the lock)
+    # ------------------------------------------------------------------
+    def _remember(self, key: str, entry: Tuple[float, str]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _db_get(self, key: str, now: float) -> Optional[Tuple[float, str]]:
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT expires_at, payload FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        if row[0] <= now:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+            return None
+        return float(row[0]), str(row[1])
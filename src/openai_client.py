@@ -5,12 +5,72 @@ Centralises API-key handling so the rest of the codebase can simply do:
     from src.openai_client import chat_completion
 
 and know that the ``openai`` package is configured with credentials.
+
+With the ≥1.0 SDK a single long-lived ``openai.OpenAI`` client is built on
+first use and shared by every thread.  Its HTTP connection pool keeps
+connections alive between calls so bursts of analysis requests do not pay a TLS
+handshake each.  Pool and timeout settings come from the environment:
+
+• ``OPENAI_TIMEOUT_SECONDS`` – per-request read/write timeout (default 30).
+• ``OPENAI_CONNECT_TIMEOUT_SECONDS`` – connect timeout (default 5).
+• ``OPENAI_MAX_CONNECTIONS`` – connection pool size (default 20).
+• ``OPENAI_MAX_KEEPALIVE_CONNECTIONS`` – idle connections kept open (default 10).
+• ``OPENAI_KEEPALIVE_EXPIRY_SECONDS`` – idle connection lifetime (default 60).
+
+All requests share a process-wide :class:`~src.openai_ratelimit.RateLimiter`
+so that sessions expiring together queue for the account's budget instead of
+racing into HTTP 429s:
+
+• ``OPENAI_RPM_LIMIT`` – requests per minute, ``0`` disables (default 500).
+• ``OPENAI_TPM_LIMIT`` – tokens per minute, ``0`` disables (default 30000).
+• ``OPENAI_MAX_CONCURRENCY`` – upper bound of the AIMD window (default 8).
+
+Failures are retried by a shared :class:`~src.openai_resilience.Resilience`
+layer (the SDK's own retries are disabled so every error is seen here) with
+per-error-class back-off and a circuit breaker that makes calls fail fast with
+:class:`CircuitOpenError` while OpenAI is down:
+
+• ``OPENAI_RATE_LIMIT_RETRIES`` – retries for a throttled request (default 5).
+• ``OPENAI_RETRY_MAX_ATTEMPTS`` – attempts for timeouts/5xx (default 3).
+• ``OPENAI_RETRY_BASE_DELAY`` / ``OPENAI_RETRY_MAX_DELAY`` – back-off bounds.
+• ``OPENAI_CIRCUIT_FAILURE_THRESHOLD`` – failures that open the breaker (5).
+• ``OPENAI_CIRCUIT_RESET_SECONDS`` – time before a probe is allowed (30).
+
+``achat_completion`` is the asyncio twin of ``chat_completion``.  It shares the
+cache, rate limiter and resilience layer, and uses a pooled ``AsyncOpenAI``
+client bound to the running event loop.
+
+Deterministic requests (``temperature=0``) are served from a content-addressed
+response cache (see :mod:`src.openai_cache`) when possible.  The cache is
+configured through environment variables:
+
+• ``OPENAI_CACHE_ENABLED`` – set to ``false`` to disable caching entirely.
+• ``OPENAI_CACHE_TTL_SECONDS`` – entry lifetime (default 3600).
+• ``OPENAI_CACHE_MAX_ENTRIES`` – in-memory LRU size (default 1024).
+• ``OPENAI_CACHE_PATH`` – optional SQLite file for a persistent second tier.
 """
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
+import threading
 import types
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+from src.openai_cache import ResponseCache, make_cache_key
+from src.openai_ratelimit import (
+    AdaptiveConcurrency,
+    RateLimiter,
+    is_rate_limit_error,
+    retry_after_seconds,
+)
+from src.openai_resilience import (  # noqa: F401 – CircuitOpenError re-exported
+    CircuitBreaker,
+    CircuitOpenError,
+    Resilience,
+    default_policies,
+)
 
 
 class OpenAIClientError(RuntimeError):
@@ -19,6 +79,29 @@ class OpenAIClientError(RuntimeError):
 
 _DEFAULT_MODEL = "gpt-4.1"
 
+_logger = logging.getLogger(__name__)
+
+_response_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+# Long-lived ≥1.0 client shared by all threads (see ``get_openai_client``)
+_client: Any = None
+_client_lock = threading.Lock()
+
+# Async client; its connection pool belongs to the loop it was created on
+_async_client: Any = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+_resilience: Optional[Resilience] = None
+_resilience_lock = threading.Lock()
+
+# Rough prompt size estimate: ~4 characters per token for English text.
+_CHARS_PER_TOKEN = 4
+_DEFAULT_COMPLETION_TOKENS = 256
+
 
 def _load_openai() -> types.ModuleType:
     """Import ``openai`` lazily.
@@ -47,15 +130,93 @@ def _ensure_api_key_present() -> str:
     return api_key
 
 
-def get_openai_client() -> types.ModuleType:  # pragma: no cover – trivial
-    """Configure and return the ``openai`` module.
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        _logger.warning("Invalid %s value '%s'; using %s", name, raw, default)
+        return default
+
+
+def _request_timeout() -> Any:
+    """Return the per-request timeout used for OpenAI calls."""
 
-    This sets ``openai.api_key`` and, if provided, ``openai.organization``.
-    Subsequent calls reuse the configured module.
+    openai = _load_openai()
+    read = _env_float("OPENAI_TIMEOUT_SECONDS", 30.0)
+    connect = _env_float("OPENAI_CONNECT_TIMEOUT_SECONDS", 5.0)
+    timeout_cls = getattr(openai, "Timeout", None)
+    if timeout_cls is None:  # pragma: no cover – legacy SDK takes plain seconds
+        return read
+    return timeout_cls(read, connect=connect)
+
+
+def _build_pooled_client(
+    openai: types.ModuleType, *, asynchronous: bool = False
+) -> Any:
+    """Create an ``openai.OpenAI`` client with a tuned, keep-alive HTTP pool.
+
+    With *asynchronous* the ``AsyncOpenAI`` equivalent is built instead.
+    """
+
+    timeout = _request_timeout()
+    kwargs: Dict[str, Any] = {
+        "api_key": _ensure_api_key_present(),
+        "timeout": timeout,
+        # Retries are handled by the shared resilience layer instead.
+        "max_retries": 0,
+    }
+    org = os.getenv("OPENAI_ORG")
+    if org:
+        kwargs["organization"] = org
+
+    # Build the pool limits with the same httpx flavour the SDK was built
+    # against; ``DEFAULT_CONNECTION_LIMITS`` is an instance of that class.
+    default_limits = getattr(openai, "DEFAULT_CONNECTION_LIMITS", None)
+    http_client_cls = getattr(
+        openai,
+        "DefaultAsyncHttpxClient" if asynchronous else "DefaultHttpxClient",
+        None,
+    )
+    if default_limits is not None and http_client_cls is not None:
+        limits = type(default_limits)(
+            max_connections=int(_env_float("OPENAI_MAX_CONNECTIONS", 20)),
+            max_keepalive_connections=int(
+                _env_float("OPENAI_MAX_KEEPALIVE_CONNECTIONS", 10)
+            ),
+            keepalive_expiry=_env_float("OPENAI_KEEPALIVE_EXPIRY_SECONDS", 60.0),
+        )
+        kwargs["http_client"] = http_client_cls(limits=limits, timeout=timeout)
+
+    client_cls = openai.AsyncOpenAI if asynchronous else openai.OpenAI
+    return client_cls(**kwargs)
+
+
+def get_openai_client() -> Any:
+    """Return a configured OpenAI client.
+
+    With the ≥1.0 SDK this is a single pooled ``openai.OpenAI`` instance that
+    is created lazily and reused by every caller (it is safe to share across
+    threads).  With the legacy SDK the ``openai`` module itself is configured
+    (``openai.api_key`` and, if provided, ``openai.organization``) and
+    returned.
     """
 
+    global _client
     openai = _load_openai()
 
+    if callable(getattr(openai, "OpenAI", None)):
+        client = _client
+        if client is not None:
+            return client
+        with _client_lock:
+            if _client is None:
+                _client = _build_pooled_client(openai)
+                _logger.info("Created pooled OpenAI client")
+            return _client
+
     if getattr(openai, "api_key", None):  # already configured
         return openai
 
@@ -68,10 +229,154 @@ def get_openai_client() -> types.ModuleType:  # pragma: no cover – trivial
     return openai
 
 
+def get_async_openai_client() -> Any:
+    """Return the pooled ``AsyncOpenAI`` client for the running event loop.
+
+    Returns *None* with the legacy SDK, which has no asyncio interface.  Must
+    be called from inside a coroutine.
+    """
+
+    global _async_client, _async_client_loop
+    openai = _load_openai()
+    if not callable(getattr(openai, "AsyncOpenAI", None)):
+        return None
+
+    loop = asyncio.get_running_loop()
+    with _client_lock:
+        if _async_client is None or _async_client_loop is not loop:
+            _async_client = _build_pooled_client(openai, asynchronous=True)
+            _async_client_loop = loop
+            _logger.info("Created pooled AsyncOpenAI client")
+        return _async_client
+
+
+async def aclose_openai_client() -> None:
+    """Close the async client's connections (run on the loop that owns it)."""
+
+    global _async_client, _async_client_loop
+    with _client_lock:
+        client, _async_client, _async_client_loop = _async_client, None, None
+    close = getattr(client, "close", None)
+    if callable(close):
+        await close()
+
+
+def close_openai_client() -> None:
+    """Close the pooled client's connections; the next call builds a new one."""
+
+    global _client
+    with _client_lock:
+        client, _client = _client, None
+    close = getattr(client, "close", None)
+    if callable(close):
+        close()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide OpenAI rate limiter, creating it on first use."""
+
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            max_concurrency = max(1, int(_env_float("OPENAI_MAX_CONCURRENCY", 8)))
+            _rate_limiter = RateLimiter(
+                requests_per_minute=_env_float("OPENAI_RPM_LIMIT", 500) or None,
+                tokens_per_minute=_env_float("OPENAI_TPM_LIMIT", 30000) or None,
+                concurrency=AdaptiveConcurrency(
+                    max_concurrency, maximum=max_concurrency
+                ),
+            )
+        return _rate_limiter
+
+
+def get_resilience() -> Resilience:
+    """Return the process-wide retry/circuit-breaker layer."""
+
+    global _resilience
+    with _resilience_lock:
+        if _resilience is None:
+            _resilience = Resilience(
+                policies=default_policies(
+                    max_attempts=max(
+                        1, int(_env_float("OPENAI_RETRY_MAX_ATTEMPTS", 3))
+                    ),
+                    base_delay=_env_float("OPENAI_RETRY_BASE_DELAY", 0.5),
+                    max_delay=_env_float("OPENAI_RETRY_MAX_DELAY", 8.0),
+                    rate_limit_attempts=1
+                    + max(0, int(_env_float("OPENAI_RATE_LIMIT_RETRIES", 5))),
+                ),
+                breaker=CircuitBreaker(
+                    failure_threshold=max(
+                        1, int(_env_float("OPENAI_CIRCUIT_FAILURE_THRESHOLD", 5))
+                    ),
+                    reset_timeout=_env_float("OPENAI_CIRCUIT_RESET_SECONDS", 30.0),
+                ),
+            )
+        return _resilience
+
+
+def ai_available() -> bool:
+    """Return *False* while the circuit breaker is open (OpenAI considered down).
+
+    Callers use this to skip straight to their non-AI fallback.
+    """
+
+    return get_resilience().breaker.state != CircuitBreaker.OPEN
+
+
+def _estimate_tokens(messages: List[Dict[str, str]], params: Dict[str, Any]) -> int:
+    """Return a cheap upper-bound guess of prompt + completion tokens."""
+
+    prompt_chars = sum(len(str(m.get("content") or "")) for m in messages)
+    completion = params.get("max_tokens") or params.get("max_completion_tokens")
+    return prompt_chars // _CHARS_PER_TOKEN + int(
+        completion or _DEFAULT_COMPLETION_TOKENS
+    )
+
+
+def _cache_enabled() -> bool:
+    return os.getenv("OPENAI_CACHE_ENABLED", "true").lower() != "false"
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the process-wide response cache, or *None* when disabled."""
+
+    global _response_cache
+    if not _cache_enabled():
+        return None
+    with _cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache(
+                max_entries=int(os.getenv("OPENAI_CACHE_MAX_ENTRIES", "1024")),
+                ttl_seconds=float(os.getenv("OPENAI_CACHE_TTL_SECONDS", "3600")),
+                db_path=os.getenv("OPENAI_CACHE_PATH") or None,
+            )
+        return _response_cache
+
+
+def cache_stats() -> Dict[str, int]:
+    """Return response cache hit/miss counters (all zero when disabled)."""
+
+    cache = get_response_cache()
+    if cache is None:
+        return {"hits": 0, "misses": 0, "size": 0}
+    return cache.stats()
+
+
+def _is_deterministic(params: Dict[str, Any]) -> bool:
+    """Return *True* if repeating the request must yield the same answer."""
+
+    # The API defaults to temperature 1, so only an explicit 0 qualifies.
+    if params.get("temperature") != 0:
+        return False
+    return not params.get("stream") and params.get("n", 1) == 1
+
+
 def chat_completion(
     messages: List[Dict[str, str]],
     *,
     model: str = _DEFAULT_MODEL,
+    cache: Optional[bool] = None,
     **kwargs: Any,
 ) -> Dict[str, Any]:
     """Wrapper around ``openai.ChatCompletion.create`` with sane defaults.
@@ -82,11 +387,137 @@ def chat_completion(
         Chat messages in OpenAI format.
     model
         Model id to use (default: ``gpt-4.1``).
+    cache
+        Serve/store the response via the response cache.  *None* (default)
+        caches only deterministic requests (``temperature=0``).
     kwargs
         Additional parameters forwarded to ``ChatCompletion.create``.
+
+    Raises
+    ------
+    CircuitOpenError
+        If OpenAI is considered down and the call was skipped.
     """
 
-    openai = get_openai_client()
+    use_cache = _is_deterministic(kwargs) if cache is None else cache
+    response_cache = get_response_cache() if use_cache else None
+    if response_cache is None:
+        return _resilient_completion(messages, model=model, **kwargs)
+
+    key = make_cache_key(model, messages, kwargs)
+    cached = response_cache.get(key)
+    if cached is not None:
+        _logger.debug("chat_completion cache hit %s", key[:12])
+        return cached
+
+    result = _resilient_completion(messages, model=model, **kwargs)
+    response_cache.set(key, result)
+    return result
+
+
+async def achat_completion(
+    messages: List[Dict[str, str]],
+    *,
+    model: str = _DEFAULT_MODEL,
+    cache: Optional[bool] = None,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Asyncio twin of :func:`chat_completion` with identical semantics."""
+
+    use_cache = _is_deterministic(kwargs) if cache is None else cache
+    response_cache = get_response_cache() if use_cache else None
+    if response_cache is None:
+        return await _aresilient_completion(messages, model=model, **kwargs)
+
+    key = make_cache_key(model, messages, kwargs)
+    cached = response_cache.get(key)
+    if cached is not None:
+        _logger.debug("achat_completion cache hit %s", key[:12])
+        return cached
+
+    result = await _aresilient_completion(messages, model=model, **kwargs)
+    response_cache.set(key, result)
+    return result
+
+
+def _resilient_completion(
+    messages: List[Dict[str, str]], *, model: str, **kwargs: Any
+) -> Dict[str, Any]:
+    """Send the request through the shared limiter and resilience layer."""
+
+    limiter = get_rate_limiter()
+    estimated = _estimate_tokens(messages, kwargs)
+
+    def _attempt() -> Dict[str, Any]:
+        with limiter.slot(estimated):
+            try:
+                result = _create_completion(messages, model=model, **kwargs)
+            except Exception as exc:
+                if is_rate_limit_error(exc):
+                    limiter.record_throttle(retry_after_seconds(exc))
+                raise
+        limiter.record_success()
+        return result
+
+    return get_resilience().call(_attempt)
+
+
+async def _aresilient_completion(
+    messages: List[Dict[str, str]], *, model: str, **kwargs: Any
+) -> Dict[str, Any]:
+    """Async twin of :func:`_resilient_completion`."""
+
+    limiter = get_rate_limiter()
+    estimated = _estimate_tokens(messages, kwargs)
+
+    async def _attempt() -> Dict[str, Any]:
+        async with limiter.aslot(estimated):
+            try:
+                result = await _acreate_completion(messages, model=model, **kwargs)
+            except Exception as exc:
+                if is_rate_limit_error(exc):
+                    limiter.record_throttle(retry_after_seconds(exc))
+                raise
+        limiter.record_success()
+        return result
+
+    return await get_resilience().acall(_attempt)
+
+
+async def _acreate_completion(
+    messages: List[Dict[str, str]], *, model: str, **kwargs: Any
+) -> Dict[str, Any]:
+    """Send the request with the async client and return a legacy-style ``dict``."""
+
+    client = get_async_openai_client()
+    if client is None:
+        # Legacy SDK has no asyncio support – keep the loop free meanwhile.
+        return await asyncio.to_thread(
+            _create_completion, messages, model=model, **kwargs
+        )
+    completion = await client.chat.completions.create(
+        model=model, messages=messages, **kwargs
+    )
+    return _to_legacy_dict(completion)
+
+
+def _to_legacy_dict(completion: Any) -> Dict[str, Any]:
+    """Convert a ≥1.0 Pydantic completion to a minimal legacy-compatible dict."""
+
+    # Each choice has ``message.content``.
+    choices = [
+        {"message": {"content": choice.message.content}}
+        for choice in completion.choices
+    ]
+    return {"choices": choices, "model": completion.model}
+
+
+def _create_completion(
+    messages: List[Dict[str, str]], *, model: str, **kwargs: Any
+) -> Dict[str, Any]:
+    """Send the request to OpenAI and return a legacy-style ``dict``."""
+
+    client = get_openai_client()
 
     # The OpenAI Python client changed its interface in version 1.0.0.
     # • <1.0 – ``openai.ChatCompletion.create`` returns a ``dict``-like object.
@@ -97,18 +528,11 @@ def chat_completion(
     # downstream code (including tests) can stay the same.
 
     # Prefer the *new* API if available, otherwise fall back.
-    chat_api_new = getattr(getattr(openai, "chat", None), "completions", None)
+    chat_api_new = getattr(getattr(client, "chat", None), "completions", None)
     if callable(getattr(chat_api_new, "create", None)):
         # New >=1.0 style
         completion = chat_api_new.create(model=model, messages=messages, **kwargs)
-
-        # Convert the Pydantic model to a minimal legacy-compatible dict.
-        # Each choice has ``message.content``.
-        choices = [
-            {"message": {"content": choice.message.content}}
-            for choice in completion.choices
-        ]
-        return {"choices": choices, "model": completion.model}
+        return _to_legacy_dict(completion)
 
     # Legacy <1.0 style
-    return openai.ChatCompletion.create(model=model, messages=messages, **kwargs)
+    return client.ChatCompletion.create(model=model, messages=messages, **kwargs)
@@ -0,0 +1,335 @@
+"""Process-wide rate limiting for OpenAI traffic.
+
+Several sessions can expire at the same time and each fires a burst of
+analysis calls.  Instead of letting them race into HTTP 429 responses, every
+request passes through a :class:`RateLimiter` that
+
+• spaces requests to stay inside a *requests-per-minute* budget,
+• spaces prompt/completion volume to stay inside a *tokens-per-minute* budget,
+• caps in-flight requests with an AIMD window (additive increase on success,
+  multiplicative decrease when throttled), and
+• pauses all traffic for the duration of any ``Retry-After`` hint.
+
+Callers queue (sleep) rather than fail, so throughput settles at the highest
+rate the account allows.
+"""
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import logging
+import re
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Mapping, Optional
+
+__all__ = [
+    "AdaptiveConcurrency",
+    "RateLimiter",
+    "TokenBucket",
+    "is_rate_limit_error",
+    "retry_after_seconds",
+]
+
+_logger = logging.getLogger(__name__)
+
+# How often a coroutine re-checks for a free concurrency slot.
+_ASYNC_POLL_SECONDS = 0.05
+
+
+class TokenBucket:
+    """Reservation-based token bucket refilled continuously at *per_minute*.
+
+    :meth:`reserve` always succeeds immediately and returns how long the caller
+    must wait before using the reserved tokens.  The balance may go negative,
+    which is what queues later callers behind earlier ones.
+    """
+
+    def __init__(
+        self,
+        per_minute: float,
+        *,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if per_minute <= 0:
+            raise ValueError("per_minute must be positive")
+        self._rate = per_minute / 60.0
+        self._capacity = burst if burst is not None else per_minute
+        self._tokens = self._capacity
+        self._clock = clock
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Reserve *amount* tokens and return the seconds to wait before use."""
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= amount
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every reservation for at least *seconds* from now."""
+
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+class AdaptiveConcurrency:
+    """AIMD-controlled cap on the number of in-flight requests."""
+
+    def __init__(
+        self,
+        initial: int,
+        *,
+        minimum: int = 1,
+        maximum: Optional[int] = None,
+        decrease_factor: float = 0.5,
+        cooldown_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if initial < 1 or minimum < 1:
+            raise ValueError("concurrency limits must be positive")
+        self._minimum = minimum
+        self._maximum = maximum if maximum is not None else initial
+        self._limit = float(max(minimum, min(initial, self._maximum)))
+        self._decrease_factor = decrease_factor
+        self._cooldown = cooldown_seconds
+        self._clock = clock
+        self._last_decrease = float("-inf")
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:  # noqa: D401 – property
+        """Current whole-number concurrency window."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:  # noqa: D401 – property
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    def try_acquire(self) -> bool:
+        """Take a slot if one is free without blocking."""
+
+        with self._cond:
+            if self._in_flight < int(self._limit):
+                self._in_flight += 1
+                return True
+            return False
+
+    def acquire(self) -> None:
+        """Block until a slot is free, then take it."""
+
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self) -> None:
+        """Return a slot taken by :meth:`acquire` / :meth:`try_acquire`."""
+
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._cond.notify_all()
+
+    def on_success(self) -> None:
+        """Additive increase: grow the window by one per window of successes."""
+
+        with self._cond:
+            if self._limit < self._maximum:
+                self._limit = min(self._maximum, self._limit + 1.0 / self._limit)
+                self._cond.notify_all()
+
+    def on_throttle(self) -> None:
+        """Multiplicative decrease, at most once per cooldown period.
+
+        A single throttling event usually produces a 429 for every request in
+        flight; the cooldown stops those echoes from collapsing the window.
+        """
+
+        with self._cond:
+            now = self._clock()
+            if now - self._last_decrease < self._cooldown:
+                return
+            self._last_decrease = now
+            self._limit = max(float(self._minimum), self._limit * self._decrease_factor)
+            _logger.info("OpenAI throttled; concurrency window now %d", self.limit)
+
+
+class RateLimiter:
+    """Combine RPM/TPM buckets with an adaptive concurrency window."""
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Create a limiter; any budget left as *None* is not enforced."""
+        self._requests = (
+            TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.concurrency = concurrency
+        self._sleep = sleep
+        self._throttled = 0
+        self._waited_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, estimated_tokens: int) -> float:
+        """Reserve budget for one request and return the seconds to wait."""
+
+        wait = 0.0
+        if self._requests is not None:
+            wait = max(wait, self._requests.reserve(1))
+        if self._tokens is not None:
+            wait = max(wait, self._tokens.reserve(estimated_tokens))
+        if wait > 0:
+            with self._lock:
+                self._waited_seconds += wait
+        return wait
+
+    @contextmanager
+    def slot(self, estimated_tokens: int) -> Iterator[None]:
+        """Block until the request may be sent, holding a concurrency slot."""
+
+        if self.concurrency is not None:
+            self.concurrency.acquire()
+        try:
+            wait = self.reserve(estimated_tokens)
+            if wait > 0:
+                self._sleep(wait)
+            yield
+        finally:
+            if self.concurrency is not None:
+                self.concurrency.release()
+
+    @asynccontextmanager
+    async def aslot(self, estimated_tokens: int) -> AsyncIterator[None]:
+        """Async twin of :meth:`slot` that waits without blocking the loop.
+
+        The concurrency window is shared with threaded callers, so a free slot
+        is polled for rather than awaited on the thread condition.
+        """
+
+        if self.concurrency is not None:
+            while not self.concurrency.try_acquire():
+                await asyncio.sleep(_ASYNC_POLL_SECONDS)
+        try:
+            wait = self.reserve(estimated_tokens)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            yield
+        finally:
+            if self.concurrency is not None:
+                self.concurrency.release()
+
+    def record_success(self) -> None:
+        """Let the concurrency window grow after a completed request."""
+
+        if self.concurrency is not None:
+            self.concurrency.on_success()
+
+    def record_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Shrink concurrency and honour the server's *retry_after* hint."""
+
+        with self._lock:
+            self._throttled += 1
+        if self.concurrency is not None:
+            self.concurrency.on_throttle()
+        if retry_after and retry_after > 0:
+            for bucket in (self._requests, self._tokens):
+                if bucket is not None:
+                    bucket.pause(retry_after)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters useful for diagnostics."""
+
+        with self._lock:
+            stats: Dict[str, Any] = {
+                "throttled": self._throttled,
+                "waited_seconds": round(self._waited_seconds, 3),
+            }
+        if self.concurrency is not None:
+            stats["concurrency_limit"] = self.concurrency.limit
+            stats["in_flight"] = self.concurrency.in_flight
+        return stats
+
+
+# ---------------------------------------------------------------------------
+# Error inspection helpers
+# ---------------------------------------------------------------------------
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Return *True* if *exc* is an HTTP 429 from either SDK generation."""
+
+    for attr in ("status_code", "http_status"):
+        if getattr(exc, attr, None) == 429:
+            return True
+    return type(exc).__name__ == "RateLimitError"
+
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_duration(raw: str) -> Optional[float]:
+    """Parse OpenAI reset hints such as ``"1s"``, ``"6m0s"`` or ``"20ms"``."""
+
+    parts = _DURATION_RE.findall(raw)
+    if not parts:
+        return None
+    return sum(float(value) * _DURATION_UNITS[unit] for value, unit in parts)
+
+
+def _headers_of(exc: BaseException) -> Mapping[str, str]:
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or getattr(exc, "headers", None)
+    if not headers:
+        return {}
+    return {str(k).lower(): str(v) for k, v in dict(headers).items()}
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Return the server's back-off hint carried by *exc*, if any."""
+
+    headers = _headers_of(exc)
+
+    raw_ms = headers.get("retry-after-ms")
+    if raw_ms:
+        try:
+            return float(raw_ms) / 1000.0
+        except ValueError:
+            pass
+
+    raw = headers.get("retry-after")
+    if raw:
+        try:
+            return float(raw)
+        except ValueError:
+            try:
+                parsed = email.utils.parsedate_to_datetime(raw)
+            except (TypeError, ValueError):
+                parsed = None
+            if parsed is not None:
+                return max(0.0, parsed.timestamp() - time.time())
+
+    resets = []
+    for name in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens"):
+        reset = _parse_duration(headers.get(name, ""))
+        if reset is not None:
+            resets.append(reset)
+    return max(resets) if resets else None
@@ -0,0 +1,294 @@
+"""Retry, back-off and circuit breaking for OpenAI calls.
+
+Every ``chat_completion`` request runs through one process-wide
+:class:`Resilience` instance so that all analysis helpers share the same
+behaviour:
+
+• errors are classified (rate limit, timeout, connection, server, client) and
+  each class has its own :class:`RetryPolicy`;
+• retries use exponential back-off with full jitter, or the server's
+  ``Retry-After`` hint when one is present;
+• a :class:`CircuitBreaker` opens after repeated outage-type failures.  While it
+  is open calls fail fast with :class:`CircuitOpenError`, letting the report
+  pipeline fall back to raw data without AI analysis instead of paying a full
+  timeout per item.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Mapping, Optional, TypeVar
+
+from src.openai_ratelimit import is_rate_limit_error, retry_after_seconds
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "Resilience",
+    "RetryPolicy",
+    "classify_error",
+    "default_policies",
+]
+
+_logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Error classes that indicate OpenAI (or the path to it) is unhealthy.  Client
+# errors and throttling are the caller's problem and never trip the breaker.
+_OUTAGE_ERRORS = frozenset({"timeout", "connection", "server"})
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling OpenAI while the circuit breaker is open."""
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """How often and how patiently to retry one class of error."""
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    multiplier: float = 2.0
+    honour_retry_after: bool = True
+
+    def delay(
+        self,
+        attempt: int,
+        retry_after: Optional[float] = None,
+        rng: Callable[[], float] = random.random,
+    ) -> float:
+        """Return the pause before retry number *attempt* (1-based)."""
+
+        if self.honour_retry_after and retry_after is not None:
+            return max(0.0, retry_after)
+        ceiling = min(
+            self.max_delay, self.base_delay * self.multiplier ** (attempt - 1)
+        )
+        return ceiling * rng()  # "full jitter" spreads synchronized retries
+
+
+def classify_error(exc: BaseException) -> str:
+    """Map *exc* to one of ``rate_limit``, ``timeout``, ``connection``,
+    ``server``, ``client`` or ``fatal`` (not an API error at all)."""
+
+    if is_rate_limit_error(exc):
+        return "rate_limit"
+    name = type(exc).__name__
+    if isinstance(exc, TimeoutError) or "Timeout" in name:
+        return "timeout"
+    if isinstance(exc, ConnectionError) or "Connection" in name:
+        return "connection"
+    status = getattr(exc, "status_code", None) or getattr(exc, "http_status", None)
+    if isinstance(status, int):
+        return "server" if status >= 500 else "client"
+    if name in {"APIError", "ServiceUnavailableError", "InternalServerError"}:
+        return "server"
+    return "fatal"
+
+
+def default_policies(
+    *,
+    max_attempts: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 8.0,
+    rate_limit_attempts: int = 6,
+) -> Dict[str, RetryPolicy]:
+    """Return the per-error-class policies used by the shared instance."""
+
+    transient = RetryPolicy(
+        max_attempts=max_attempts, base_delay=base_delay, max_delay=max_delay
+    )
+    return {
+        "rate_limit": RetryPolicy(
+            max_attempts=rate_limit_attempts, base_delay=1.0, max_delay=30.0
+        ),
+        "timeout": transient,
+        "connection": transient,
+        "server": transient,
+    }
+
+
+class CircuitBreaker:
+    """Classic closed → open → half-open breaker.
+
+    The breaker opens after *failure_threshold* consecutive outage failures.
+    After *reset_timeout* seconds a single probe call is let through; its
+    success closes the breaker, its failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be positive")
+        self._threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:  # noqa: D401 – property
+        """Current state, moving *open* to *half_open* once the timeout passed."""
+        with self._lock:
+            if (
+                self._state == self.OPEN
+                and self._clock() - self._opened_at >= self._reset_timeout
+            ):
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            return self._state
+
+    def allow(self) -> bool:
+        """Return *True* if a call may proceed (claims the half-open probe)."""
+
+        state = self.state
+        with self._lock:
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Close the breaker and reset the failure count."""
+
+        with self._lock:
+            if self._state != self.CLOSED:
+                _logger.info("OpenAI circuit closed after successful probe")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Give back a half-open probe whose outcome says nothing about health."""
+
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count an outage failure, opening the breaker at the threshold."""
+
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self._threshold:
+                if self._state != self.OPEN:
+                    _logger.warning(
+                        "OpenAI circuit opened after %d failure(s); failing fast "
+                        "for %.0fs",
+                        self._failures,
+                        self._reset_timeout,
+                    )
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._probe_in_flight = False
+
+
+class Resilience:
+    """Run callables with per-error-class retries behind a circuit breaker."""
+
+    def __init__(
+        self,
+        *,
+        policies: Optional[Mapping[str, RetryPolicy]] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.policies: Dict[str, RetryPolicy] = dict(
+            policies if policies is not None else default_policies()
+        )
+        self.breaker = breaker or CircuitBreaker()
+        self._sleep = sleep
+        self._rng = rng
+
+    def _check_breaker(self) -> None:
+        if not self.breaker.allow():
+            raise CircuitOpenError("OpenAI circuit breaker is open; skipping call")
+
+    def _retry_delay(self, exc: BaseException, attempt: int) -> Optional[float]:
+        """Record the failure and return the back-off, or *None* to give up."""
+
+        kind = classify_error(exc)
+        if kind in _OUTAGE_ERRORS:
+            self.breaker.record_failure()
+        elif kind == "fatal":
+            self.breaker.release_probe()
+        else:
+            # Throttling and client errors prove the service is reachable.
+            self.breaker.record_success()
+        policy = self.policies.get(kind)
+        if policy is None or attempt >= policy.max_attempts:
+            return None
+        delay = policy.delay(attempt, retry_after_seconds(exc), self._rng)
+        _logger.warning(
+            "OpenAI call failed (%s, attempt %d/%d): %s; retrying in %.2fs",
+            kind,
+            attempt,
+            policy.max_attempts,
+            exc,
+            delay,
+        )
+        return delay
+
+    def call(self, func: Callable[[], T]) -> T:
+        """Invoke *func*, retrying according to the error-class policies.
+
+        Raises
+        ------
+        CircuitOpenError
+            If the breaker is open before an attempt.
+        Exception
+            The last error once its policy gives up.
+        """
+
+        attempt = 0
+        while True:
+            self._check_breaker()
+            attempt += 1
+            try:
+                result = func()
+            except Exception as exc:
+                delay = self._retry_delay(exc, attempt)
+                if delay is None:
+                    raise
+                self._sleep(delay)
+                continue
+            self.breaker.record_success()
+            return result
+
+    async def acall(self, func: Callable[[], Awaitable[T]]) -> T:
+        """Async twin of :meth:`call`; *func* returns a fresh awaitable per try."""
+
+        attempt = 0
+        while True:
+            self._check_breaker()
+            attempt += 1
+            try:
+                result = await func()
+            except Exception as exc:
+                delay = self._retry_delay(exc, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            self.breaker.record_success()
+            return result
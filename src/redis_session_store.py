@@ -0,0 +1,575 @@
+"""Session store shared by several bot replicas through Redis.
+
+:class:`ThreadSafeSessionStore` keeps sessions in one process, so only a
+single replica can serve them.  :class:`RedisSessionStore` offers the same
+API on top of any Redis-protocol server, letting Socket Mode connections be
+spread across replicas that all see the same sessions.
+
+Only a single Redis node (optionally behind Sentinel) is supported, not
+Redis Cluster: the scripts below also touch the global index and per-user
+keys, which live in other hash slots, and build key names inside Lua.
+
+Layout:
+
+• ``<prefix>:{id}:meta`` – hash with ``created_at``, ``info`` (fields fixed at
+  creation) and ``state`` (small mutable fields), both JSON;
+• ``<prefix>:{id}:pending`` / ``:submitted`` – native sets of user IDs;
+• ``<prefix>:{id}:feedback`` – list of ``{"user": ..., "item": ...}`` JSON;
+• ``<prefix>:sessions`` – set of live session IDs;
+• ``<prefix>:user:{user_id}:pending`` – set of session IDs still waiting for
+  that user (reverse index, pruned lazily when sessions expire).
+
+Submissions run as one Lua script (check pending → move user → append item),
+so a participant can submit once no matter which replica handles the modal,
+and exactly one submission observes the session becoming complete.  Reads
+fetch all keys of a session in one pipelined round trip.  With
+*max_age_seconds* set the keys carry a Redis TTL, so abandoned sessions
+expire server-side instead of needing a sweep.
+
+Results of incremental analysis (see :mod:`src.reporting.incremental`) are
+kept in the meta hash as ``sentiment:<text>`` / ``quote:<text>`` fields, so
+the report – built from a fresh copy on any replica – reuses them.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import math
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+import redis
+
+from src.exceptions import AlreadySubmittedError
+from src.feedback_record import (
+    FeedbackEntry,
+    FeedbackRecord,
+    entry_from_json,
+    entry_to_json,
+)
+from src.reporting.aggregator import process_session
+from src.reporting.incremental import enqueue_feedback_analysis
+from src.session_backend import dump_info, dump_state, restore_session
+from src.session_data import SessionData
+
+__all__ = [
+    "RedisSessionStore",
+]
+
+# KEYS: meta, index   ARGV: session id, limit, created_at, info, state, prefix
+_ADD_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then return -1 end
+local limit = tonumber(ARGV[2])
+if limit > 0 and redis.call('SCARD', KEYS[2]) >= limit then
+  -- Drop IDs whose keys already expired before refusing.
+  for _, id in ipairs(redis.call('SMEMBERS', KEYS[2])) do
+    if redis.call('EXISTS', ARGV[6] .. ':{' .. id .. '}:meta') == 0 then
+      redis.call('SREM', KEYS[2], id)
+    end
+  end
+  if redis.call('SCARD', KEYS[2]) >= limit then return -2 end
+end
+redis.call('HSET', KEYS[1], 'created_at', ARGV[3], 'info', ARGV[4],
+           'state', ARGV[5])
+redis.call('SADD', KEYS[2], ARGV[1])
+return 1
+"""
+
+# KEYS: meta, pending, submitted, feedback, user's pending-sessions index
+# ARGV: user id, feedback JSON, state JSON ('' keeps it), ttl (0 = none),
+#       session id
+# Returns the remaining pending users, or a negative error code.
+_SUBMIT_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then return -1 end
+if redis.call('SISMEMBER', KEYS[3], ARGV[1]) == 1 then return -2 end
+if redis.call('SREM', KEYS[2], ARGV[1]) == 0 then return -3 end
+redis.call('SADD', KEYS[3], ARGV[1])
+redis.call('RPUSH', KEYS[4], ARGV[2])
+redis.call('SREM', KEYS[5], ARGV[5])
+if ARGV[3] ~= '' then redis.call('HSET', KEYS[1], 'state', ARGV[3]) end
+local ttl = tonumber(ARGV[4])
+if ttl > 0 then
+  for i = 1, 4 do redis.call('EXPIRE', KEYS[i], ttl) end
+end
+return redis.call('SMEMBERS', KEYS[2])
+"""
+
+# KEYS: meta   ARGV: field, value, field, value, ...
+# Skips sessions that were removed while their analysis was running.
+_MEMO_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then return 0 end
+redis.call('HSET', KEYS[1], unpack(ARGV))
+return 1
+"""
+
+# Meta hash field prefixes of memoized analysis results
+_SENTIMENT_FIELD = "sentiment:"
+_QUOTE_FIELD = "quote:"
+
+
+class RedisSessionStore:
+    """Redis-backed drop-in for :class:`~src.session_store.ThreadSafeSessionStore`.
+
+    Returned :class:`SessionData` objects are copies; mutate sessions through
+    :meth:`modify_session` / :meth:`submit_feedback` so changes reach Redis.
+
+    Close listeners only hear about removals made through this replica.
+    """
+
+    def __init__(
+        self,
+        client: "redis.Redis",
+        *,
+        max_sessions: Optional[int] = None,
+        max_age_seconds: Optional[float] = None,
+        prefix: str = "sentiment",
+    ):
+        """Create a store using *client*.
+
+        Args:
+            client: Redis client created with ``decode_responses=True``.
+            max_sessions: Optional cluster-wide limit of concurrent sessions.
+            max_age_seconds: Optional idle time after which Redis expires a
+                session's keys (never before its own time limit).
+            prefix: Key prefix, so several deployments can share a server.
+        """
+        self._redis = client
+        self._max_sessions = max_sessions if (max_sessions or 0) > 0 else None
+        self._max_age = max_age_seconds if (max_age_seconds or 0) > 0 else None
+        self._prefix = prefix
+        self._index = f"{prefix}:sessions"
+        self._add = client.register_script(_ADD_SCRIPT)
+        self._submit = client.register_script(_SUBMIT_SCRIPT)
+        self._memo = client.register_script(_MEMO_SCRIPT)
+        self._pruned_total = 0
+        self._sweeps = 0
+        self._logger = logging.getLogger(__name__)
+        self._close_listeners: List[Callable[[str], None]] = []
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> "RedisSessionStore":
+        """Connect to the server at *url* (e.g. ``redis://localhost:6379/0``)."""
+        return cls(redis.Redis.from_url(url, decode_responses=True), **kwargs)
+
+    # ------------------------------------------------------------------
+    # Key helpers
+    # ------------------------------------------------------------------
+    def _keys(self, session_id: str) -> List[str]:
+        """meta, pending, submitted and feedback keys of *session_id*."""
+        base = f"{self._prefix}:{{{session_id}}}"
+        return [
+            f"{base}:meta",
+            f"{base}:pending",
+            f"{base}:submitted",
+            f"{base}:feedback",
+        ]
+
+    def _user_key(self, user_id: str) -> str:
+        return f"{self._prefix}:user:{{{user_id}}}:pending"
+
+    def _ttl(self, session: SessionData) -> int:
+        """Seconds the keys of *session* should live from now (0 = forever)."""
+        if self._max_age is None:
+            return 0
+        return math.ceil(max(self._max_age, session.time_remaining() or 0.0))
+
+    @staticmethod
+    def _encode_submission(user_id: Optional[str], item: FeedbackEntry) -> str:
+        return json.dumps({"user": user_id, "item": entry_to_json(item)})
+
+    def _members(self, key: str) -> List[str]:
+        """Sorted members of the set *key*, as text."""
+        return sorted(
+            m.decode() if isinstance(m, bytes) else m for m in self._redis.smembers(key)
+        )
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def _queue_read(self, pipe: Any, session_id: str) -> None:
+        meta, _pending, submitted, feedback = self._keys(session_id)
+        pipe.hgetall(meta)
+        pipe.smembers(submitted)
+        pipe.lrange(feedback, 0, -1)
+
+    def _decode(
+        self, session_id: str, meta: Dict[str, str], submitted: Any, rows: List[str]
+    ) -> Optional[SessionData]:
+        if not meta:
+            return None
+        feedback = []
+        for row in rows:
+            data = json.loads(row)
+            feedback.append((data["user"], entry_from_json(data["item"])))
+        session = restore_session(
+            session_id,
+            float(meta["created_at"]),
+            meta["info"],
+            meta["state"],
+            list(submitted),
+            feedback,
+        )
+        for name, value in meta.items():
+            if name.startswith(_SENTIMENT_FIELD):
+                session.item_sentiments[name[len(_SENTIMENT_FIELD) :]] = value
+            elif name.startswith(_QUOTE_FIELD):
+                session.anonymized_quotes[name[len(_QUOTE_FIELD) :]] = value
+        return session
+
+    def _load_many(self, session_ids: Sequence[str]) -> Dict[str, SessionData]:
+        """Fetch *session_ids* in one round trip; missing ones are skipped."""
+        pipe = self._redis.pipeline(transaction=False)
+        for session_id in session_ids:
+            self._queue_read(pipe, session_id)
+        replies = pipe.execute()
+        sessions: Dict[str, SessionData] = {}
+        stale: List[str] = []
+        for i, session_id in enumerate(session_ids):
+            session = self._decode(session_id, *replies[3 * i : 3 * i + 3])
+            if session is None:
+                stale.append(session_id)
+            else:
+                sessions[session_id] = session
+        if stale:
+            # Keys expired server-side; keep the index in step.
+            self._pruned_total += self._redis.srem(self._index, *stale)
+        return sessions
+
+    def get_session(self, session_id: str) -> Optional[SessionData]:
+        """Retrieves a session by its ID. Returns None if not found."""
+        pipe = self._redis.pipeline(transaction=False)
+        self._queue_read(pipe, session_id)
+        return self._decode(session_id, *pipe.execute())
+
+    def get_all_sessions(self) -> Dict[str, SessionData]:
+        """Returns every live session (one pipelined round trip)."""
+        return self._load_many(self._members(self._index))
+
+    def snapshot(self) -> Mapping[str, SessionData]:
+        """Return a read-only view of all sessions."""
+        return MappingProxyType(self.get_all_sessions())
+
+    def get_active_sessions(self) -> Mapping[str, SessionData]:
+        """Return a read-only view of active sessions for diagnostics."""
+        return self.snapshot()
+
+    def count(self) -> int:
+        """Returns the total number of active sessions."""
+        return len(self.get_all_sessions())
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def add_session(self, session_data: SessionData) -> None:
+        """
+        Adds a new session to the store.
+        Raises ValueError if a session with the same ID already exists or the
+        session limit is reached.
+        """
+        session_id = session_data.session_id
+        meta = self._keys(session_id)[0]
+        result = self._add(
+            keys=[meta, self._index],
+            args=[
+                session_id,
+                self._max_sessions or 0,
+                session_data.created_at.timestamp(),
+                dump_info(session_data),
+                dump_state(session_data),
+                self._prefix,
+            ],
+        )
+        if result == -1:
+            raise ValueError(f"Session with ID {session_id} already exists.")
+        if result == -2:
+            raise ValueError(
+                "Maximum concurrent session limit reached. "
+                "Try again later or finish existing sessions."
+            )
+        # Invitations are only sent after this returns, so nobody can submit
+        # between the claim above and the rest of the keys being written.
+        self._write_members(session_data, replace=False)
+
+    def _write_members(self, session: SessionData, *, replace: bool) -> None:
+        meta, pending, submitted, feedback = self._keys(session.session_id)
+        session.take_unsaved()
+        pipe = self._redis.pipeline(transaction=True)
+        if replace:
+            pipe.delete(pending, submitted, feedback)
+            pipe.hset(
+                meta,
+                mapping={
+                    "created_at": session.created_at.timestamp(),
+                    "info": dump_info(session),
+                    "state": dump_state(session),
+                },
+            )
+        if session.pending_users:
+            pipe.sadd(pending, *session.pending_users)
+            for user_id in session.pending_users:
+                pipe.sadd(self._user_key(user_id), session.session_id)
+        if session.submitted_users:
+            pipe.sadd(submitted, *session.submitted_users)
+        if session.feedback_items:
+            pipe.rpush(
+                feedback,
+                *(
+                    self._encode_submission(
+                        item.user_id if isinstance(item, FeedbackRecord) else None,
+                        item,
+                    )
+                    for item in session.feedback_items
+                ),
+            )
+        ttl = self._ttl(session)
+        if ttl:
+            for key in (meta, pending, submitted, feedback):
+                pipe.expire(key, ttl)
+        pipe.execute()
+
+    def recover(self) -> List[SessionData]:
+        """Sessions live in Redis already; nothing to load.
+
+        Expiry timers stay with the replica that created a session; if it
+        dies, the key TTL (``max_age_seconds``) is the backstop.
+        """
+        return []
+
+    def update_session(self, session_data: SessionData) -> None:
+        """
+        Replaces an existing session with *session_data*.
+        Raises ValueError if the session ID is not found.
+        """
+        meta = self._keys(session_data.session_id)[0]
+        if not self._redis.exists(meta):
+            raise ValueError(
+                f"Session with ID {session_data.session_id} not found for update."
+            )
+        session_data.touch()
+        previous = self._redis.smembers(self._keys(session_data.session_id)[1])
+        self._write_members(session_data, replace=True)
+        self._unindex(session_data.session_id, previous - session_data.pending_users)
+
+    def modify_session(
+        self,
+        session_id: str,
+        modifier: Callable[[SessionData], None],
+    ) -> SessionData:
+        """Apply *modifier* to a fresh copy of the session and store the result.
+
+        Submissions made by *modifier* (via :meth:`SessionData.submit`) are
+        applied with the atomic submit script, so concurrent replicas can
+        never accept two submissions from one participant.  The remaining
+        scalar fields are written last-writer-wins.
+
+        Raises:
+            ValueError: If *session_id* does not exist in the store.
+            AlreadySubmittedError: If another replica recorded the same
+                participant's submission first.
+        """
+        session = self.get_session(session_id)
+        if session is None:
+            raise ValueError(f"Session with ID {session_id} not found.")
+        modifier(session)
+        self._persist(session, session.take_unsaved())
+        session.touch()
+        return session
+
+    def _persist(self, session: SessionData, submissions: List[Any]) -> None:
+        meta, pending, submitted, feedback = self._keys(session.session_id)
+        state = dump_state(session)
+        ttl = self._ttl(session)
+        participants = [(u, item) for u, item in submissions if u is not None]
+        anonymous = [(u, item) for u, item in submissions if u is None]
+
+        pipe = self._redis.pipeline(transaction=False)
+        for user_id, item in participants:
+            self._submit(
+                keys=[meta, pending, submitted, feedback, self._user_key(user_id)],
+                args=[
+                    user_id,
+                    self._encode_submission(user_id, item),
+                    state,
+                    ttl,
+                    session.session_id,
+                ],
+                client=pipe,
+            )
+        if anonymous:
+            pipe.rpush(feedback, *(self._encode_submission(u, i) for u, i in anonymous))
+        if not participants:
+            pipe.hset(meta, "state", state)
+            if ttl:
+                for key in (meta, pending, submitted, feedback):
+                    pipe.expire(key, ttl)
+        replies = pipe.execute()
+
+        for (user_id, _item), reply in zip(participants, replies):
+            if reply == -1:
+                raise ValueError(f"Session with ID {session.session_id} not found.")
+            if reply == -2:
+                raise AlreadySubmittedError(
+                    f"User {user_id} already submitted feedback for session "
+                    f"{session.session_id}."
+                )
+            if reply == -3:
+                raise ValueError(
+                    f"User {user_id} is not a participant in session "
+                    f"{session.session_id}."
+                )
+            # Authoritative view at the moment of this submission, so exactly
+            # one submitter sees the session become complete.
+            session.pending_users = set(reply)
+            session.submitted_users = (
+                set(session.target_user_ids) - session.pending_users
+            )
+
+    def remove_session(self, session_id: str) -> Optional[SessionData]:
+        """Removes a session by its ID. Returns the removed session or None if not found.
+
+        Reading and deleting happen in one transaction, so when several
+        replicas race (e.g. duplicate expiry timers) only one gets the session.
+        """
+        keys = self._keys(session_id)
+        pipe = self._redis.pipeline(transaction=True)
+        self._queue_read(pipe, session_id)
+        pipe.delete(*keys)
+        pipe.srem(self._index, session_id)
+        replies = pipe.execute()
+        session = self._decode(session_id, *replies[:3])
+        if session is not None:
+            self._unindex(session_id, session.pending_users)
+            self._notify_closed(session_id)
+        return session
+
+    # ------------------------------------------------------------------
+    # Close listeners
+    # ------------------------------------------------------------------
+    def add_close_listener(self, listener: Callable[[str], None]) -> None:
+        """Call ``listener(session_id)`` when a session is removed."""
+        self._close_listeners.append(listener)
+
+    def _notify_closed(self, session_id: str) -> None:
+        for listener in self._close_listeners:
+            try:
+                listener(session_id)
+            except Exception:  # noqa: BLE001 – never fail the store operation
+                self._logger.exception(
+                    "Close listener failed for session %s", session_id
+                )
+
+    # ------------------------------------------------------------------
+    # Per-user lookups
+    # ------------------------------------------------------------------
+    def _unindex(self, session_id: str, user_ids: Any) -> None:
+        if not user_ids:
+            return
+        pipe = self._redis.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipe.srem(self._user_key(user_id), session_id)
+        pipe.execute()
+
+    def pending_sessions_for(self, user_id: str) -> List[SessionData]:
+        """Return the open sessions still waiting for *user_id*, oldest first."""
+        key = self._user_key(user_id)
+        session_ids = self._members(key)
+        if not session_ids:
+            return []
+        sessions = self._load_many(session_ids)
+        gone = [sid for sid in session_ids if sid not in sessions]
+        if gone:
+            self._redis.srem(key, *gone)
+        return sorted(
+            (s for s in sessions.values() if user_id in s.pending_users),
+            key=lambda session: session.created_at,
+        )
+
+    # ------------------------------------------------------------------
+    # Lifecycle helpers (same contract as ThreadSafeSessionStore)
+    # ------------------------------------------------------------------
+    def submit_feedback(
+        self, session_id: str, user_id: str, feedback_item: FeedbackEntry
+    ) -> None:
+        """Record feedback for a participant and update session state atomically."""
+
+        def _apply(session: SessionData) -> None:  # noqa: WPS430 – local helper
+            session.submit(user_id, feedback_item)
+
+        session = self.modify_session(session_id, _apply)
+        if session.is_complete:
+            self._logger.info("session_done", extra={"session_id": session_id})
+        self._logger.info(
+            "feedback_received",
+            extra={"session_id": session_id, "user_id": user_id},
+        )
+        self.enqueue_analysis(session, feedback_item)
+
+    def enqueue_analysis(
+        self, session: SessionData, feedback_item: FeedbackEntry
+    ) -> None:
+        """Optional background scoring so the report has less to do later.
+
+        *session* is a copy, so results are written back to Redis.
+        """
+        enqueue_feedback_analysis(
+            session, feedback_item, save_results=self._save_analysis
+        )
+
+    def _save_analysis(
+        self, session_id: str, sentiments: Dict[str, str], quotes: Dict[str, str]
+    ) -> None:
+        """Store incremental analysis results next to the session."""
+        args: List[str] = []
+        for text, label in sentiments.items():
+            args += [_SENTIMENT_FIELD + text, label]
+        for raw, anonymized in quotes.items():
+            args += [_QUOTE_FIELD + raw, anonymized]
+        if args:
+            self._memo(keys=[self._keys(session_id)[0]], args=args)
+
+    def mark_done(self, session_id: str) -> None:
+        """Set session as completed and remove it from store (idempotent)."""
+        session = self.remove_session(session_id)
+        if session is not None:
+            session.complete_session("")
+            self._logger.info("session_done", extra={"session_id": session_id})
+
+    def evict_expired(self, now: Optional[float] = None) -> List[SessionData]:
+        """Prune index entries of sessions Redis already expired.
+
+        Redis drops the keys itself, so there is never anything to return.
+        """
+        self._sweeps += 1
+        self.get_all_sessions()
+        return []
+
+    @property
+    def evicted_total(self) -> int:  # noqa: D401 – property
+        """Number of expired sessions pruned from the index so far."""
+        return self._pruned_total
+
+    def eviction_stats(self) -> Dict[str, int]:
+        """Return eviction metrics in the same shape as the in-memory store."""
+        return {
+            "evicted_total": self._pruned_total,
+            "sweeps": self._sweeps,
+            "indexed": self._redis.scard(self._index),
+            "sessions": self.count(),
+        }
+
+    def close(self) -> None:
+        """Close the Redis connection pool."""
+        self._redis.close()
+
+    def process_feedback(self, session_id: str):
+        """Return aggregated feedback for *session_id* using reporting pipeline.
+
+        Raises
+        ------
+        ValueError
+            If the session does not exist.
+        """
+        session = self.get_session(session_id)
+        if session is None:
+            raise ValueError(f"Session {session_id} not found for processing.")
+        return process_session(session)
@@ -1,28 +1,163 @@
-"""Aggregate raw feedback into a structured :class:`ProcessedFeedback`."""
+"""Aggregate raw feedback into a structured :class:`ProcessedFeedback`.
+
+Feedback entries are read as :class:`~src.feedback_record.FeedbackRecord`
+objects.  Sentiment counts depend on ``REPORT_SENTIMENT_MODE``:
+
+• ``structured`` (default) – tally the label each participant picked in the
+  feedback modal; only items without a label are scored by the model.
+• ``verify`` – like *structured*, but the free text of labelled items is also
+  scored and disagreements with the chosen label are logged.
+• ``model`` – score every item with the model, ignoring chosen labels.
+"""
 
 from __future__ import annotations
 
 import logging
 import math
 from collections import Counter, defaultdict
-from typing import Dict, List
-
-from src.analysis.sentiment import analyze_sentiment
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.analysis.sentiment import (
+    SentimentResult,
+    aanalyze_sentiments,
+    analyze_sentiments,
+)
+from src.feedback_record import FeedbackRecord, to_record
+from src.openai_client import ai_available
+from src.reporting import config
 from src.reporting.models import ProcessedFeedback
+from src.reporting.stages import Results, Stage, stage_timeout
 from src.session_data import SessionData
 
 logger = logging.getLogger(__name__)
 
 
+def needs_model_sentiment(record: FeedbackRecord) -> bool:
+    """Return *True* if *record*'s sentiment must come from the model."""
+
+    return config.SENTIMENT_MODE == "model" or record.sentiment is None
+
+
 def _tally_sentiments(items: List[str]) -> Dict[str, int]:  # pragma: no cover – helper
-    """Return a mapping label→count using OpenAI sentiment analysis."""
+    """Return a mapping label→count using batched OpenAI sentiment analysis."""
+    if not _should_tally(items):
+        return {}
+    return _count_labels(
+        analyze_sentiments(items, batch_size=config.SENTIMENT_BATCH_SIZE), len(items)
+    )
+
+
+async def _atally_sentiments(items: List[str]) -> Dict[str, int]:
+    """Asyncio twin of :func:`_tally_sentiments`."""
+    if not _should_tally(items):
+        return {}
+    results = await aanalyze_sentiments(items, batch_size=config.SENTIMENT_BATCH_SIZE)
+    return _count_labels(results, len(items))
+
+
+def _should_tally(items: List[str]) -> bool:
+    if not items:
+        return False
+    if not ai_available():
+        logger.warning("OpenAI circuit open; skipping sentiment analysis")
+        return False
+    return True
+
+
+def _count_labels(
+    results: Iterable[Optional[SentimentResult]], total: int
+) -> Dict[str, int]:
+    counts: Counter[str] = Counter()
+    failed = 0
+    for result in results:
+        if result is None:  # keep going on failures
+            failed += 1
+            continue
+        counts[result.label.value] += 1
+    if failed:
+        logger.warning("Sentiment analysis failed for %d of %d item(s)", failed, total)
+    return dict(counts)
+
+
+def _partition(
+    session: SessionData, records: List[FeedbackRecord]
+) -> Tuple[Counter[str], List[str], List[Tuple[str, str]]]:
+    """Split *records* into known label counts, texts to score and labelled pairs.
+
+    Labels come from the modal selection (unless in ``model`` mode) or from
+    results memoized on *session*; everything else still needs the model.
+    Texts are the participants' free text, so a chosen label cannot bias the
+    model.
+    """
+
+    memo = dict(session.item_sentiments)
     counts: Counter[str] = Counter()
-    for item in items:
-        try:
-            result = analyze_sentiment(item)
-            counts[result.label.value] += 1
-        except Exception as exc:  # noqa: BLE001 – keep going on failures
-            logger.warning("Sentiment analysis failed for item: %s", exc)
+    missing: List[str] = []
+    labelled: List[Tuple[str, str]] = []
+    for record in records:
+        text = record.free_text
+        label = record.sentiment
+        # needs_model_sentiment() is False only for records that carry a label
+        if label is not None and not needs_model_sentiment(record):
+            counts[label] += 1
+            labelled.append((text, label))
+        elif text in memo:
+            counts[memo[text]] += 1
+        else:
+            missing.append(text)
+    return counts, missing, labelled
+
+
+def _should_verify(labelled: List[Tuple[str, str]]) -> bool:
+    return config.SENTIMENT_MODE == "verify" and bool(labelled) and ai_available()
+
+
+def _log_disagreements(
+    session_id: str,
+    labelled: List[Tuple[str, str]],
+    results: Iterable[Optional[SentimentResult]],
+) -> None:
+    checked = disagreements = 0
+    for (_item, label), result in zip(labelled, results):
+        if result is None:
+            continue
+        checked += 1
+        if result.label.value != label:
+            disagreements += 1
+    logger.info(
+        "Sentiment disagreement for session %s: model differs from chosen label "
+        "for %d of %d item(s)",
+        session_id,
+        disagreements,
+        checked,
+    )
+
+
+def _tally_session(
+    session: SessionData, records: List[FeedbackRecord]
+) -> Dict[str, int]:
+    counts, missing, labelled = _partition(session, records)
+    counts.update(_tally_sentiments(missing))
+    if _should_verify(labelled):
+        results = analyze_sentiments(
+            [text for text, _label in labelled],
+            batch_size=config.SENTIMENT_BATCH_SIZE,
+        )
+        _log_disagreements(session.session_id, labelled, results)
+    return dict(counts)
+
+
+async def _atally_session(
+    session: SessionData, records: List[FeedbackRecord]
+) -> Dict[str, int]:
+    counts, missing, labelled = _partition(session, records)
+    counts.update(await _atally_sentiments(missing))
+    if _should_verify(labelled):
+        results = await aanalyze_sentiments(
+            [text for text, _label in labelled],
+            batch_size=config.SENTIMENT_BATCH_SIZE,
+        )
+        _log_disagreements(session.session_id, labelled, results)
     return dict(counts)
 
 
@@ -34,15 +169,64 @@ def process_session(
     The function is read-only; it does not mutate *session*.
     """
 
-    # Build per-user mapping (future-proof): we currently cannot guarantee
-    # mapping so fall back to a flat list under "unknown".
-    per_user: Dict[str, List[str]] = defaultdict(list)
-    for item in session.feedback_items:
-        per_user["unknown"].append(item)
+    processed = _assemble(session, {})
+    processed.sentiment_counts = _tally_session(session, processed.records)
+    return processed
+
+
+async def aprocess_session(session: SessionData) -> ProcessedFeedback:
+    """Asyncio twin of :func:`process_session`."""
+
+    processed = _assemble(session, {})
+    processed.sentiment_counts = await _atally_session(session, processed.records)
+    return processed
 
-    all_items: List[str] = list(session.feedback_items)
 
-    sentiment_counts = _tally_sentiments(all_items)
+def aggregation_stages(
+    session: SessionData, *, asynchronous: bool = False
+) -> List[Stage]:
+    """Return the *aggregate* and *sentiment* report stages for *session*.
+
+    *aggregate* yields a :class:`ProcessedFeedback` without sentiment counts so
+    that analysis stages can start right away; *sentiment* yields the label
+    counts (``{}`` on failure or timeout) and runs alongside them.
+    """
+
+    def _aggregate(_results: Results) -> ProcessedFeedback:
+        return _assemble(session, {})
+
+    def _sentiment(results: Results) -> Dict[str, int]:
+        return _tally_session(session, results["aggregate"].records)
+
+    async def _asentiment(results: Results) -> Dict[str, int]:
+        return await _atally_session(session, results["aggregate"].records)
+
+    return [
+        Stage("aggregate", _aggregate, timeout=stage_timeout("aggregate")),
+        Stage(
+            "sentiment",
+            _asentiment if asynchronous else _sentiment,
+            deps=("aggregate",),
+            timeout=stage_timeout("sentiment"),
+            fallback=lambda _results: {},
+        ),
+    ]
+
+
+def _assemble(
+    session: SessionData, sentiment_counts: Dict[str, int]
+) -> ProcessedFeedback:
+    entries = list(session.feedback_items)
+    records = [to_record(entry) for entry in entries]
+    # Raw display text; legacy string entries are kept verbatim
+    all_items = [
+        entry if isinstance(entry, str) else entry.as_text() for entry in entries
+    ]
+
+    # Per-user mapping; free-text entries without a user land under "unknown"
+    per_user: Dict[str, List[str]] = defaultdict(list)
+    for record, item in zip(records, all_items):
+        per_user[record.user_id or "unknown"].append(item)
 
     total_participants = len(session.target_user_ids)
     submitted = len(session.submitted_users)
@@ -64,4 +248,6 @@ def process_session(
         sentiment_counts=sentiment_counts,
         stats=stats,
         reason=session.reason,
+        anonymized_quotes=dict(session.anonymized_quotes),
+        records=records,
     )
@@ -19,3 +19,27 @@ MAX_COMMENTS: int = int(os.getenv("REPORT_MAX_COMMENTS", "50"))
 LOW_PARTICIPATION_THRESHOLD: float = float(
     os.getenv("REPORT_LOW_PARTICIPATION_THRESHOLD", "0.5")
 )
+
+# Number of feedback items classified per sentiment request
+SENTIMENT_BATCH_SIZE: int = int(os.getenv("REPORT_SENTIMENT_BATCH_SIZE", "20"))
+
+# Where sentiment counts come from: "structured" (labels chosen in the modal,
+# model only for unlabelled items), "verify" (structured plus model-based
+# disagreement logging) or "model" (classify every item with the model)
+SENTIMENT_MODE: str = os.getenv("REPORT_SENTIMENT_MODE", "structured").lower()
+if SENTIMENT_MODE not in {"structured", "verify", "model"}:
+    SENTIMENT_MODE = "structured"
+
+# Run report generation on the shared asyncio event loop instead of a worker
+# thread (see ``src.async_runtime``)
+ASYNC_PIPELINE: bool = os.getenv("REPORT_ASYNC_PIPELINE", "false").lower() in {
+    "1",
+    "true",
+    "yes",
+}
+
+# Score and anonymize each feedback item in the background as it is submitted
+# instead of all at once when the report is generated
+INCREMENTAL_ANALYSIS: bool = os.getenv(
+    "REPORT_INCREMENTAL_ANALYSIS", "false"
+).lower() in {"1", "true", "yes"}
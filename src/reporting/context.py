@@ -11,24 +11,36 @@ enables:
       strings.
     • Future extension (e.g., HTML or JSON reports) by reusing the same
       context object.
+
+The analysis steps (anonymize → themes → summary) are expressed as
+:class:`~src.reporting.stages.Stage` nodes so the full report pipeline in
+:mod:`src.reporting.render` can schedule them next to sentiment scoring.
 """
 from __future__ import annotations
 
-import logging
 import os
 from dataclasses import asdict, dataclass, field
 from datetime import datetime as _dt
 from datetime import timezone as _tz
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from src.analysis.anonymize import anonymize_quotes
-from src.analysis.themes import extract_themes
+from src.analysis.anonymize import aanonymize_quotes, anonymize_quotes
+from src.analysis.summary import agenerate_summary
+from src.analysis.themes import aextract_themes, extract_themes
+from src.feedback_record import FeedbackRecord, to_record
+from src.openai_client import CircuitOpenError, ai_available
 from src.reporting import config
 from src.reporting.models import ProcessedFeedback
+from src.reporting.stages import Results, Stage, arun_stages, run_stages, stage_timeout
 
 __all__ = [
     "Stats",
     "ReportContext",
+    "abuild_report_context",
+    "analysis_stages",
+    "build_report_context",
+    "context_from_results",
+    "highlight_texts",
 ]
 
 # Optional: summary generation using OpenAI; fail gracefully if unavailable
@@ -117,78 +129,166 @@ def _emoji_bar(counts: dict[str, int], max_emoji: int = 20) -> str:  # pragma: n
     return pos_e + neu_e + neg_e
 
 
-def _split_highlights(items: List[str], *, max_each: int = config.MAX_BULLETS_EACH):
-    """Return (well, improve) bullet lists extracted from structured items."""
+# ---------------------------------------------------------------------------
+# Analysis stages
+# ---------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class _Highlights:
+    """Output of the *anonymize* stage."""
 
-    well: List[str] = []
-    improve: List[str] = []
+    bullets_well: List[str]
+    bullets_improve: List[str]
+    items: List[str]
+    anonymized: bool = True
 
-    for it in items:
-        # naive parse of "well=..., improve=..." pattern
-        if "well=" in it:
-            _, after = it.split("well=", 1)
-            txt = after.split(",", 1)[0].strip()
-            well.append(f"• {txt}")
-        if "improve=" in it:
-            _, after = it.split("improve=", 1)
-            txt = after.strip()
-            improve.append(f"• {txt}")
 
-    return well[:max_each], improve[:max_each]
+def highlight_texts(
+    records: Sequence[FeedbackRecord], *, max_each: int = config.MAX_BULLETS_EACH
+) -> Tuple[List[str], int]:
+    """Return well/improve answers to anonymize and the index where *improve* starts."""
 
+    well = [r.well for r in records if r.well is not None][:max_each]
+    improve = [r.improve for r in records if r.improve is not None][:max_each]
+    return well + improve, len(well)
 
-# ---------------------------------------------------------------------------
-# Conversion helper
-# ---------------------------------------------------------------------------
-def build_report_context(processed: ProcessedFeedback) -> ReportContext:  # noqa: WPS231
-    """Convert ``ProcessedFeedback`` into :class:`ReportContext`.
 
-    The function is *pure* – it does not mutate *processed* and will
-    swallow non-critical errors (anonymization/theme extraction) so that
-    downstream rendering always succeeds.
+def _records(processed: ProcessedFeedback) -> List[FeedbackRecord]:
+    # Contexts built straight from strings (tests, legacy callers) parse once
+    return processed.records or [to_record(item) for item in processed.all_items]
+
+
+def _require_ai() -> None:
+    if not ai_available():
+        # OpenAI is down – fail the stage so its fallback is used immediately.
+        raise CircuitOpenError("OpenAI circuit open; reporting raw data")
+
+
+def _to_highlights(anonymized_bullets: List[str], split_index: int) -> _Highlights:
+    # Split back into well / improve lists preserving original ordering.  The
+    # anonymized comments block shows the same texts without prefix.
+    return _Highlights(
+        bullets_well=[f"• {txt}" for txt in anonymized_bullets[:split_index]],
+        bullets_improve=[f"• {txt}" for txt in anonymized_bullets[split_index:]],
+        items=anonymized_bullets,
+    )
+
+
+def _missing_quotes(processed: ProcessedFeedback) -> Tuple[List[str], List[str], int]:
+    """Return all highlight texts, those not anonymized yet, and the split."""
+
+    texts, split_index = highlight_texts(_records(processed))
+    known = processed.anonymized_quotes
+    missing = list(dict.fromkeys(t for t in texts if t not in known))
+    if missing:
+        _require_ai()
+    return texts, missing, split_index
+
+
+def _lookup(
+    processed: ProcessedFeedback, texts: List[str], fresh: Dict[str, str]
+) -> List[str]:
+    known = processed.anonymized_quotes
+    return [known[t] if t in known else fresh[t] for t in texts]
+
+
+def _anonymize_stage(results: Results) -> _Highlights:
+    processed: ProcessedFeedback = results["aggregate"]
+    texts, missing, split_index = _missing_quotes(processed)
+    fresh = dict(zip(missing, anonymize_quotes(missing)))
+    return _to_highlights(_lookup(processed, texts, fresh), split_index)
+
+
+async def _aanonymize_stage(results: Results) -> _Highlights:
+    processed: ProcessedFeedback = results["aggregate"]
+    texts, missing, split_index = _missing_quotes(processed)
+    fresh = dict(zip(missing, await aanonymize_quotes(missing)))
+    return _to_highlights(_lookup(processed, texts, fresh), split_index)
+
+
+def _raw_highlights(results: Results) -> _Highlights:
+    # Without anonymization only the raw comments are shown; themes and
+    # summary are skipped so unredacted text never reaches the summary.
+    processed: ProcessedFeedback = results["aggregate"]
+    return _Highlights([], [], list(processed.all_items), anonymized=False)
+
+
+def _themes_stage(results: Results) -> List[str]:
+    highlights: _Highlights = results["anonymize"]
+    if not highlights.anonymized:
+        return []
+    _require_ai()
+    return extract_themes(highlights.items)[: config.MAX_THEMES]
+
+
+async def _athemes_stage(results: Results) -> List[str]:
+    highlights: _Highlights = results["anonymize"]
+    if not highlights.anonymized:
+        return []
+    _require_ai()
+    return (await aextract_themes(highlights.items))[: config.MAX_THEMES]
+
+
+def _summary_stage(results: Results) -> str:
+    highlights: _Highlights = results["anonymize"]
+    if not highlights.anonymized:
+        return ""
+    _require_ai()
+    return generate_summary(highlights.items, results["themes"])
+
+
+async def _asummary_stage(results: Results) -> str:
+    highlights: _Highlights = results["anonymize"]
+    if not highlights.anonymized:
+        return ""
+    _require_ai()
+    return await agenerate_summary(highlights.items, results["themes"])
+
+
+def analysis_stages(*, asynchronous: bool = False) -> List[Stage]:
+    """Return the anonymize → themes → summary stages.
+
+    They read the :class:`ProcessedFeedback` produced by a stage named
+    ``"aggregate"``, which the caller must supply.  With *asynchronous* the
+    stage functions are coroutines suitable for :func:`arun_stages`.
     """
 
-    # ------------------------------------------------------------------
-    # Pre-processing – anonymize & analyse
-    # ------------------------------------------------------------------
-    try:
-        # Extract highlights *before* anonymization so marker keywords survive
-        raw_bullets_well, raw_bullets_improve = _split_highlights(
-            processed.all_items, max_each=config.MAX_BULLETS_EACH
-        )
-
-        # Clean bullet texts (drop leading bullet prefix) and anonymize **once**
-        clean_bullet_texts = [
-            b.lstrip("• ").strip() for b in raw_bullets_well + raw_bullets_improve
-        ]
-        anonymized_bullets = anonymize_quotes(clean_bullet_texts)
-
-        # Split back into well / improve lists preserving original ordering
-        split_index = len(raw_bullets_well)
-        bullets_well = [f"• {txt}" for txt in anonymized_bullets[:split_index]]
-        bullets_improve = [f"• {txt}" for txt in anonymized_bullets[split_index:]]
-
-        # The anonymized comments block shows the same texts without prefix
-        anonymized_items = anonymized_bullets
-
-        themes = extract_themes(anonymized_items)[: config.MAX_THEMES]
-
-        # Generate summary paragraph (may fail silently)
-        try:
-            summary = generate_summary(anonymized_items, themes)
-        except Exception:  # pragma: no cover – summary optional
-            summary = ""
-
-    except Exception as exc:  # pragma: no cover – analysis failures should not block
-        logger = logging.getLogger(__name__)
-        logger.warning("Analysis failed for session %s: %s", processed.session_id, exc)
-        anonymized_items = list(processed.all_items)
-        themes = []
-        bullets_well, bullets_improve = [], []
-        summary = ""
+    return [
+        Stage(
+            "anonymize",
+            _aanonymize_stage if asynchronous else _anonymize_stage,
+            deps=("aggregate",),
+            timeout=stage_timeout("anonymize"),
+            fallback=_raw_highlights,
+        ),
+        Stage(
+            "themes",
+            _athemes_stage if asynchronous else _themes_stage,
+            deps=("anonymize",),
+            timeout=stage_timeout("themes"),
+            fallback=lambda _results: [],
+        ),
+        Stage(
+            "summary",
+            _asummary_stage if asynchronous else _summary_stage,
+            deps=("anonymize", "themes"),
+            timeout=stage_timeout("summary"),
+            fallback=lambda _results: "",
+        ),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Conversion helpers
+# ---------------------------------------------------------------------------
+def context_from_results(
+    processed: ProcessedFeedback, results: Results
+) -> ReportContext:
+    """Assemble a :class:`ReportContext` from finished analysis stages."""
+
+    highlights: _Highlights = results["anonymize"]
 
     # Cap comments to avoid overly long Slack messages
-    anonymized_items = anonymized_items[: config.MAX_COMMENTS]
+    anonymized_items = highlights.items[: config.MAX_COMMENTS]
 
     # Participation stats packaging
     stats = Stats(
@@ -203,11 +303,44 @@ def build_report_context(processed: ProcessedFeedback) -> ReportContext:  # noqa
         stats=stats,
         emoji_bar=_emoji_bar(processed.sentiment_counts, config.MAX_EMOJI_BAR),
         sentiment_counts=processed.sentiment_counts,
-        themes=themes,
-        bullets_well=bullets_well,
-        bullets_improve=bullets_improve,
+        themes=results["themes"],
+        bullets_well=highlights.bullets_well,
+        bullets_improve=highlights.bullets_improve,
         all_items=anonymized_items,
-        summary=summary,
+        summary=results["summary"],
         version=os.getenv("REPORT_VERSION", "0.1"),
         reason=processed.reason,
     )
+
+
+def _context_stages(
+    processed: ProcessedFeedback, *, asynchronous: bool = False
+) -> Sequence[Stage]:
+    return [
+        Stage("aggregate", lambda _results: processed),
+        *analysis_stages(asynchronous=asynchronous),
+    ]
+
+
+def build_report_context(processed: ProcessedFeedback) -> ReportContext:  # noqa: WPS231
+    """Convert ``ProcessedFeedback`` into :class:`ReportContext`.
+
+    The function is *pure* – it does not mutate *processed* and will
+    swallow non-critical errors (anonymization/theme extraction) so that
+    downstream rendering always succeeds: every analysis stage falls back
+    to raw data on failure or timeout.
+    """
+
+    stages = _context_stages(processed)
+    run = run_stages(stages)
+    run.log_summary(processed.session_id, stages)
+    return context_from_results(processed, run.results)
+
+
+async def abuild_report_context(processed: ProcessedFeedback) -> ReportContext:
+    """Asyncio twin of :func:`build_report_context` with the same fallbacks."""
+
+    stages = _context_stages(processed, asynchronous=True)
+    run = await arun_stages(stages)
+    run.log_summary(processed.session_id, stages)
+    return context_from_results(processed, run.results)
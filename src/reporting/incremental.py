@@ -0,0 +1,132 @@
+"""Incremental analysis of feedback as it is submitted.
+
+Without this, every OpenAI call for a session happens in one burst when the
+session completes or expires.  With ``REPORT_INCREMENTAL_ANALYSIS`` enabled,
+each new feedback item is scored for sentiment (unless the participant picked
+a label, see ``REPORT_SENTIMENT_MODE``) – and, if it will appear among
+the report highlights, anonymized – on the ``"incremental"`` analysis pool as
+soon as it arrives.  Results are memoized on the :class:`SessionData`
+(``item_sentiments`` / ``anonymized_quotes``) and picked up by the report
+stages, so at the deadline only themes and summary remain.  Stores that hand
+out copies of a session (Redis) pass a *save_results* callback so the new
+results reach the copy the report is built from.
+
+Failures are not memoized; the report pipeline simply analyses those items
+itself.
+"""
+from __future__ import annotations
+
+import logging
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional
+
+from src.analysis.anonymize import UNREDACTED_PREFIX, anonymize_quotes
+from src.analysis.concurrency import submit
+from src.analysis.sentiment import analyze_sentiment
+from src.feedback_record import FeedbackEntry, to_record
+from src.openai_client import ai_available
+from src.reporting import config
+from src.reporting.aggregator import needs_model_sentiment
+from src.reporting.context import highlight_texts
+from src.session_data import SessionData
+
+__all__ = [
+    "SaveResults",
+    "analyze_feedback_item",
+    "enqueue_feedback_analysis",
+]
+
+# (session_id, new item sentiments, new anonymized quotes) -> None
+SaveResults = Callable[[str, Dict[str, str], Dict[str, str]], None]
+
+logger = logging.getLogger(__name__)
+
+
+def analyze_feedback_item(session: SessionData, item: FeedbackEntry) -> None:
+    """Score and (if needed) anonymize *item*, memoizing results on *session*."""
+
+    if not ai_available():
+        logger.debug(
+            "OpenAI circuit open; deferring analysis for session %s",
+            session.session_id,
+        )
+        return
+
+    record = to_record(item)
+    text = record.free_text
+    if needs_model_sentiment(record) and text not in session.item_sentiments:
+        try:
+            result = analyze_sentiment(text)
+        except Exception as exc:  # noqa: BLE001 – report pipeline will retry
+            logger.warning(
+                "Incremental sentiment failed for session %s: %s",
+                session.session_id,
+                exc,
+            )
+        else:
+            session.item_sentiments[text] = result.label.value
+
+    # Only the first few items become report highlights; anonymizing the
+    # rest would be wasted calls.
+    try:
+        position = session.feedback_items.index(item)
+    except ValueError:
+        return
+    if position >= config.MAX_BULLETS_EACH:
+        return
+
+    texts, _ = highlight_texts([record])
+    missing = [t for t in texts if t not in session.anonymized_quotes]
+    for raw, anonymized in zip(missing, anonymize_quotes(missing)):
+        if not anonymized.startswith(UNREDACTED_PREFIX):
+            session.anonymized_quotes[raw] = anonymized
+
+
+def _analyze_and_save(
+    session: SessionData, item: FeedbackEntry, save_results: SaveResults
+) -> None:
+    """Run :func:`analyze_feedback_item` and hand only the new results on."""
+
+    known_sentiments = set(session.item_sentiments)
+    known_quotes = set(session.anonymized_quotes)
+    analyze_feedback_item(session, item)
+    sentiments = {
+        text: label
+        for text, label in session.item_sentiments.items()
+        if text not in known_sentiments
+    }
+    quotes = {
+        raw: anonymized
+        for raw, anonymized in session.anonymized_quotes.items()
+        if raw not in known_quotes
+    }
+    if sentiments or quotes:
+        save_results(session.session_id, sentiments, quotes)
+
+
+def enqueue_feedback_analysis(
+    session: SessionData,
+    item: FeedbackEntry,
+    save_results: Optional[SaveResults] = None,
+) -> Optional[Future]:
+    """Queue background analysis of *item* if incremental analysis is enabled.
+
+    *save_results*, if given, receives the results memoized by the job.
+    Returns the future of the queued job, or *None* when disabled.
+    """
+
+    if not config.INCREMENTAL_ANALYSIS:
+        return None
+
+    if save_results is None:
+        future = submit("incremental", analyze_feedback_item, session, item)
+    else:
+        future = submit("incremental", _analyze_and_save, session, item, save_results)
+    future.add_done_callback(_log_failure)
+    return future
+
+
+def _log_failure(future: Future) -> None:
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Incremental analysis job failed: %s", exc, exc_info=exc)
@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, List
 
+from src.feedback_record import FeedbackRecord
+
 
 @dataclass(slots=True)
 class ProcessedFeedback:
@@ -18,6 +20,10 @@ class ProcessedFeedback:
     stats: Dict[str, Any] = field(default_factory=dict)
     # Optional reason / context for the feedback session
     reason: str | None = None
+    # Highlight quotes anonymized ahead of time (raw text -> anonymized text)
+    anonymized_quotes: Dict[str, str] = field(default_factory=dict)
+    # Typed submissions behind ``all_items`` (empty when built from strings)
+    records: List[FeedbackRecord] = field(default_factory=list)
 
     def participation_ratio(self) -> float:
         """Return fraction of participants who submitted (0‒1)."""
@@ -1,14 +1,37 @@
-"""Render feedback reports using Jinja2 templates."""
+"""Render feedback reports using Jinja2 templates.
+
+A full session report runs as a stage DAG (see :mod:`src.reporting.stages`):
+aggregation, sentiment scoring, anonymization, themes, summary and template
+rendering, with independent stages overlapping.
+
+Reports can be produced by the classic threaded pipeline or, when
+``REPORT_ASYNC_PIPELINE`` is enabled, by the asyncio-native pipeline running on
+the shared event loop in :mod:`src.async_runtime`.  :func:`dispatch_report` and
+:func:`dispatch_session_report` pick the pipeline for callers.
+"""
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import logging
+from concurrent.futures import Future
 from pathlib import Path
-from typing import List
+from typing import Any, List, Optional, Tuple
 
 from jinja2 import Environment, FileSystemLoader
 
-from src.reporting.aggregator import ProcessedFeedback
-from src.reporting.context import build_report_context
+from src.async_runtime import run_coroutine
+from src.reporting import config
+from src.reporting.aggregator import ProcessedFeedback, aggregation_stages
+from src.reporting.context import (
+    ReportContext,
+    abuild_report_context,
+    analysis_stages,
+    build_report_context,
+    context_from_results,
+)
+from src.reporting.stages import Results, Stage, arun_stages, run_stages
+from src.session_data import SessionData
 
 logger = logging.getLogger(__name__)
 
@@ -46,69 +69,101 @@ def _emoji_bar(counts: dict[str, int], max_emoji: int = 20) -> str:  # pragma: n
     return pos_e + neu_e + neg_e
 
 
-def _split_highlights(items: List[str], *, max_each: int = 5):
-    """Return (well, improve) bullet lists extracted from structured items."""
-    well: List[str] = []
-    improve: List[str] = []
-
-    for it in items:
-        # naive parse of "well=..., improve=..." pattern
-        if "well=" in it:
-            _, after = it.split("well=", 1)
-            txt = after.split(",", 1)[0].strip()
-            well.append(f"• {txt}")
-        if "improve=" in it:
-            _, after = it.split("improve=", 1)
-            txt = after.strip()
-            improve.append(f"• {txt}")
-
-    return well[:max_each], improve[:max_each]
-
-
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
 
+def _render_context(context: ReportContext) -> str:
+    template = _env.get_template("report.md.j2")
+    return template.render(**context.to_dict())
+
+
 def render_report(processed: ProcessedFeedback) -> str:
     """Render a Slack-friendly markdown report from ``ProcessedFeedback``."""
 
     # Build context (handles anonymization, themes, stats, etc.)
-    context = build_report_context(processed)
+    return _render_context(build_report_context(processed))
 
-    template = _env.get_template("report.md.j2")
-    return template.render(**context.to_dict())
 
+async def arender_report(processed: ProcessedFeedback) -> str:
+    """Asyncio twin of :func:`render_report`."""
 
-def post_report_to_slack(
-    *, processed: ProcessedFeedback, client, channel: str
-):  # pragma: no cover
-    """Send report to Slack *channel* using *client* (WebClient)."""
+    return _render_context(await abuild_report_context(processed))
 
-    # ------------------------------------------------------------------
-    # 1. Post parent message
-    # ------------------------------------------------------------------
 
-    title_part = f"'{processed.reason}'" if processed.reason else processed.session_id
+def _render_stage(results: Results) -> Tuple[ProcessedFeedback, str]:
+    processed = dataclasses.replace(
+        results["aggregate"], sentiment_counts=results["sentiment"]
+    )
+    return processed, _render_context(context_from_results(processed, results))
+
+
+def session_report_stages(
+    session: SessionData, *, asynchronous: bool = False
+) -> List[Stage]:
+    """Return the full report DAG for *session*.
+
+    ``aggregate`` feeds ``sentiment`` and ``anonymize``, which run
+    concurrently; ``themes`` and ``summary`` follow ``anonymize``; ``render``
+    waits for everything.
+    """
+
+    return [
+        *aggregation_stages(session, asynchronous=asynchronous),
+        *analysis_stages(asynchronous=asynchronous),
+        Stage(
+            "render",
+            _render_stage,
+            deps=("aggregate", "sentiment", "anonymize", "themes", "summary"),
+        ),
+    ]
+
+
+def build_session_report(session: SessionData) -> Tuple[ProcessedFeedback, str]:
+    """Run the report DAG for *session* and return its data and markdown."""
+
+    stages = session_report_stages(session)
+    run = run_stages(stages)
+    run.log_summary(session.session_id, stages)
+    report: Tuple[ProcessedFeedback, str] = run.results["render"]
+    return report
+
+
+async def abuild_session_report(
+    session: SessionData,
+) -> Tuple[ProcessedFeedback, str]:
+    """Asyncio twin of :func:`build_session_report`."""
+
+    stages = session_report_stages(session, asynchronous=True)
+    run = await arun_stages(stages)
+    run.log_summary(session.session_id, stages)
+    report: Tuple[ProcessedFeedback, str] = run.results["render"]
+    return report
+
+
+def _post_parent(client, *, channel: str, session_id: str, reason: Optional[str]):
+    title_part = f"'{reason}'" if reason else session_id
     parent_resp = client.chat_postMessage(
         channel=channel,
         text=f"*Sentiment Report for {title_part}*",
     )
+    return parent_resp["ts"]
+
+
+def _post_thread(
+    client, *, channel: str, session_id: str, parent_ts: str, report_text: str
+) -> None:
+    """Post *report_text* under *parent_ts* as a message or, if long, a file."""
 
-    parent_ts = parent_resp["ts"]
-    report_text = render_report(processed)
     report_len = len(report_text)
     logger.debug(
         "Report generated for session=%s channel=%s len=%d",
-        processed.session_id,
+        session_id,
         channel,
         report_len,
     )
 
-    # ------------------------------------------------------------------
-    # 2. Post threaded report (message or file)
-    # ------------------------------------------------------------------
-
     if report_len < 12000:
         logger.debug("Posting report as chat message (len=%d < 2800)", report_len)
         client.chat_postMessage(
@@ -123,8 +178,172 @@ def post_report_to_slack(
         # Upload as a file if too long using the modern Slack endpoint
         client.files_upload_v2(
             channel=channel,
-            title=f"Feedback Report {processed.session_id}",
+            title=f"Feedback Report {session_id}",
             content=report_text,
-            filename=f"feedback_{processed.session_id}.md",
+            filename=f"feedback_{session_id}.md",
             thread_ts=parent_ts,
         )
+
+
+def post_report_to_slack(
+    *, processed: ProcessedFeedback, client, channel: str
+):  # pragma: no cover
+    """Send report to Slack *channel* using *client* (WebClient)."""
+
+    # ------------------------------------------------------------------
+    # 1. Post parent message
+    # ------------------------------------------------------------------
+    parent_ts = _post_parent(
+        client,
+        channel=channel,
+        session_id=processed.session_id,
+        reason=processed.reason,
+    )
+
+    # ------------------------------------------------------------------
+    # 2. Post threaded report (message or file)
+    # ------------------------------------------------------------------
+    _post_thread(
+        client,
+        channel=channel,
+        session_id=processed.session_id,
+        parent_ts=parent_ts,
+        report_text=render_report(processed),
+    )
+
+
+def post_session_report(
+    session: SessionData, *, client, channel: str
+) -> ProcessedFeedback:
+    """Aggregate *session*, post its report to *channel* and return the data.
+
+    Unlike :func:`post_report_to_slack`, sentiment scoring runs as a stage of
+    the report DAG, overlapping anonymization and theme extraction.
+    """
+
+    parent_ts = _post_parent(
+        client, channel=channel, session_id=session.session_id, reason=session.reason
+    )
+    processed, report_text = build_session_report(session)
+    logger.info(
+        "Aggregated feedback for %s: sentiments=%s, stats=%s",
+        session.session_id,
+        processed.sentiment_counts,
+        processed.stats,
+    )
+    _post_thread(
+        client,
+        channel=channel,
+        session_id=session.session_id,
+        parent_ts=parent_ts,
+        report_text=report_text,
+    )
+    return processed
+
+
+async def apost_report_to_slack(
+    *, processed: ProcessedFeedback, client, channel: str
+) -> None:
+    """Asyncio twin of :func:`post_report_to_slack`.
+
+    Analysis runs as coroutines; the blocking Slack SDK calls are pushed to a
+    worker thread so they never stall the event loop.
+    """
+
+    parent_ts = await asyncio.to_thread(
+        _post_parent,
+        client,
+        channel=channel,
+        session_id=processed.session_id,
+        reason=processed.reason,
+    )
+    report_text = await arender_report(processed)
+    await asyncio.to_thread(
+        _post_thread,
+        client,
+        channel=channel,
+        session_id=processed.session_id,
+        parent_ts=parent_ts,
+        report_text=report_text,
+    )
+
+
+async def apost_session_report(
+    session: SessionData, *, client, channel: str
+) -> ProcessedFeedback:
+    """Asyncio twin of :func:`post_session_report`."""
+
+    parent_ts = await asyncio.to_thread(
+        _post_parent,
+        client,
+        channel=channel,
+        session_id=session.session_id,
+        reason=session.reason,
+    )
+    processed, report_text = await abuild_session_report(session)
+    await asyncio.to_thread(
+        _post_thread,
+        client,
+        channel=channel,
+        session_id=session.session_id,
+        parent_ts=parent_ts,
+        report_text=report_text,
+    )
+    return processed
+
+
+def _log_async_failure(session_id: str, future: "Future[Any]") -> None:
+    if future.cancelled():
+        logger.warning("Async report for session %s was cancelled", session_id)
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.error(
+            "Failed to post report for session %s: %s",
+            session_id,
+            exc,
+            exc_info=exc,
+        )
+
+
+def dispatch_report(
+    *, processed: ProcessedFeedback, client, channel: str
+) -> Optional["Future[None]"]:
+    """Post a report via the configured pipeline.
+
+    With ``REPORT_ASYNC_PIPELINE`` disabled (the default) this is
+    :func:`post_report_to_slack` and returns *None* once the report is posted.
+    Otherwise the report is scheduled on the shared event loop and the
+    returned future resolves when it has been posted; failures are logged.
+    """
+
+    if not config.ASYNC_PIPELINE:
+        post_report_to_slack(processed=processed, client=client, channel=channel)
+        return None
+
+    future = run_coroutine(
+        apost_report_to_slack(processed=processed, client=client, channel=channel)
+    )
+    future.add_done_callback(lambda fut: _log_async_failure(processed.session_id, fut))
+    return future
+
+
+def dispatch_session_report(
+    session: SessionData, *, client, channel: str
+) -> Optional["Future[ProcessedFeedback]"]:
+    """Aggregate *session* and post its report via the configured pipeline.
+
+    Behaves like :func:`dispatch_report`, but runs the whole report DAG –
+    including sentiment scoring – via :func:`post_session_report` or its
+    asyncio twin.
+    """
+
+    if not config.ASYNC_PIPELINE:
+        post_session_report(session, client=client, channel=channel)
+        return None
+
+    future = run_coroutine(
+        apost_session_report(session, client=client, channel=channel)
+    )
+    future.add_done_callback(lambda fut: _log_async_failure(session.session_id, fut))
+    return future
@@ -0,0 +1,314 @@
+"""Dependency-graph execution of report pipeline stages.
+
+A report is built from a handful of stages – aggregate, sentiment,
+anonymize, themes, summary and render.  Only some of them depend on each
+other (themes need anonymized quotes, the summary needs themes, …), so
+:func:`run_stages` starts every stage as soon as its dependencies finished.
+Independent stages such as *sentiment* and *anonymize* overlap, making the
+wall-clock time the longest dependency chain rather than the sum of all
+stages.
+
+Each :class:`Stage` may carry a timeout and a fallback.  A stage that fails
+or overruns its timeout yields its fallback value so downstream stages – and
+ultimately the report – still complete.  Every run records per-stage
+:class:`StageTiming` entries for observability.
+
+Timeouts are read from the environment:
+
+• ``REPORT_STAGE_TIMEOUT_<STAGE>`` – timeout for one stage, e.g.
+  ``REPORT_STAGE_TIMEOUT_SUMMARY=20``.
+• ``REPORT_STAGE_TIMEOUT`` – fallback timeout for every stage (default 120 s).
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+__all__ = [
+    "Stage",
+    "StageError",
+    "StageRun",
+    "StageTiming",
+    "arun_stages",
+    "run_stages",
+    "stage_timeout",
+]
+
+_logger = logging.getLogger(__name__)
+
+_DEFAULT_TIMEOUT = 120.0
+
+Results = Mapping[str, Any]
+
+
+class StageError(RuntimeError):
+    """Raised when a stage without a fallback fails or times out."""
+
+
+@dataclass(frozen=True, slots=True)
+class Stage:
+    """One node of the report pipeline.
+
+    *func* receives the results of all finished stages (keyed by name) and
+    returns this stage's result; for :func:`arun_stages` it may be a coroutine
+    function.  *fallback* is called the same way when *func* fails or times
+    out.
+    """
+
+    name: str
+    func: Callable[[Results], Any]
+    deps: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    fallback: Optional[Callable[[Results], Any]] = None
+
+
+@dataclass(frozen=True, slots=True)
+class StageTiming:
+    """When a stage ran, for how long, and how it ended."""
+
+    name: str
+    started: float  # seconds since the run started
+    duration: float
+    status: str  # "ok", "failed" or "timeout"
+
+
+@dataclass(slots=True)
+class StageRun:
+    """Results and timings of one :func:`run_stages` call."""
+
+    results: Dict[str, Any] = field(default_factory=dict)
+    timings: Dict[str, StageTiming] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+
+    def critical_path(self, stages: Sequence[Stage]) -> Tuple[List[str], float]:
+        """Return the slowest dependency chain and its total duration."""
+
+        by_name = {stage.name: stage for stage in stages}
+        best: Dict[str, Tuple[List[str], float]] = {}
+        for name in _topological_order(stages):
+            own = self.timings[name].duration if name in self.timings else 0.0
+            chain, total = max(
+                (best[dep] for dep in by_name[name].deps),
+                key=lambda item: item[1],
+                default=([], 0.0),
+            )
+            best[name] = (chain + [name], total + own)
+        return max(best.values(), key=lambda item: item[1], default=([], 0.0))
+
+    def log_summary(self, label: str, stages: Sequence[Stage]) -> None:
+        """Log per-stage timings plus the critical path for *label*."""
+
+        path, seconds = self.critical_path(stages)
+        _logger.info(
+            "Report stages for %s finished in %.2fs (critical path %s = %.2fs): %s",
+            label,
+            self.wall_seconds,
+            " → ".join(path),
+            seconds,
+            ", ".join(
+                f"{t.name}={t.duration:.2f}s"
+                + ("" if t.status == "ok" else f"[{t.status}]")
+                for t in self.timings.values()
+            ),
+        )
+
+
+def _parse_timeout(raw: Optional[str]) -> Optional[float]:
+    if not raw:
+        return None
+    try:
+        parsed = float(raw)
+    except ValueError:
+        _logger.warning("Ignoring non-numeric report stage timeout '%s'", raw)
+        return None
+    if parsed <= 0:
+        _logger.warning("Ignoring report stage timeout %s (must be positive)", raw)
+        return None
+    return parsed
+
+
+def stage_timeout(name: str) -> float:
+    """Return the configured timeout in seconds for the stage *name*."""
+
+    specific = _parse_timeout(os.getenv(f"REPORT_STAGE_TIMEOUT_{name.upper()}"))
+    if specific is not None:
+        return specific
+    return _parse_timeout(os.getenv("REPORT_STAGE_TIMEOUT")) or _DEFAULT_TIMEOUT
+
+
+def _topological_order(stages: Sequence[Stage]) -> List[str]:
+    """Validate the graph and return stage names in dependency order."""
+
+    by_name: Dict[str, Stage] = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise ValueError(f"Duplicate stage '{stage.name}'")
+        by_name[stage.name] = stage
+    for stage in stages:
+        for dep in stage.deps:
+            if dep not in by_name:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown '{dep}'")
+
+    order: List[str] = []
+    done: set[str] = set()
+    remaining = list(stages)
+    while remaining:
+        ready = [s for s in remaining if all(dep in done for dep in s.deps)]
+        if not ready:
+            raise ValueError("Report stages contain a dependency cycle")
+        for stage in ready:
+            order.append(stage.name)
+            done.add(stage.name)
+        remaining = [s for s in remaining if s.name not in done]
+    return order
+
+
+def _resolve_failure(
+    stage: Stage, results: Results, status: str, exc: Optional[BaseException]
+) -> Any:
+    """Return *stage*'s fallback value or raise :class:`StageError`."""
+
+    if stage.fallback is None:
+        raise StageError(f"Report stage '{stage.name}' {status}") from exc
+    _logger.warning(
+        "Report stage '%s' %s (%s); using fallback",
+        stage.name,
+        status,
+        exc if exc is not None else f"after {stage.timeout}s",
+    )
+    return stage.fallback(results)
+
+
+def run_stages(stages: Sequence[Stage]) -> StageRun:
+    """Run *stages* on threads, each as soon as its dependencies are done.
+
+    A stage that overruns its timeout is abandoned – its thread finishes in
+    the background but the result is ignored – and its fallback is used.
+
+    Raises
+    ------
+    StageError
+        If a stage without a fallback fails or times out.
+    ValueError
+        If the stage graph is invalid (unknown dependency, cycle, duplicate).
+    """
+
+    _topological_order(stages)
+    run = StageRun()
+    start = time.monotonic()
+    pending = list(stages)
+    # stage name → (future, started offset, deadline)
+    running: Dict[str, Tuple[Future[Any], float, Optional[float]]] = {}
+    by_future: Dict[Future[Any], Stage] = {}
+
+    pool = ThreadPoolExecutor(
+        max_workers=max(1, len(stages)), thread_name_prefix="report-stage"
+    )
+
+    def _finish(stage: Stage, status: str, value: Any) -> None:
+        _future, started, _deadline = running.pop(stage.name)
+        run.results[stage.name] = value
+        run.timings[stage.name] = StageTiming(
+            stage.name, started, time.monotonic() - start - started, status
+        )
+
+    try:
+        while pending or running:
+            for stage in [s for s in pending if all(d in run.results for d in s.deps)]:
+                pending.remove(stage)
+                offset = time.monotonic() - start
+                snapshot = dict(run.results)
+                future = pool.submit(stage.func, snapshot)
+                deadline = (
+                    start + offset + stage.timeout
+                    if stage.timeout is not None
+                    else None
+                )
+                running[stage.name] = (future, offset, deadline)
+                by_future[future] = stage
+
+            deadlines = [d for _f, _o, d in running.values() if d is not None]
+            timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            done, _ = wait(
+                [f for f, _o, _d in running.values()],
+                timeout=timeout,
+                return_when=FIRST_COMPLETED,
+            )
+
+            for future in done:
+                stage = by_future.pop(future)
+                exc = future.exception()
+                if exc is None:
+                    _finish(stage, "ok", future.result())
+                else:
+                    value = _resolve_failure(stage, run.results, "failed", exc)
+                    _finish(stage, "failed", value)
+
+            now = time.monotonic()
+            for name, (future, _offset, deadline) in list(running.items()):
+                if deadline is not None and now >= deadline and not future.done():
+                    stage = by_future.pop(future)
+                    future.cancel()
+                    value = _resolve_failure(stage, run.results, "timed out", None)
+                    _finish(stage, "timeout", value)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    run.wall_seconds = time.monotonic() - start
+    return run
+
+
+async def arun_stages(stages: Sequence[Stage]) -> StageRun:
+    """Asyncio twin of :func:`run_stages`.
+
+    Stage functions may be coroutine functions or plain callables; plain
+    callables run on a worker thread via :func:`asyncio.to_thread`.
+    """
+
+    order = _topological_order(stages)
+    by_name = {stage.name: stage for stage in stages}
+    run = StageRun()
+    start = time.monotonic()
+    done_events = {name: asyncio.Event() for name in order}
+
+    async def _invoke(stage: Stage, results: Results) -> Any:
+        if inspect.iscoroutinefunction(stage.func):
+            return await stage.func(results)
+        return await asyncio.to_thread(stage.func, results)
+
+    async def _run_one(stage: Stage) -> None:
+        for dep in stage.deps:
+            await done_events[dep].wait()
+        offset = time.monotonic() - start
+        snapshot = dict(run.results)
+        try:
+            value = await asyncio.wait_for(_invoke(stage, snapshot), stage.timeout)
+            status = "ok"
+        except asyncio.TimeoutError:
+            status = "timeout"
+            value = _resolve_failure(stage, run.results, "timed out", None)
+        except Exception as exc:  # noqa: BLE001 – handled via fallback
+            status = "failed"
+            value = _resolve_failure(stage, run.results, "failed", exc)
+        run.results[stage.name] = value
+        run.timings[stage.name] = StageTiming(
+            stage.name, offset, time.monotonic() - start - offset, status
+        )
+        done_events[stage.name].set()
+
+    tasks = [asyncio.create_task(_run_one(by_name[name])) for name in order]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    run.wall_seconds = time.monotonic() - start
+    return run
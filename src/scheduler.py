@@ -7,28 +7,86 @@ and keeps the main application thread unblocked.
 
 The scheduler supports:
 • schedule() – run a callable after a delay (seconds) and returns a task id.
-• shutdown() – stop the scheduler gracefully, ensuring pending tasks are
-  dispatched before exit.
+• cancel() – drop a task that has not been dispatched yet.
+• reschedule() – move a pending task to a new delay, keeping its id.
+• shutdown() – stop the background thread.  Tasks that are not due yet are
+  dropped; durable ones stay in the journal for replay().
 
-Cancellation can be added later if required.
+Pending tasks are kept by one of two engines:
+
+• ``"heap"`` (default) – a binary heap; O(log n) insert.  Cancelled entries
+  are deleted lazily: they stay in the heap, flagged, and are skipped when
+  they reach the top.  Once they make up more than half of the heap it is
+  compacted, so a burst of cancellations cannot grow it unboundedly.
+• ``"wheel"`` – a hierarchical timing wheel with O(1) insert and cancel.
+  Time advances in ticks of *resolution* seconds and every task due in a
+  tick is dispatched as one batch; tasks may run up to one tick late.  Use
+  it for tens of thousands of timers (per-user reminders, nudges, …).
+
+Either way the background thread is only woken by ``schedule`` when the new
+task is due before the time it is already sleeping until.
+
+Timing uses ``time.monotonic()`` throughout, so wall-clock steps (NTP, DST,
+manual changes) cannot fire tasks early or late; wall-clock times appear only
+in the journal, converted when tasks are written and replayed.
+
+:meth:`Scheduler.stats` reports queue-depth gauges (tasks pending in the
+scheduler, waiting in the executor, running) and two histograms: *dispatch
+lag* (callback start minus ``run_at``) and *queue wait* (callback start minus
+hand-off to the executor).  Growing queue wait means the executor is
+saturated and timers are slipping.
+
+Durable tasks
+-------------
+Callbacks cannot be persisted, so durable tasks name a *kind* registered with
+:meth:`Scheduler.register_task` and pass JSON-serialisable arguments to
+:meth:`Scheduler.schedule_task`.  They are written to a
+:class:`~src.scheduler_journal.SchedulerJournal` and removed once their
+callback has run (so a crash mid-callback runs it again – callbacks must be
+idempotent).  :meth:`Scheduler.replay` re-queues journaled tasks on boot;
+those that fell due while the process was down are dispatched in bursts of
+*catchup_burst* tasks every *catchup_interval* seconds instead of all at once.
 """
 from __future__ import annotations
 
 import heapq
 import itertools
 import logging
+import math
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Callable, Tuple
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from src.executor_lanes import LaneFullError
+from src.metrics import Histogram
+from src.scheduler_journal import SchedulerJournal
 
 logger = logging.getLogger(__name__)
 
+# Compact only when this many cancelled entries are waiting in the heap.
+_COMPACT_MIN_CANCELLED = 64
+
+ENGINES = ("heap", "wheel")
+DEFAULT_RESOLUTION = 0.01  # seconds per timing-wheel tick
+_LAG_WARNING_EVERY = 60.0  # seconds between two "tasks are late" warnings
+_LANE_FULL_RETRY = 0.1  # seconds before re-offering a task its lane rejected
+
 
 class _ScheduledItem:
     """Internal container for a scheduled callback."""
 
-    __slots__ = ("run_at", "task_id", "callback", "args", "kwargs")
+    __slots__ = (
+        "run_at",
+        "task_id",
+        "callback",
+        "args",
+        "kwargs",
+        "cancelled",
+        "bucket",
+        "kind",
+        "journal_key",
+    )
 
     def __init__(
         self,
@@ -37,30 +95,251 @@ class _ScheduledItem:
         callback: Callable[..., Any],
         args: Tuple[Any, ...],
         kwargs: dict[str, Any],
+        kind: Optional[str] = None,
+        journal_key: Optional[int] = None,
     ) -> None:
         self.run_at = run_at
         self.task_id = task_id
         self.callback = callback
         self.args = args
         self.kwargs = kwargs
+        self.cancelled = False
+        # Timing-wheel slot currently holding the item
+        self.bucket: Optional[Dict[int, _ScheduledItem]] = None
+        # Durable tasks only: registered kind and journal row
+        self.kind = kind
+        self.journal_key = journal_key
 
     # Heap ordering by run_at then task_id ensures stability.
     def __lt__(self, other: "_ScheduledItem") -> bool:  # type: ignore[override]
         return (self.run_at, self.task_id) < (other.run_at, other.task_id)
 
 
+# ----------------------------------------------------------------------
+# Engines (always called with the scheduler lock held)
+# ----------------------------------------------------------------------
+class _HeapQueue:
+    """Binary heap with lazy deletion and periodic compaction."""
+
+    def __init__(self) -> None:
+        self._queue: List[_ScheduledItem] = []
+        self._cancelled = 0
+
+    def push(self, item: _ScheduledItem) -> None:
+        heapq.heappush(self._queue, item)
+
+    def remove(self, item: _ScheduledItem) -> None:
+        item.cancelled = True
+        self._cancelled += 1
+        if self._cancelled < _COMPACT_MIN_CANCELLED:
+            return
+        if self._cancelled * 2 > len(self._queue):
+            self._queue = [i for i in self._queue if not i.cancelled]
+            heapq.heapify(self._queue)
+            self._cancelled = 0
+
+    def _drop_cancelled_head(self) -> None:
+        while self._queue and self._queue[0].cancelled:
+            heapq.heappop(self._queue)
+            self._cancelled -= 1
+
+    def next_deadline(self) -> Optional[float]:
+        self._drop_cancelled_head()
+        return self._queue[0].run_at if self._queue else None
+
+    def pop_due(self, now: float) -> List[_ScheduledItem]:
+        due: List[_ScheduledItem] = []
+        self._drop_cancelled_head()
+        while self._queue and self._queue[0].run_at <= now:
+            due.append(heapq.heappop(self._queue))
+            self._drop_cancelled_head()
+        return due
+
+
+class _TimingWheel:
+    """Hierarchical timing wheel (see the module docstring).
+
+    Level *L* has ``2**bits`` slots of ``2**(bits*L)`` ticks each.  A task is
+    filed in the lowest level whose range covers its distance from the
+    current tick and moves down a level whenever the wheel reaches its slot,
+    until it lands in level 0 and fires.  Tasks beyond the top level wait in
+    an overflow bucket that is re-filed each time the top level turns.
+    """
+
+    def __init__(
+        self,
+        resolution: float = DEFAULT_RESOLUTION,
+        bits: int = 8,
+        levels: int = 4,
+        now: Optional[float] = None,
+    ) -> None:
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+        self._resolution = resolution
+        self._bits = bits
+        self._mask = (1 << bits) - 1
+        self._levels: List[List[Dict[int, _ScheduledItem]]] = [
+            [{} for _ in range(1 << bits)] for _ in range(levels)
+        ]
+        self._overflow: Dict[int, _ScheduledItem] = {}
+        # Tasks whose tick had already passed when they were filed
+        self._ready: Dict[int, _ScheduledItem] = {}
+        # Last tick processed: every task due at or before it was returned.
+        self._tick = self._tick_at(time.monotonic() if now is None else now)
+        self._size = 0
+
+    def _tick_at(self, now: float) -> int:
+        return math.floor(now / self._resolution)
+
+    def push(self, item: _ScheduledItem) -> None:
+        self._file(item)
+        self._size += 1
+
+    def _file(self, item: _ScheduledItem) -> None:
+        # Round up so a task never fires before its run_at.
+        expires = math.ceil(item.run_at / self._resolution)
+        delta = expires - self._tick
+        if delta <= 0:
+            bucket = self._ready
+        else:
+            level = (delta.bit_length() - 1) // self._bits
+            if level >= len(self._levels):
+                bucket = self._overflow
+            else:
+                slot = (expires >> (self._bits * level)) & self._mask
+                bucket = self._levels[level][slot]
+        bucket[item.task_id] = item
+        item.bucket = bucket
+
+    def remove(self, item: _ScheduledItem) -> None:
+        if item.bucket is not None:
+            del item.bucket[item.task_id]
+            item.bucket = None
+            self._size -= 1
+
+    def next_deadline(self) -> Optional[float]:
+        if not self._size:
+            return None
+        if self._ready:
+            return self._tick * self._resolution
+        level0 = self._levels[0]
+        for step in range(1, self._mask + 2):
+            tick = self._tick + step
+            if level0[tick & self._mask] or not tick & self._mask:
+                # Next tick with work: a due slot or a cascade of level 1+.
+                return tick * self._resolution
+        return None  # pragma: no cover – a level-1 boundary is always hit
+
+    def pop_due(self, now: float) -> List[_ScheduledItem]:
+        target = self._tick_at(now)
+        if not self._size:
+            self._tick = max(self._tick, target)
+            return []
+        due: List[_ScheduledItem] = []
+        level0, mask = self._levels[0], self._mask
+        check_empty = True
+        while self._tick < target:
+            if check_empty and not any(level0):
+                # Nothing due before the next cascade; jump to just before it.
+                self._tick = min(target, self._tick | mask)
+                if self._tick == target:
+                    break
+            check_empty = False
+            self._tick += 1
+            if not self._tick & mask:
+                self._cascade()
+                check_empty = True
+            bucket = level0[self._tick & mask]
+            if bucket:
+                due.extend(bucket.values())
+                bucket.clear()
+        # Filed late, or cascaded exactly onto a processed tick
+        due.extend(self._ready.values())
+        self._ready.clear()
+        for item in due:
+            item.bucket = None
+        self._size -= len(due)
+        return due
+
+    def _cascade(self) -> None:
+        tick = self._tick
+        top = len(self._levels) - 1
+        if not tick & ((1 << (self._bits * top)) - 1) and self._overflow:
+            self._refile(self._overflow)
+        # Higher levels first so re-filed tasks can cascade further this tick.
+        for level in range(top, 0, -1):
+            if tick & ((1 << (self._bits * level)) - 1):
+                continue
+            slot = (tick >> (self._bits * level)) & self._mask
+            bucket = self._levels[level][slot]
+            if bucket:
+                self._refile(bucket)
+
+    def _refile(self, bucket: Dict[int, _ScheduledItem]) -> None:
+        items = list(bucket.values())
+        bucket.clear()
+        for item in items:
+            self._file(item)
+
+
 class Scheduler:
     """A minimal, thread-safe scheduler for delayed callbacks."""
 
-    def __init__(self, executor: ThreadPoolExecutor) -> None:
+    def __init__(
+        self,
+        executor: Executor,
+        engine: str = "heap",
+        resolution: float = DEFAULT_RESOLUTION,
+        journal: Optional[SchedulerJournal] = None,
+        catchup_burst: int = 20,
+        catchup_interval: float = 1.0,
+        lag_warning_seconds: float = 5.0,
+    ) -> None:
+        """Start the scheduler thread.
+
+        Args:
+            executor: Pool the due callbacks are submitted to (unless their
+                kind was registered with its own executor).
+            engine: ``"heap"`` or ``"wheel"`` (see the module docstring).
+            resolution: Tick length in seconds for the ``"wheel"`` engine.
+            journal: Where durable tasks are recorded; defaults to nowhere.
+            catchup_burst: Overdue tasks dispatched together by :meth:`replay`.
+            catchup_interval: Seconds between two catch-up bursts.
+            lag_warning_seconds: Log a (rate-limited) warning when a task
+                starts this much later than its ``run_at``.
+        """
+        if engine == "heap":
+            self._queue: Union[_HeapQueue, _TimingWheel] = _HeapQueue()
+        elif engine == "wheel":
+            self._queue = _TimingWheel(resolution)
+        else:
+            raise ValueError(f"Unknown scheduler engine {engine!r}; use {ENGINES}")
         self._executor = executor
+        self.engine = engine
+        self._journal = journal if journal is not None else SchedulerJournal()
+        self._kinds: Dict[str, Callable[..., Any]] = {}
+        self._kind_executors: Dict[str, Executor] = {}
+        self._catchup_burst = max(1, catchup_burst)
+        self._catchup_interval = max(0.0, catchup_interval)
         self._lock = threading.Condition()
-        self._queue: list[_ScheduledItem] = []
+        # Live (not cancelled, not yet dispatched) entries by task id
+        self._entries: Dict[int, _ScheduledItem] = {}
+        # When the loop will next wake on its own (-inf while it is running)
+        self._wake_at = -math.inf
         self._task_counter = itertools.count()
         self._running = True
+        # Instrumentation (see stats()); guarded by ``_stats_lock``.
+        self._stats_lock = threading.Lock()
+        self._dispatch_lag = Histogram()
+        self._queue_wait = Histogram()
+        self._executor_queued = 0
+        self._executor_running = 0
+        self._dispatched = 0
+        self._lag_warning = lag_warning_seconds
+        self._last_lag_warning = -math.inf
         self._thread = threading.Thread(target=self._run, daemon=True, name="scheduler")
         self._thread.start()
-        logger.info("Scheduler started.")
+        logger.info("Scheduler started (engine=%s).", engine)
 
     # ---------------------------------------------------------------------
     # Public API
@@ -78,22 +357,198 @@ class Scheduler:
         """
         if delay_seconds < 0:
             raise ValueError("delay_seconds must be non-negative")
-        run_at = time.time() + delay_seconds
+        run_at = time.monotonic() + delay_seconds
         task_id = next(self._task_counter)
         item = _ScheduledItem(run_at, task_id, callback, args, kwargs)
         with self._lock:
-            heapq.heappush(self._queue, item)
-            self._lock.notify()
+            self._push(item)
         return task_id
 
+    def register_task(
+        self,
+        kind: str,
+        callback: Callable[..., Any],
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """Make *callback* available to :meth:`schedule_task` as *kind*.
+
+        Tasks of this kind run on *executor* when given (e.g. a heavier
+        executor lane), otherwise on the scheduler's executor.  Register
+        every kind before :meth:`replay` so journaled tasks resolve.
+        """
+        self._kinds[kind] = callback
+        if executor is not None:
+            self._kind_executors[kind] = executor
+
+    def schedule_task(self, kind: str, delay_seconds: float, *args: Any) -> int:
+        """Durably schedule the task registered as *kind* (see module docs).
+
+        *args* must be JSON-serialisable.  Returns a unique integer task id
+        usable with :meth:`cancel` and :meth:`reschedule`.
+        """
+        if kind not in self._kinds:
+            raise ValueError(f"Unknown task kind {kind!r}; register it first")
+        if delay_seconds < 0:
+            raise ValueError("delay_seconds must be non-negative")
+        run_at = time.monotonic() + delay_seconds
+        key = self._journal.add(kind, args, time.time() + delay_seconds)
+        return self._queue_task(kind, run_at, args, key)
+
+    def replay(self) -> List[Tuple[int, str, Tuple[Any, ...]]]:
+        """Re-queue the journaled tasks of a previous run.
+
+        Returns ``(task_id, kind, args)`` for every re-queued task so callers
+        can rebuild their own bookkeeping (e.g. timers to cancel later).
+        """
+        wall_now, now = time.time(), time.monotonic()
+        replayed: List[Tuple[int, str, Tuple[Any, ...]]] = []
+        overdue = 0
+        for key, kind, args, wall_run_at in self._journal.load():
+            if kind not in self._kinds:
+                logger.warning("Dropping journaled task of unknown kind %r", kind)
+                self._journal.remove(key)
+                continue
+            if wall_run_at <= wall_now:
+                # Bounded catch-up: a few overdue tasks per interval.
+                run_at = now + (overdue // self._catchup_burst) * self._catchup_interval
+                overdue += 1
+            else:
+                run_at = now + (wall_run_at - wall_now)
+            replayed.append((self._queue_task(kind, run_at, args, key), kind, args))
+        if replayed:
+            logger.info(
+                "Replayed %d journaled task(s), %d overdue", len(replayed), overdue
+            )
+        return replayed
+
+    def cancel(self, task_id: int) -> bool:
+        """Cancel a pending task.
+
+        Returns *True* if the task was pending, *False* if it already ran, was
+        cancelled before or never existed.
+        """
+        with self._lock:
+            item = self._entries.pop(task_id, None)
+            if item is None:
+                return False
+            self._queue.remove(item)
+        if item.journal_key is not None:
+            self._journal.remove(item.journal_key)
+        return True
+
+    def reschedule(self, task_id: int, delay_seconds: float) -> bool:
+        """Run pending task *task_id* after *delay_seconds* from now instead.
+
+        Returns *False* (and does nothing) if the task is no longer pending.
+        """
+        if delay_seconds < 0:
+            raise ValueError("delay_seconds must be non-negative")
+        run_at = time.monotonic() + delay_seconds
+        with self._lock:
+            item = self._entries.get(task_id)
+            if item is None:
+                return False
+            self._queue.remove(item)
+            self._push(
+                _ScheduledItem(
+                    run_at,
+                    task_id,
+                    item.callback,
+                    item.args,
+                    item.kwargs,
+                    item.kind,
+                    item.journal_key,
+                )
+            )
+        if item.journal_key is not None:
+            self._journal.update(item.journal_key, time.time() + delay_seconds)
+        return True
+
+    @property
+    def pending(self) -> int:  # noqa: D401 – property
+        """Number of tasks waiting to be dispatched."""
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue-depth gauges and lag histograms (see module docs)."""
+
+        stats: Dict[str, Any] = {"engine": self.engine, "pending": self.pending}
+        with self._stats_lock:
+            stats.update(
+                executor_queued=self._executor_queued,
+                running=self._executor_running,
+                dispatched=self._dispatched,
+            )
+        stats["dispatch_lag"] = self._dispatch_lag.snapshot()
+        stats["queue_wait"] = self._queue_wait.snapshot()
+        return stats
+
     def shutdown(self) -> None:
-        """Stop the scheduler and wait for the background thread to finish."""
+        """Stop the scheduler and wait for the background thread to finish.
+
+        Durable tasks that are not due yet stay in the journal for
+        :meth:`replay`; the journal is closed.
+        """
         with self._lock:
             self._running = False
             self._lock.notify()
         self._thread.join()
+        self._journal.close()
         logger.info("Scheduler shut down.")
 
+    def _queue_task(
+        self, kind: str, run_at: float, args: Tuple[Any, ...], key: Optional[int]
+    ) -> int:
+        task_id = next(self._task_counter)
+        item = _ScheduledItem(
+            run_at, task_id, self._kinds[kind], tuple(args), {}, kind, key
+        )
+        with self._lock:
+            self._push(item)
+        return task_id
+
+    def _invoke(self, item: _ScheduledItem, submitted_at: float) -> None:
+        """Executor side of a dispatch: record timings, run the callback."""
+        started = time.monotonic()
+        lag = started - item.run_at
+        self._dispatch_lag.observe(lag)
+        self._queue_wait.observe(started - submitted_at)
+        with self._stats_lock:
+            self._executor_queued -= 1
+            self._executor_running += 1
+            warn = (
+                lag > self._lag_warning
+                and started - self._last_lag_warning > _LAG_WARNING_EVERY
+            )
+            if warn:
+                self._last_lag_warning = started
+        if warn:
+            logger.warning(
+                "Scheduled task %s started %.1fs late; stats=%s",
+                item.task_id,
+                lag,
+                self.stats(),
+            )
+        try:
+            item.callback(*item.args, **item.kwargs)
+        finally:
+            with self._stats_lock:
+                self._executor_running -= 1
+            if item.journal_key is not None:
+                # Forget it even on error, or every restart would retry it.
+                self._journal.remove(item.journal_key)
+
+    # ------------------------------------------------------------------
+    # Internal helpers (call with self._lock held)
+    # ------------------------------------------------------------------
+    def _push(self, item: _ScheduledItem) -> None:
+        self._entries[item.task_id] = item
+        self._queue.push(item)
+        # Only wake the loop if the new item is due before it would wake.
+        if item.run_at < self._wake_at:
+            self._lock.notify()
+
     # ------------------------------------------------------------------
     # Internal loop
     # ------------------------------------------------------------------
@@ -102,24 +557,45 @@ class Scheduler:
         while True:
             with self._lock:
                 # Wait until there is a task or we are stopping.
-                while self._running and not self._queue:
+                while self._running and not self._entries:
+                    self._wake_at = math.inf
                     self._lock.wait()
+                    self._wake_at = -math.inf
                 if not self._running:
                     break
-                # Peek at earliest task.
-                next_item = self._queue[0]
-                now = time.time()
-                delay = next_item.run_at - now
-                if delay > 0:
+                now = time.monotonic()
+                due = self._queue.pop_due(now)
+                if not due:
+                    deadline = self._queue.next_deadline()
                     # Sleep until due or until new task arrives / shutdown.
-                    self._lock.wait(timeout=delay)
+                    self._wake_at = math.inf if deadline is None else deadline
+                    self._lock.wait(
+                        timeout=None if deadline is None else max(deadline - now, 0)
+                    )
+                    self._wake_at = -math.inf
                     continue
-                # Task is due.
-                heapq.heappop(self._queue)
+                for item in due:
+                    del self._entries[item.task_id]
             # Submit outside the lock to avoid deadlocks.
-            try:
-                self._executor.submit(next_item.callback, *next_item.args, **next_item.kwargs)  # type: ignore[name-defined]
-            except Exception:  # pragma: no cover – log and keep going
-                logger.exception(
-                    "Error submitting scheduled task %s", next_item.task_id
-                )
+            with self._stats_lock:
+                self._executor_queued += len(due)
+                self._dispatched += len(due)
+            for item in due:
+                executor = self._executor
+                if item.kind is not None:
+                    executor = self._kind_executors.get(item.kind, executor)
+                try:
+                    executor.submit(self._invoke, item, time.monotonic())
+                except LaneFullError:
+                    # Keep the task and offer it again shortly.
+                    with self._stats_lock:
+                        self._executor_queued -= 1
+                        self._dispatched -= 1
+                    with self._lock:
+                        item.run_at = time.monotonic() + _LANE_FULL_RETRY
+                        self._push(item)
+                    logger.debug("Lane full; deferring scheduled task %s", item.task_id)
+                except Exception:  # pragma: no cover – log and keep going
+                    with self._stats_lock:
+                        self._executor_queued -= 1
+                    logger.exception("Error submitting scheduled task %s", item.task_id)
@@ -0,0 +1,127 @@
+"""Durable journal of pending :class:`~src.scheduler.Scheduler` tasks.
+
+Tasks scheduled with :meth:`Scheduler.schedule_task` are recorded here as a
+registered *kind* plus JSON arguments and their wall-clock ``run_at``, and
+forgotten once their callback has run or they are cancelled.  On start-up
+:meth:`Scheduler.replay` re-queues whatever is left, so timers – e.g. the
+expiry of a session that straddles a deploy – survive a restart.
+
+• :class:`SchedulerJournal` – the default; keeps nothing (timers live in
+  memory only, the historical behaviour).
+• :class:`SQLiteSchedulerJournal` – a SQLite file in WAL mode.  Timer writes
+  are rare (a few per session), so each change is committed immediately.
+
+Select the journal with ``SCHEDULER_JOURNAL_PATH``; see :func:`journal_from_env`.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, List, Optional, Sequence, Tuple
+
+__all__ = [
+    "JournalEntry",
+    "SQLiteSchedulerJournal",
+    "SchedulerJournal",
+    "journal_from_env",
+]
+
+_logger = logging.getLogger(__name__)
+
+# (key, kind, args, run_at)
+JournalEntry = Tuple[int, str, Tuple[Any, ...], float]
+
+
+class SchedulerJournal:
+    """Journal interface used by the scheduler; keeps nothing by default."""
+
+    def add(self, kind: str, args: Sequence[Any], run_at: float) -> Optional[int]:
+        """Record a task; returns its key, or *None* if nothing was stored."""
+        return None
+
+    def update(self, key: int, run_at: float) -> None:
+        """Move the task *key* to a new wall-clock *run_at*."""
+
+    def remove(self, key: int) -> None:
+        """Forget the task *key* (it ran or was cancelled)."""
+
+    def load(self) -> List[JournalEntry]:
+        """Return every recorded task, oldest ``run_at`` first."""
+        return []
+
+    def close(self) -> None:
+        """Release resources; later calls are ignored."""
+
+
+class SQLiteSchedulerJournal(SchedulerJournal):
+    """Keep pending tasks in a SQLite file in WAL mode."""
+
+    def __init__(self, path: str) -> None:
+        """Open (or create) the journal at *path*."""
+        self._path = path
+        self._db: Optional[sqlite3.Connection] = sqlite3.connect(
+            path, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS timers ("
+                "seq INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, "
+                "args TEXT NOT NULL, run_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def _execute(self, sql: str, params: Tuple[Any, ...]) -> Optional[int]:
+        with self._lock:
+            if self._db is None:
+                return None  # closed – tasks finishing during shutdown
+            with self._db:
+                return self._db.execute(sql, params).lastrowid
+
+    def add(self, kind: str, args: Sequence[Any], run_at: float) -> Optional[int]:
+        return self._execute(
+            "INSERT INTO timers (kind, args, run_at) VALUES (?, ?, ?)",
+            (kind, json.dumps(list(args)), run_at),
+        )
+
+    def update(self, key: int, run_at: float) -> None:
+        self._execute("UPDATE timers SET run_at = ? WHERE seq = ?", (run_at, key))
+
+    def remove(self, key: int) -> None:
+        self._execute("DELETE FROM timers WHERE seq = ?", (key,))
+
+    def load(self) -> List[JournalEntry]:
+        with self._lock:
+            if self._db is None:
+                return []
+            rows = self._db.execute(
+                "SELECT seq, kind, args, run_at FROM timers ORDER BY run_at, seq"
+            ).fetchall()
+        entries: List[JournalEntry] = []
+        for seq, kind, args, run_at in rows:
+            try:
+                entries.append((seq, kind, tuple(json.loads(args)), run_at))
+            except ValueError:
+                _logger.exception("Dropping unreadable scheduler journal row %s", seq)
+                self.remove(seq)
+        return entries
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+def journal_from_env() -> SchedulerJournal:
+    """Build the journal selected by ``SCHEDULER_JOURNAL_PATH`` (unset: none)."""
+
+    path = os.getenv("SCHEDULER_JOURNAL_PATH", "").strip()
+    if not path:
+        return SchedulerJournal()
+    return SQLiteSchedulerJournal(path)
@@ -0,0 +1,398 @@
+"""Pluggable persistence for :class:`~src.session_store.ThreadSafeSessionStore`.
+
+The store always serves reads from memory; a *backend* only mirrors changes so
+in-flight sessions survive a restart.  Two backends exist:
+
+• :class:`SessionBackend` – the default.  Every hook is a no-op, i.e. sessions
+  live in memory only (the historical behaviour).
+• :class:`SQLiteSessionBackend` – a SQLite file in WAL mode.  Changes are
+  queued and written by a background thread in *group commits* (one
+  transaction per ``commit_interval``), so a modal submission never waits for
+  the disk.  Feedback is stored append-only, one row per submission, which
+  keeps the per-submission write small regardless of session size.
+
+On start-up :meth:`SessionBackend.load_sessions` returns every persisted
+session so the application can re-register expiry timers.
+
+Select the backend with ``SESSION_BACKEND`` (``memory`` or ``sqlite``); see
+:func:`backend_from_env`.  ``SESSION_BACKEND=redis`` instead replaces the whole
+store with :class:`~src.redis_session_store.RedisSessionStore`.
+"""
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.feedback_record import (
+    FeedbackEntry,
+    FeedbackRecord,
+    entry_from_json,
+    entry_to_json,
+)
+from src.session_data import SessionData
+
+__all__ = [
+    "SQLiteSessionBackend",
+    "SessionBackend",
+    "Submission",
+    "backend_from_env",
+    "dump_info",
+    "dump_state",
+    "restore_session",
+]
+
+_logger = logging.getLogger(__name__)
+
+_DEFAULT_COMMIT_INTERVAL = 0.05
+
+Submission = Tuple[Optional[str], FeedbackEntry]
+
+
+class SessionBackend:
+    """Storage interface used by the session store; in-memory by default.
+
+    Subclasses override the hooks below.  The store calls them while holding
+    the affected session's lock, so implementations must only capture state
+    and return quickly – never block on I/O.
+    """
+
+    def add(self, session: SessionData) -> None:
+        """Persist a newly added (or replaced) *session* including its feedback."""
+
+    def update(self, session: SessionData, submissions: List[Submission]) -> None:
+        """Persist changed fields of *session* plus newly added *submissions*."""
+
+    def delete(self, session_id: str) -> None:
+        """Forget the session *session_id*."""
+
+    def load_sessions(self) -> List[SessionData]:
+        """Return every persisted session (used for start-up recovery)."""
+        return []
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until queued changes are durable; *False* on timeout."""
+        return True
+
+    def close(self) -> None:
+        """Flush outstanding changes and release resources."""
+
+
+# ----------------------------------------------------------------------
+# Serialisation helpers
+# ----------------------------------------------------------------------
+
+
+def dump_info(session: SessionData) -> str:
+    """Fields fixed at creation time."""
+    return json.dumps(
+        {
+            "initiator_user_id": session.initiator_user_id,
+            "channel_id": session.channel_id,
+            "target_user_ids": list(session.target_user_ids),
+            "time_limit_minutes": session.time_limit_minutes,
+            "reason": session.reason,
+        }
+    )
+
+
+def dump_state(session: SessionData) -> str:
+    """Small mutable fields, rewritten on every change."""
+    return json.dumps(
+        {
+            "anonymized_summary": session.anonymized_summary,
+            "feedback_sentiment": session.feedback_sentiment,
+            "feedback_well": session.feedback_well,
+            "feedback_improve": session.feedback_improve,
+        }
+    )
+
+
+def restore_session(
+    session_id: str,
+    created_at: float,
+    info: str,
+    state: str,
+    submitted: List[str],
+    feedback: Iterable[Submission],
+) -> SessionData:
+    """Rebuild a :class:`SessionData` from the parts written by a backend.
+
+    *submitted* lists participants known to have submitted; *feedback* is
+    the ``(user_id, item)`` history in submission order.
+    """
+    details: Dict[str, Any] = json.loads(info)
+    session = SessionData(session_id=session_id, **details)
+    session.backdate(datetime.datetime.fromtimestamp(created_at, datetime.timezone.utc))
+    for user_id in submitted:
+        if user_id in session.pending_users:
+            session.pending_users.remove(user_id)
+            session.submitted_users.add(user_id)
+    for submitter, item in feedback:
+        if submitter is not None and submitter in session.pending_users:
+            session.submit(submitter, item)
+        else:
+            session.feedback_items.append(item)
+    fields: Dict[str, Any] = json.loads(state)
+    summary = fields.pop("anonymized_summary", None)
+    for name, value in fields.items():
+        setattr(session, name, value)
+    if summary is not None:
+        session.complete_session(summary)
+    session.take_unsaved()  # already persisted
+    return session
+
+
+# ----------------------------------------------------------------------
+# SQLite backend
+# ----------------------------------------------------------------------
+
+
+class SQLiteSessionBackend(SessionBackend):
+    """Persist sessions to a SQLite file in WAL mode using group commit."""
+
+    def __init__(
+        self, path: str, *, commit_interval: float = _DEFAULT_COMMIT_INTERVAL
+    ) -> None:
+        """Open (or create) the database at *path* and start the writer.
+
+        Args:
+            path: SQLite file to use.
+            commit_interval: Seconds the writer waits after the first queued
+                change so that concurrent changes share one transaction.
+        """
+        self._path = path
+        self._commit_interval = max(0.0, commit_interval)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db_lock = threading.Lock()
+        with self._db_lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            # WAL + NORMAL is durable across application crashes; only an OS
+            # crash can lose the last commit.
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "session_id TEXT PRIMARY KEY, created_at REAL NOT NULL, "
+                "info TEXT NOT NULL, state TEXT NOT NULL, "
+                "submitted TEXT NOT NULL DEFAULT '[]')"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS feedback ("
+                "seq INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "session_id TEXT NOT NULL, user_id TEXT, item TEXT NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS feedback_session "
+                "ON feedback (session_id, seq)"
+            )
+            self._db.commit()
+
+        # Queued changes; guarded by ``_cond``.  Inserts, feedback rows and
+        # deletes keep their order; state rewrites are coalesced per session.
+        self._cond = threading.Condition()
+        self._ops: List[Tuple[str, Any]] = []
+        self._states: Dict[str, str] = {}
+        self._writing = False
+        self._closed = False
+        self._commits = 0
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="session-backend"
+        )
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # SessionBackend hooks (called under the session lock – enqueue only)
+    # ------------------------------------------------------------------
+    def add(self, session: SessionData) -> None:
+        session.take_unsaved()
+        row = (
+            session.session_id,
+            session.created_at.timestamp(),
+            dump_info(session),
+            dump_state(session),
+            json.dumps(sorted(session.submitted_users)),
+        )
+        items = [
+            (
+                item.user_id if isinstance(item, FeedbackRecord) else None,
+                entry_to_json(item),
+            )
+            for item in session.feedback_items
+        ]
+        self._enqueue(("insert", (row, items)))
+
+    def update(self, session: SessionData, submissions: List[Submission]) -> None:
+        state = dump_state(session)
+        rows = [
+            (session.session_id, user_id, entry_to_json(item))
+            for user_id, item in submissions
+        ]
+        with self._cond:
+            if rows:
+                self._ops.append(("feedback", rows))
+            self._states[session.session_id] = state
+            self._cond.notify()
+
+    def delete(self, session_id: str) -> None:
+        self._enqueue(("delete", session_id))
+
+    def load_sessions(self) -> List[SessionData]:
+        with self._db_lock:
+            # Feedback queued just after its session was deleted leaves
+            # orphan rows behind; drop them here.
+            with self._db:
+                self._db.execute(
+                    "DELETE FROM feedback WHERE session_id NOT IN "
+                    "(SELECT session_id FROM sessions)"
+                )
+            sessions = self._db.execute(
+                "SELECT session_id, created_at, info, state, submitted " "FROM sessions"
+            ).fetchall()
+            feedback: Dict[str, List[Submission]] = {}
+            for session_id, user_id, item in self._db.execute(
+                "SELECT session_id, user_id, item FROM feedback ORDER BY seq"
+            ):
+                feedback.setdefault(session_id, []).append(
+                    (user_id, entry_from_json(item))
+                )
+        restored = []
+        for session_id, created_at, info, state, submitted in sessions:
+            try:
+                restored.append(
+                    restore_session(
+                        session_id,
+                        created_at,
+                        info,
+                        state,
+                        json.loads(submitted),
+                        feedback.get(session_id, []),
+                    )
+                )
+            except Exception:  # noqa: BLE001 – skip one corrupt row, keep others
+                _logger.exception("Could not restore session %s", session_id)
+        return restored
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not (self._ops or self._states or self._writing), timeout
+            )
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        with self._db_lock:
+            self._db.close()
+
+    @property
+    def commits(self) -> int:  # noqa: D401 – property
+        """Number of group commits written so far."""
+        return self._commits
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+    def _enqueue(self, op: Tuple[str, Any]) -> None:
+        with self._cond:
+            self._ops.append(op)
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._ops or self._states or self._closed)
+                if self._closed and not (self._ops or self._states):
+                    return
+                closing = self._closed
+            if not closing and self._commit_interval:
+                # Let concurrent submissions join this transaction.
+                with self._cond:
+                    self._cond.wait_for(lambda: self._closed, self._commit_interval)
+            with self._cond:
+                ops, self._ops = self._ops, []
+                states, self._states = self._states, {}
+                self._writing = True
+            try:
+                self._write(ops, states)
+            except Exception:  # noqa: BLE001 – keep the writer alive
+                _logger.exception(
+                    "Failed to persist %d session change(s)", len(ops) + len(states)
+                )
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+
+    def _write(self, ops: List[Tuple[str, Any]], states: Dict[str, str]) -> None:
+        with self._db_lock, self._db:
+            for kind, payload in ops:
+                if kind == "insert":
+                    row, items = payload
+                    self._db.execute(
+                        "DELETE FROM feedback WHERE session_id = ?", row[:1]
+                    )
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO sessions "
+                        "(session_id, created_at, info, state, submitted) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        row,
+                    )
+                    self._db.executemany(
+                        "INSERT INTO feedback (session_id, user_id, item) "
+                        "VALUES (?, ?, ?)",
+                        [(row[0], user_id, item) for user_id, item in items],
+                    )
+                elif kind == "feedback":
+                    self._db.executemany(
+                        "INSERT INTO feedback (session_id, user_id, item) "
+                        "VALUES (?, ?, ?)",
+                        payload,
+                    )
+                else:  # delete
+                    self._db.execute(
+                        "DELETE FROM sessions WHERE session_id = ?", (payload,)
+                    )
+                    self._db.execute(
+                        "DELETE FROM feedback WHERE session_id = ?", (payload,)
+                    )
+            self._db.executemany(
+                "UPDATE sessions SET state = ? WHERE session_id = ?",
+                [(state, session_id) for session_id, state in states.items()],
+            )
+        self._commits += 1
+
+
+def backend_from_env() -> SessionBackend:
+    """Build the backend selected by ``SESSION_BACKEND``.
+
+    ``sqlite`` uses the file at ``SESSION_DB_PATH`` (default ``sessions.db``)
+    with ``SESSION_COMMIT_INTERVAL_MS`` (default 50) between group commits;
+    anything else keeps sessions in memory only.
+    """
+
+    kind = os.getenv("SESSION_BACKEND", "memory").strip().lower()
+    if kind != "sqlite":
+        if kind != "memory":
+            _logger.warning("Unknown SESSION_BACKEND '%s'; using memory", kind)
+        return SessionBackend()
+
+    raw_interval = os.getenv("SESSION_COMMIT_INTERVAL_MS", "")
+    try:
+        interval = float(raw_interval) / 1000 if raw_interval else None
+    except ValueError:
+        _logger.warning("Invalid SESSION_COMMIT_INTERVAL_MS '%s'", raw_interval)
+        interval = None
+    return SQLiteSessionBackend(
+        os.getenv("SESSION_DB_PATH", "sessions.db"),
+        commit_interval=(
+            interval if interval is not None else _DEFAULT_COMMIT_INTERVAL
+        ),
+    )
@@ -1,5 +1,72 @@
+import bisect
 import datetime
-from typing import List, Optional, Set
+import sys
+import time
+from array import array
+from collections.abc import MutableSet
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.feedback_record import FeedbackEntry
+
+
+class _Members(MutableSet):
+    """Live ``set`` view of one bitset over a session's participants.
+
+    Supports the usual set operations (``in``, ``add``, ``remove``, ``-=``,
+    comparisons with plain sets, …); binary operators return plain sets.
+    Only target users can be members.
+    """
+
+    __slots__ = ("_session", "_attr")
+
+    def __init__(self, session: "SessionData", attr: str) -> None:
+        self._session = session
+        self._attr = attr
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[str]) -> Set[str]:
+        return set(it)
+
+    def __contains__(self, user_id: object) -> bool:
+        index = self._session._position(user_id)
+        return index is not None and bool(
+            getattr(self._session, self._attr) >> index & 1
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        ids = self._session._ids
+        # Reversed binary digits: character i is bit i.
+        digits = bin(getattr(self._session, self._attr))[:1:-1]
+        return (ids[i] for i, bit in enumerate(digits) if bit == "1")
+
+    def __len__(self) -> int:
+        return int(getattr(self._session, self._attr).bit_count())
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+    def add(self, user_id: str) -> None:
+        bits = getattr(self._session, self._attr)
+        setattr(self._session, self._attr, bits | 1 << self._session._require(user_id))
+
+    def discard(self, user_id: str) -> None:
+        index = self._session._position(user_id)
+        if index is not None:
+            bits = getattr(self._session, self._attr)
+            setattr(self._session, self._attr, bits & ~(1 << index))
+
+    def update(self, *others: Iterable[str]) -> None:
+        for other in others:
+            for user_id in other:
+                self.add(user_id)
+
+    def difference_update(self, *others: Iterable[str]) -> None:
+        for other in others:
+            for user_id in other:
+                self.discard(user_id)
+
+    def copy(self) -> Set[str]:
+        return set(self)
 
 
 class SessionData:
@@ -9,8 +76,38 @@ class SessionData:
     participants (``target_user_ids``).  Each participant may submit feedback
     **once**.  The session automatically completes when either all
     participants have submitted or it expires after ``time_limit_minutes``.
+
+    Sessions can target thousands of users, so membership is stored
+    compactly: the (interned) IDs live once in ``target_user_ids`` and
+    ``pending_users`` / ``submitted_users`` are bitsets over their positions,
+    exposed as set views.  The class uses ``__slots__``.
     """
 
+    __slots__ = (
+        "session_id",
+        "initiator_user_id",
+        "channel_id",
+        "time_limit_minutes",
+        "feedback_items",
+        "created_at",
+        "last_accessed_monotonic",
+        "anonymized_summary",
+        "reason",
+        "feedback_sentiment",
+        "feedback_well",
+        "feedback_improve",
+        "item_sentiments",
+        "anonymized_quotes",
+        "_ids",
+        "_order",
+        "_pending",
+        "_submitted",
+        "_anchor_wall",
+        "_anchor_monotonic",
+        "_is_complete",
+        "_unsaved",
+    )
+
     def __init__(
         self,
         session_id: str,
@@ -34,18 +131,29 @@ class SessionData:
         self.session_id: str = session_id
         self.initiator_user_id: str = initiator_user_id
         self.channel_id: str = channel_id
-        self.target_user_ids: List[str] = target_user_ids
+        # Each ID is stored once (interned, duplicates dropped); ``_order``
+        # holds positions sorted by ID for O(log n) lookups.
+        self._ids: List[str] = list(dict.fromkeys(map(sys.intern, target_user_ids)))
+        self._order = array(
+            "I", sorted(range(len(self._ids)), key=self._ids.__getitem__)
+        )
+        # Bit i set == target i pending / submitted.
+        self._pending: int = (1 << len(self._ids)) - 1
+        self._submitted: int = 0
         self.time_limit_minutes: Optional[int] = time_limit_minutes
-        # For group sessions, feedback_items might need to be a Dict[str, List[str]]
-        # mapping target_user_id to their feedback. For now, keeping it simple.
-        self.feedback_items: List[str] = []  # Initialize as empty
-        # NEW: track which users still need to submit feedback
-        self.pending_users: Set[str] = set(target_user_ids)
-        self.submitted_users: Set[str] = set()
+        # Modal submissions are stored as typed ``FeedbackRecord`` objects;
+        # plain strings remain supported for free-text feedback.
+        self.feedback_items: List[FeedbackEntry] = []  # Initialize as empty
         self.created_at: datetime.datetime = datetime.datetime.now(
             datetime.timezone.utc
         )
-        self.last_accessed_at: datetime.datetime = self.created_at
+        # Access time is kept as a monotonic reading – refreshing it on every
+        # store access is then a single float store instead of a datetime.now()
+        # call.  ``last_accessed_at`` converts it back to wall-clock time using
+        # the anchor pair captured here.
+        self._anchor_wall: datetime.datetime = self.created_at
+        self._anchor_monotonic: float = time.monotonic()
+        self.last_accessed_monotonic: float = self._anchor_monotonic
         self._is_complete: bool = False
         self.anonymized_summary: Optional[str] = None
         # Reason for feedback session (optional, shown in modal & report)
@@ -56,17 +164,115 @@ class SessionData:
         self.feedback_sentiment: Optional[str] = None
         self.feedback_well: Optional[str] = None
         self.feedback_improve: Optional[str] = None
+        # Analysis memoized as feedback arrives (see src.reporting.incremental):
+        # feedback free text -> sentiment label, raw highlight quote -> anonymized.
+        self.item_sentiments: Dict[str, str] = {}
+        self.anonymized_quotes: Dict[str, str] = {}
+        # (user_id, item) pairs added since the store last persisted this
+        # session – see take_unsaved() and src.session_backend.
+        self._unsaved: List[Tuple[Optional[str], FeedbackEntry]] = []
+
+    # ------------------------------------------------------------------
+    # Participants
+    # ------------------------------------------------------------------
+
+    @property
+    def target_user_ids(self) -> List[str]:
+        """Users feedback is collected from (do not mutate)."""
+        return self._ids
+
+    @property
+    def pending_users(self) -> MutableSet:
+        """Participants who still need to submit feedback (live set view)."""
+        return _Members(self, "_pending")
+
+    @pending_users.setter
+    def pending_users(self, user_ids: Iterable[str]) -> None:
+        self._pending = self._bits(user_ids)
+
+    @property
+    def submitted_users(self) -> MutableSet:
+        """Participants who already submitted feedback (live set view)."""
+        return _Members(self, "_submitted")
+
+    @submitted_users.setter
+    def submitted_users(self, user_ids: Iterable[str]) -> None:
+        self._submitted = self._bits(user_ids)
+
+    def _position(self, user_id: Any) -> Optional[int]:
+        """Index of *user_id* in ``target_user_ids`` or *None*."""
+        order, ids = self._order, self._ids
+        i = bisect.bisect_left(order, user_id, key=ids.__getitem__)
+        if i < len(order) and ids[order[i]] == user_id:
+            return order[i]
+        return None
+
+    def _require(self, user_id: str) -> int:
+        index = self._position(user_id)
+        if index is None:
+            raise ValueError(
+                f"User {user_id} is not a participant in session {self.session_id}."
+            )
+        return index
+
+    def _bits(self, user_ids: Iterable[str]) -> int:
+        bits = 0
+        for user_id in list(user_ids):
+            bits |= 1 << self._require(user_id)
+        return bits
+
+    @property
+    def last_accessed_at(self) -> datetime.datetime:
+        """Wall-clock time of the last access (derived from the monotonic one)."""
+        return self._anchor_wall + datetime.timedelta(
+            seconds=self.last_accessed_monotonic - self._anchor_monotonic
+        )
+
+    @last_accessed_at.setter
+    def last_accessed_at(self, value: datetime.datetime) -> None:
+        self.last_accessed_monotonic = (
+            self._anchor_monotonic + (value - self._anchor_wall).total_seconds()
+        )
+
+    @property
+    def created_monotonic(self) -> float:
+        """``time.monotonic()`` reading taken when the session was created."""
+        return self._anchor_monotonic
+
+    def backdate(self, created_at: datetime.datetime) -> None:
+        """Set ``created_at`` for a session restored from storage.
+
+        Unlike assigning the attribute, this also moves the monotonic
+        creation reading so time-limit checks stay correct after a restart.
+        """
+        age = (
+            datetime.datetime.now(datetime.timezone.utc) - created_at
+        ).total_seconds()
+        self.created_at = created_at
+        self._anchor_wall = created_at
+        self._anchor_monotonic = time.monotonic() - age
+        self.touch()
+
+    def take_unsaved(self) -> List[Tuple[Optional[str], FeedbackEntry]]:
+        """Return and forget feedback added since the previous call."""
+        unsaved, self._unsaved = self._unsaved, []
+        return unsaved
+
+    def touch(self) -> None:
+        """Record an access now; cheap enough to call on every read."""
+        self.last_accessed_monotonic = time.monotonic()
 
     def add_feedback(self, feedback_item: str) -> None:
         """Adds a new feedback item to the session and updates the last access time."""
         self.feedback_items.append(feedback_item)
-        self.last_accessed_at = datetime.datetime.now(datetime.timezone.utc)
+        self._unsaved.append((None, feedback_item))
+        self.touch()
 
     def complete_session(self, anonymized_summary: str) -> None:
         """Marks the session as complete and stores the anonymized summary."""
         self.anonymized_summary = anonymized_summary
         self._is_complete = True
-        self.last_accessed_at = datetime.datetime.now(datetime.timezone.utc)
+        self.touch()
 
     # ------------------------------------------------------------------
     # Lifecycle helpers
@@ -79,7 +285,7 @@ class SessionData:
         The session finishes automatically when ``pending_users`` is empty or
         when :pyattr:`_is_complete` was set via :py:meth:`complete_session`.
         """
-        return self._is_complete or not self.pending_users
+        return self._is_complete or not self._pending
 
     def time_remaining(self) -> Optional[float]:
         """Return remaining seconds until expiry or *None* if unlimited."""
@@ -91,7 +297,7 @@ class SessionData:
         )
 
     def submit(
-        self, user_id: str, feedback_item: str
+        self, user_id: str, feedback_item: FeedbackEntry
     ) -> None:  # noqa: D401 – simple helper
         """Record *feedback_item* from *user_id*.
 
@@ -104,19 +310,22 @@ class SessionData:
         """
         from src.exceptions import AlreadySubmittedError  # local import to avoid cycles
 
-        if user_id in self.submitted_users:
+        index = self._position(user_id)
+        bit = 0 if index is None else 1 << index
+        if self._submitted & bit:
             raise AlreadySubmittedError(
                 f"User {user_id} already submitted feedback for session {self.session_id}."
             )
-        if user_id not in self.pending_users:
+        if not self._pending & bit:
             raise ValueError(
                 f"User {user_id} is not a participant in session {self.session_id}."
             )
 
         self.feedback_items.append(feedback_item)
-        self.pending_users.remove(user_id)
-        self.submitted_users.add(user_id)
-        self.last_accessed_at = datetime.datetime.now(datetime.timezone.utc)
+        self._pending &= ~bit
+        self._submitted |= bit
+        self._unsaved.append((user_id, feedback_item))
+        self.touch()
 
     def __repr__(self) -> str:
         parts = [
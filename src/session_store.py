@@ -1,28 +1,100 @@
-import datetime
+import heapq
 import logging
 import threading
-from typing import Callable, Dict, Optional
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
 from src.exceptions import AlreadySubmittedError
+from src.feedback_record import FeedbackEntry
 from src.reporting.aggregator import process_session
+from src.reporting.incremental import enqueue_feedback_analysis
+from src.session_backend import SessionBackend
 from src.session_data import SessionData
 
 
+@dataclass(slots=True)
+class _Slot:
+    """A stored session together with the lock guarding its mutation."""
+
+    session: SessionData
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
 class ThreadSafeSessionStore:
-    """A thread-safe store for managing feedback sessions in memory."""
+    """A thread-safe store for managing feedback sessions in memory.
+
+    Locking is two-level so traffic on one session never blocks another:
+
+    • a short *global* lock serialises changes to the session table – insert,
+      remove and the ``max_sessions`` check – and is never held while session
+      state is mutated;
+    • each session has its own lock, held while a modifier runs, so a burst
+      of submissions on one session only serialises that session.
+
+    Lock order is always session lock → global lock, never the reverse.
+
+    The session table is copy-on-write: writers build a new dict and publish
+    it (together with a read-only :meth:`snapshot` and a bumped
+    :attr:`version`) while holding the global lock.  Readers – lookups,
+    diagnostics, expiry sweeps, metrics scrapes – use the currently published
+    table without taking any lock.  Inserts and removals are rare compared
+    with reads, so paying the copy on write is the right trade.
+
+    With *max_age_seconds* set, sessions are also kept in a TTL index – a heap
+    of ``(deadline, session_id)`` entries – so :meth:`evict_expired` only looks
+    at entries that are due instead of scanning every session.
+
+    A reverse index maps each user to the sessions still waiting for their
+    feedback, so :meth:`pending_sessions_for` never scans every session.
+
+    Every change is mirrored to a :class:`~src.session_backend.SessionBackend`
+    (in-memory only by default).  Backends merely queue the change, so
+    persistence never adds I/O to a Slack ack.
 
-    def __init__(self, max_sessions: Optional[int] = None):
+    Callbacks registered with :meth:`add_close_listener` run when a session
+    leaves the store, e.g. to cancel its timers.
+    """
+
+    def __init__(
+        self,
+        max_sessions: Optional[int] = None,
+        max_age_seconds: Optional[float] = None,
+        backend: Optional[SessionBackend] = None,
+    ):
         """Create a new :class:`ThreadSafeSessionStore`.
 
         Args:
             max_sessions: Optional maximum number of *concurrent* active
                 sessions allowed.  :pydata:`None` (default) means unlimited.
+            max_age_seconds: Optional idle time after which
+                :meth:`evict_expired` drops a session.  :pydata:`None`
+                (default) disables eviction.
+            backend: Optional persistence backend; defaults to keeping
+                sessions in memory only.
         """
-        self._sessions: Dict[str, SessionData] = {}
+        # Published tables; never mutated in place (see the class docstring).
+        self._slots: Mapping[str, _Slot] = {}
+        self._snapshot: Mapping[str, SessionData] = MappingProxyType({})
+        self._version = 0
+        # Serialises writers of the tables above; readers never take it.
         self._lock = threading.Lock()
         # None == unlimited
         self._max_sessions = max_sessions if (max_sessions or 0) > 0 else None
         self._logger = logging.getLogger(__name__)
+        # TTL index (monotonic deadline, session id); guarded by ``_lock``.
+        # Entries may be stale – see evict_expired().
+        self._max_age = max_age_seconds if (max_age_seconds or 0) > 0 else None
+        self._ttl_heap: List[Tuple[float, str]] = []
+        self._evicted_total = 0
+        self._sweeps = 0
+        self._backend = backend if backend is not None else SessionBackend()
+        # user_id -> IDs of stored sessions where that user is still pending.
+        # Own lock so submissions never contend with table changes.
+        self._pending_by_user: Dict[str, Set[str]] = {}
+        self._index_lock = threading.Lock()
+        self._close_listeners: List[Callable[[str], None]] = []
 
     def add_session(self, session_data: SessionData) -> None:
         """
@@ -33,27 +105,90 @@ class ThreadSafeSessionStore:
             # Check global limit first so we fail fast under high load.
             if (
                 self._max_sessions is not None
-                and len(self._sessions) >= self._max_sessions
+                and len(self._slots) >= self._max_sessions
             ):
                 raise ValueError(
                     "Maximum concurrent session limit reached. "
                     "Try again later or finish existing sessions."
                 )
 
-            if session_data.session_id in self._sessions:
+            if session_data.session_id in self._slots:
                 raise ValueError(
                     f"Session with ID {session_data.session_id} already exists."
                 )
-            self._sessions[session_data.session_id] = session_data
+            self._insert([session_data])
+            self._backend.add(session_data)
+
+    def recover(self) -> List[SessionData]:
+        """Load sessions persisted by the backend into the store.
+
+        Meant to be called once at start-up, before any traffic; the caller
+        re-registers expiry timers for the returned sessions.  The
+        ``max_sessions`` limit is not applied to recovered sessions.
+        """
+        recovered = [
+            session
+            for session in self._backend.load_sessions()
+            if session.session_id not in self._slots
+        ]
+        if recovered:
+            with self._lock:
+                self._insert(recovered)
+            self._logger.info("Recovered %d persisted session(s)", len(recovered))
+        return recovered
+
+    def _insert(self, sessions: List[SessionData]) -> None:
+        """Add *sessions* to the table and TTL index; caller holds the lock."""
+        slots = dict(self._slots)
+        for session in sessions:
+            slots[session.session_id] = _Slot(session)
+            self._index_pending(session.session_id, session.pending_users)
+            if self._max_age is not None:
+                heapq.heappush(
+                    self._ttl_heap, (self._deadline(session), session.session_id)
+                )
+        self._publish(slots)
+
+    def _publish(self, slots: Dict[str, _Slot]) -> None:
+        """Make *slots* the current table; caller holds ``self._lock``."""
+        self._slots = slots
+        self._snapshot = MappingProxyType(
+            {sid: slot.session for sid, slot in slots.items()}
+        )
+        self._version += 1
+
+    def _slot(self, session_id: str) -> Optional[_Slot]:
+        return self._slots.get(session_id)
+
+    def _is_current(self, session_id: str, slot: _Slot) -> bool:
+        """Return *True* if *slot* is still stored under *session_id*.
+
+        Checked after acquiring a session lock: the session may have been
+        removed (or replaced) while the caller waited for it.
+        """
+        return self._slots.get(session_id) is slot
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever sessions are added, replaced or removed."""
+        return self._version
+
+    def snapshot(self) -> Mapping[str, SessionData]:
+        """Return a read-only view of all sessions without copying or locking.
+
+        The view is immutable: later inserts and removals publish a new one,
+        so it is safe to iterate for as long as the caller likes.  The
+        sessions themselves are live objects.
+        """
+        return self._snapshot
 
     def get_session(self, session_id: str) -> Optional[SessionData]:
         """Retrieves a session by its ID. Returns None if not found."""
-        with self._lock:
-            # Update last_accessed_at when a session is retrieved
-            session = self._sessions.get(session_id)
-            if session:
-                session.last_accessed_at = datetime.datetime.now(datetime.timezone.utc)
-            return session
+        slot = self._slot(session_id)
+        if slot is None:
+            return None
+        slot.session.touch()
+        return slot.session
 
     def update_session(self, session_data: SessionData) -> None:
         """
@@ -63,21 +198,33 @@ class ThreadSafeSessionStore:
         The caller is responsible for ensuring the SessionData object is the one to keep.
         This method also updates the last_accessed_at timestamp of the session.
         """
-        with self._lock:
-            if session_data.session_id not in self._sessions:
-                raise ValueError(
-                    f"Session with ID {session_data.session_id} not found for update."
-                )
-            # Ensure last_accessed_at is updated on the object being stored
-            session_data.last_accessed_at = datetime.datetime.now(datetime.timezone.utc)
-            self._sessions[session_data.session_id] = session_data
+        slot = self._slot(session_data.session_id)
+        if slot is not None:
+            with slot.lock:
+                if self._is_current(session_data.session_id, slot):
+                    # Ensure last_accessed_at is updated on the object being stored
+                    session_data.touch()
+                    with self._lock:
+                        self._unindex_pending(
+                            slot.session.session_id, slot.session.pending_users
+                        )
+                        self._index_pending(
+                            session_data.session_id, session_data.pending_users
+                        )
+                        slot.session = session_data
+                        self._publish(dict(self._slots))
+                    self._backend.add(session_data)
+                    return
+        raise ValueError(
+            f"Session with ID {session_data.session_id} not found for update."
+        )
 
     def modify_session(
         self,
         session_id: str,
         modifier: Callable[[SessionData], None],
     ) -> SessionData:
-        """Atomically apply *modifier* to the session inside the lock.
+        """Atomically apply *modifier* to the session under its own lock.
 
         The *modifier* callback receives the current :class:`SessionData` instance and
         may mutate it in-place. The session's ``last_accessed_at`` timestamp is
@@ -86,7 +233,8 @@ class ThreadSafeSessionStore:
         Args:
             session_id: ID of the session to modify.
             modifier: A callable that will be executed with the session as its only
-                argument while the internal lock is held.
+                argument while the session's lock is held.  Other sessions
+                remain accessible meanwhile.
 
         Returns:
             The modified :class:`SessionData` instance for convenience.
@@ -94,37 +242,53 @@ class ThreadSafeSessionStore:
         Raises:
             ValueError: If *session_id* does not exist in the store.
         """
-        with self._lock:
-            session = self._sessions.get(session_id)
-            if session is None:
-                raise ValueError(f"Session with ID {session_id} not found.")
-
-            modifier(session)
-            # Update last accessed timestamp after mutation
-            session.last_accessed_at = datetime.datetime.now(datetime.timezone.utc)
-            return session
+        slot = self._slot(session_id)
+        if slot is not None:
+            with slot.lock:
+                if self._is_current(session_id, slot):
+                    session = slot.session
+                    try:
+                        modifier(session)
+                    finally:
+                        # Index and persist whatever the modifier changed,
+                        # even if it raised half-way.
+                        submissions = session.take_unsaved()
+                        self._unindex_pending(
+                            session_id, (u for u, _item in submissions if u)
+                        )
+                        self._backend.update(session, submissions)
+                    # Update last accessed timestamp after mutation
+                    session.touch()
+                    return session
+        raise ValueError(f"Session with ID {session_id} not found.")
 
     def remove_session(self, session_id: str) -> Optional[SessionData]:
         """Removes a session by its ID. Returns the removed session or None if not found."""
         with self._lock:
-            return self._sessions.pop(session_id, None)
+            if session_id not in self._slots:
+                return None
+            slots = dict(self._slots)
+            slot = slots.pop(session_id)
+            self._publish(slots)
+        self._unindex_pending(session_id, slot.session.pending_users)
+        self._backend.delete(session_id)
+        self._notify_closed(session_id)
+        return slot.session
 
     def get_all_sessions(self) -> Dict[str, SessionData]:
         """Returns a shallow copy of all sessions currently in the store."""
-        with self._lock:
-            return dict(self._sessions)
+        return dict(self._snapshot)
 
     def count(self) -> int:
         """Returns the total number of active sessions."""
-        with self._lock:
-            return len(self._sessions)
+        return len(self._slots)
 
     # ------------------------------------------------------------------
     # New lifecycle helpers
     # ------------------------------------------------------------------
 
     def submit_feedback(
-        self, session_id: str, user_id: str, feedback_item: str
+        self, session_id: str, user_id: str, feedback_item: FeedbackEntry
     ) -> None:
         """Record feedback for a participant and update session state atomically."""
 
@@ -136,27 +300,180 @@ class ThreadSafeSessionStore:
                 )
 
         try:
-            self.modify_session(session_id, _apply)
+            session = self.modify_session(session_id, _apply)
             self._logger.info(
                 "feedback_received",
                 extra={"session_id": session_id, "user_id": user_id},
             )
+            self.enqueue_analysis(session, feedback_item)
         except AlreadySubmittedError:
             raise
         except ValueError:
             raise
 
+    def enqueue_analysis(
+        self, session: SessionData, feedback_item: FeedbackEntry
+    ) -> None:
+        """Optional background scoring so the report has less to do later.
+
+        Results are memoized on *session*, which is the stored object here.
+        """
+        enqueue_feedback_analysis(session, feedback_item)
+
     def mark_done(self, session_id: str) -> None:
         """Set session as completed and remove it from store (idempotent)."""
-        with self._lock:
-            session = self._sessions.pop(session_id, None)
+        session = self.remove_session(session_id)
         if session is not None:
             session.complete_session("")  # store empty summary placeholder
             self._logger.info("session_done", extra={"session_id": session_id})
 
-    def get_active_sessions(self) -> Dict[str, SessionData]:
-        """Return copy of active sessions for diagnostics."""
-        return self.get_all_sessions()
+    # ------------------------------------------------------------------
+    # Close listeners
+    # ------------------------------------------------------------------
+
+    def add_close_listener(self, listener: Callable[[str], None]) -> None:
+        """Call ``listener(session_id)`` when a session leaves the store.
+
+        That is removal (including :meth:`mark_done`) or eviction – not
+        completion, so an expiry timer still backs up a report that fails to
+        post.  Listeners run outside every store lock.
+        """
+        self._close_listeners.append(listener)
+
+    def _notify_closed(self, session_id: str) -> None:
+        for listener in self._close_listeners:
+            try:
+                listener(session_id)
+            except Exception:  # noqa: BLE001 – never fail the store operation
+                self._logger.exception(
+                    "Close listener failed for session %s", session_id
+                )
+
+    # ------------------------------------------------------------------
+    # Per-user lookups
+    # ------------------------------------------------------------------
+
+    def _index_pending(self, session_id: str, user_ids: Iterable[str]) -> None:
+        with self._index_lock:
+            for user_id in user_ids:
+                self._pending_by_user.setdefault(user_id, set()).add(session_id)
+
+    def _unindex_pending(self, session_id: str, user_ids: Iterable[str]) -> None:
+        with self._index_lock:
+            for user_id in user_ids:
+                session_ids = self._pending_by_user.get(user_id)
+                if session_ids is None:
+                    continue
+                session_ids.discard(session_id)
+                if not session_ids:
+                    del self._pending_by_user[user_id]
+
+    def pending_sessions_for(self, user_id: str) -> List[SessionData]:
+        """Return the open sessions still waiting for *user_id*, oldest first.
+
+        Served from the user → session index, so the cost depends on the
+        user's own sessions, not on how many sessions the store holds.
+        """
+        with self._index_lock:
+            session_ids = list(self._pending_by_user.get(user_id, ()))
+        slots = self._slots
+        sessions = [
+            slots[sid].session
+            for sid in session_ids
+            # A submission may still be mid-flight between set and index.
+            if sid in slots and user_id in slots[sid].session.pending_users
+        ]
+        return sorted(sessions, key=lambda session: session.created_at)
+
+    # ------------------------------------------------------------------
+    # Eviction of abandoned sessions
+    # ------------------------------------------------------------------
+
+    def _deadline(self, session: SessionData) -> float:
+        """Monotonic time after which *session* counts as abandoned."""
+        assert self._max_age is not None
+        deadline = session.last_accessed_monotonic + self._max_age
+        if session.time_limit_minutes is not None:
+            # Never evict before the session's own expiry would have fired.
+            deadline = max(
+                deadline,
+                session.created_monotonic + session.time_limit_minutes * 60,
+            )
+        return deadline
+
+    def evict_expired(self, now: Optional[float] = None) -> List[SessionData]:
+        """Remove sessions idle for longer than *max_age_seconds*.
+
+        Only due heap entries are examined, so the cost is proportional to the
+        number of expired (or recently touched) sessions rather than the size
+        of the store.  A due entry whose session was touched since it was
+        indexed is re-queued with its new deadline; entries for sessions that
+        are already gone are dropped.
+
+        Args:
+            now: ``time.monotonic()`` reading to evaluate against (tests).
+
+        Returns:
+            The evicted sessions (an empty list when eviction is disabled).
+        """
+        if self._max_age is None:
+            return []
+        now = time.monotonic() if now is None else now
+        evicted: List[SessionData] = []
+        with self._lock:
+            self._sweeps += 1
+            slots: Optional[Dict[str, _Slot]] = None
+            while self._ttl_heap and self._ttl_heap[0][0] <= now:
+                _deadline, session_id = heapq.heappop(self._ttl_heap)
+                slot = (slots if slots is not None else self._slots).get(session_id)
+                if slot is None:
+                    continue  # removed or completed meanwhile
+                deadline = self._deadline(slot.session)
+                if deadline > now:
+                    heapq.heappush(self._ttl_heap, (deadline, session_id))
+                    continue
+                if slots is None:
+                    slots = dict(self._slots)
+                del slots[session_id]
+                evicted.append(slot.session)
+            if slots is not None:
+                self._publish(slots)
+            self._evicted_total += len(evicted)
+        for session in evicted:
+            self._unindex_pending(session.session_id, session.pending_users)
+            self._backend.delete(session.session_id)
+            self._notify_closed(session.session_id)
+            self._logger.warning(
+                "session_evicted",
+                extra={
+                    "session_id": session.session_id,
+                    "idle_seconds": round(now - session.last_accessed_monotonic),
+                },
+            )
+        return evicted
+
+    @property
+    def evicted_total(self) -> int:  # noqa: D401 – property
+        """Number of sessions dropped by :meth:`evict_expired` so far."""
+        return self._evicted_total
+
+    def eviction_stats(self) -> Dict[str, int]:
+        """Return eviction metrics: totals, sweep count and index size."""
+        with self._lock:
+            return {
+                "evicted_total": self._evicted_total,
+                "sweeps": self._sweeps,
+                "indexed": len(self._ttl_heap),
+                "sessions": len(self._slots),
+            }
+
+    def close(self) -> None:
+        """Flush and close the persistence backend (sessions stay in memory)."""
+        self._backend.close()
+
+    def get_active_sessions(self) -> Mapping[str, SessionData]:
+        """Return a read-only view of active sessions for diagnostics."""
+        return self.snapshot()
 
     # ------------------------------------------------------------------
     # Reporting helper
@@ -4,9 +4,14 @@ from typing import Any, Dict
 from slack_bolt import Ack
 from slack_sdk.web import WebClient
 
+from src.feedback_record import FeedbackRecord
 from src.session_data import SessionData
 from src.session_store import ThreadSafeSessionStore
 
+# A completing report that is shed is re-queued with a capped linear backoff
+REPORT_RETRY_SECONDS = 2.0
+REPORT_RETRY_MAX_SECONDS = 30.0
+
 logger = logging.getLogger(__name__)
 
 
@@ -151,16 +156,17 @@ def handle_feedback_modal_submission(
 
         user_id = body.get("user", {}).get("id")
 
+        # Typed record – reporting reads the fields directly
+        feedback_item = FeedbackRecord(
+            user_id=user_id,
+            sentiment=selected_sentiment,
+            well=feedback_well,
+            improve=feedback_improve,
+        )
+
         def _apply_feedback(session: SessionData) -> None:  # noqa: WPS430
             """Apply feedback and update session state atomically."""
 
-            # Build feedback item string (could be structured later)
-            feedback_item = (
-                f"sentiment={selected_sentiment}, "
-                f"well={feedback_well}, "
-                f"improve={feedback_improve}"
-            )
-
             try:
                 # Uses SessionData.submit to update pending/submitted sets
                 session.submit(user_id, feedback_item)
@@ -182,6 +188,9 @@ def handle_feedback_modal_submission(
                 f"Sentiment: '{selected_sentiment}', Well='{feedback_well}', Improve='{feedback_improve}'"
             )
 
+            # Optionally score/anonymize the new item now instead of at expiry
+            session_store.enqueue_analysis(updated_session, feedback_item)
+
         except ValueError:
             # Session no longer exists – maybe GC'd or invalid ID
             logger.warning(
@@ -191,32 +200,29 @@ def handle_feedback_modal_submission(
 
         # Notify initiator if session complete – heavy work must run off-thread
         if updated_session.is_complete:
-            # Import here to avoid cyclic dependency at module load time
-            from src.app import submit_background  # local import – shared executor
 
             def _aggregate_and_post() -> None:  # noqa: WPS430 – nested helper
                 """Aggregate feedback and post report in a background thread."""
 
                 try:
-                    processed = session_store.process_feedback(session_id)
-                    logger.info(
-                        "Aggregated feedback for %s: sentiments=%s, stats=%s",
-                        session_id,
-                        processed.sentiment_counts,
-                        processed.stats,
-                    )
+                    session = session_store.get_session(session_id)
+                    if session is None:
+                        raise ValueError(
+                            f"Session {session_id} not found for processing."
+                        )
 
                     # Post full report to the original channel (or DM initiator)
                     from src.reporting.render import (  # local import – avoid cycles
-                        post_report_to_slack,
+                        dispatch_session_report,
                     )
 
                     target_channel = (
                         updated_session.channel_id or updated_session.initiator_user_id
                     )
 
-                    post_report_to_slack(
-                        processed=processed,
+                    # Aggregation, sentiment and analysis run as one stage DAG
+                    dispatch_session_report(
+                        session,
                         client=client,
                         channel=target_channel,
                     )
@@ -248,8 +254,8 @@ def handle_feedback_modal_submission(
                         exc_info=True,
                     )
 
-            # Submit the background job to the shared executor
-            submit_background(_aggregate_and_post)
+            # Report generation gets its own lane so it never starves commands
+            _queue_report(session_id, _aggregate_and_post)
 
     except KeyError as e:
         logger.error(f"Error accessing key in view submission: {e}. View: {view}")
@@ -258,3 +264,32 @@ def handle_feedback_modal_submission(
             f"Error processing feedback modal submission for session '{session_id}': {e}",
             exc_info=True,
         )
+
+
+# ------------------------------------------------------------------
+# Report queueing with admission control
+# ------------------------------------------------------------------
+
+
+def _queue_report(session_id: str, job, attempt: int = 1) -> None:
+    """Queue the completion report *job* at high priority.
+
+    Completing reports are only shed when the reporting lane is completely
+    full; they are then retried on the scheduler until a slot frees up, never
+    dropped.
+    """
+    # Import here to avoid cyclic dependency at module load time
+    from src.admission import Overloaded, Priority
+    from src.app import scheduler, submit_background
+
+    try:
+        submit_background(job, lane="reporting", priority=Priority.HIGH)
+    except Overloaded:
+        delay = min(REPORT_RETRY_SECONDS * attempt, REPORT_RETRY_MAX_SECONDS)
+        logger.warning(
+            "Reporting lane full; retrying report for %s in %.0fs (attempt %d)",
+            session_id,
+            delay,
+            attempt,
+        )
+        scheduler.schedule(delay, _queue_report, session_id, job, attempt + 1)
@@ -0,0 +1,240 @@
+"""Rate-limit-aware delivery of feedback invitation DMs.
+
+Invitations used to go out one ``chat.postMessage`` at a time, so a
+500-member group took minutes and a Slack 429 simply counted as a failed
+invitation.  :class:`InvitationDispatcher` instead
+
+• sends with bounded parallelism – the calling thread plus helpers on an
+  executor (the ``fanout`` lane in the app),
+• paces every call through a shared :class:`~src.openai_ratelimit.TokenBucket`
+  sized to the method's Slack rate limit, so throughput settles at the
+  rate-limit floor instead of bouncing off 429s,
+• pauses *all* senders for the ``Retry-After`` of any 429, and retries
+  transient errors with exponential back-off, and
+• reports progress and a final :class:`InvitationTally`.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web import WebClient
+
+from src.executor_lanes import LaneFullError
+from src.openai_ratelimit import TokenBucket, retry_after_seconds
+
+__all__ = [
+    "METHOD_RATES",
+    "InvitationDispatcher",
+    "InvitationTally",
+]
+
+logger = logging.getLogger(__name__)
+
+# Requests per minute by Slack Web API method.  Tiered methods use their
+# tier's budget (Tier 2: 20, Tier 3: 50, Tier 4: 100); chat.postMessage has
+# the "special" limit of about one message per second *per channel*, and as
+# every DM is its own channel the workspace-wide budget below is what binds.
+METHOD_RATES: Dict[str, float] = {
+    "chat.postMessage": 300.0,
+}
+
+# Slack error codes worth another attempt; anything else fails immediately.
+TRANSIENT_ERRORS = frozenset(
+    {"internal_error", "fatal_error", "request_timeout", "service_unavailable"}
+)
+
+# Used when a 429 carries no Retry-After header.
+_DEFAULT_RETRY_AFTER = 1.0
+# 429s tolerated per invitation before it counts as failed.
+_MAX_THROTTLES = 10
+
+
+@dataclass
+class InvitationTally:
+    """Outcome of sending one batch of invitations."""
+
+    total: int
+    sent: int = 0
+    failed: int = 0
+    retried: int = 0
+    throttled: int = 0
+    elapsed_seconds: float = 0.0
+    failed_user_ids: List[str] = field(default_factory=list)
+
+    @property
+    def done(self) -> int:  # noqa: D401 – property
+        """Invitations that were sent or have definitively failed."""
+        return self.sent + self.failed
+
+
+class InvitationDispatcher:
+    """Send the same DM to many users within Slack's rate limits."""
+
+    def __init__(
+        self,
+        *,
+        executor: Optional[Executor] = None,
+        concurrency: int = 4,
+        rate_per_minute: float = METHOD_RATES["chat.postMessage"],
+        max_attempts: int = 4,
+        backoff_seconds: float = 0.5,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Create a dispatcher; share one per workspace so its budget holds.
+
+        Args:
+            executor: Runs helper senders; without one only the calling
+                thread sends.
+            concurrency: Maximum number of messages in flight.
+            rate_per_minute: ``chat.postMessage`` budget shared by all senders.
+            max_attempts: Attempts per invitation, including the first.
+            backoff_seconds: First back-off after a transient error; doubles
+                on every further attempt.
+            sleep: Injected for tests.
+        """
+        if concurrency < 1 or max_attempts < 1:
+            raise ValueError("concurrency and max_attempts must be positive")
+        self._executor = executor
+        self._concurrency = concurrency
+        self._max_attempts = max_attempts
+        self._backoff = backoff_seconds
+        self._sleep = sleep
+        # A burst of one request per sender keeps the start from spiking.
+        self._bucket = TokenBucket(rate_per_minute, burst=concurrency)
+
+    def send(
+        self,
+        client: WebClient,
+        user_ids: Iterable[str],
+        *,
+        text: str,
+        blocks: Sequence[Dict[str, Any]],
+        on_progress: Optional[Callable[[InvitationTally], None]] = None,
+        progress_every: int = 0,
+    ) -> InvitationTally:
+        """DM every user in *user_ids* through *client* and return the tally.
+
+        *on_progress* receives a snapshot of the tally each time another
+        *progress_every* invitations are done (never for the last one – the
+        returned tally covers that).  Blocks until every invitation was
+        sent or has failed.
+        """
+        targets = list(dict.fromkeys(user_ids))
+        tally = InvitationTally(total=len(targets))
+        lock = threading.Lock()
+        remaining = iter(targets)
+        started = time.monotonic()
+        progress = on_progress if progress_every > 0 else None
+
+        def _next_target() -> Optional[str]:
+            with lock:
+                return next(remaining, None)
+
+        def _record(user_id: str, ok: bool, retried: int, throttled: int) -> None:
+            snapshot = None
+            with lock:
+                if ok:
+                    tally.sent += 1
+                else:
+                    tally.failed += 1
+                    tally.failed_user_ids.append(user_id)
+                tally.retried += retried
+                tally.throttled += throttled
+                done = tally.done
+                if (
+                    progress is not None
+                    and done < tally.total
+                    and done % progress_every == 0
+                ):
+                    snapshot = replace(
+                        tally, failed_user_ids=list(tally.failed_user_ids)
+                    )
+            if progress is not None and snapshot is not None:
+                try:
+                    progress(snapshot)
+                except Exception:  # noqa: BLE001 – progress is best effort
+                    logger.exception("Invitation progress callback failed")
+
+        def _drain() -> None:
+            user_id = _next_target()
+            while user_id is not None:
+                _record(user_id, *self._deliver(client, user_id, text, blocks))
+                user_id = _next_target()
+
+        helpers: List[Future] = []
+        if self._executor is not None:
+            for _ in range(min(self._concurrency, len(targets)) - 1):
+                try:
+                    helpers.append(self._executor.submit(_drain))
+                except LaneFullError:
+                    break  # the calling thread still makes progress
+        _drain()
+        for helper in helpers:
+            helper.result()
+
+        tally.elapsed_seconds = round(time.monotonic() - started, 3)
+        return tally
+
+    def _deliver(
+        self,
+        client: WebClient,
+        user_id: str,
+        text: str,
+        blocks: Sequence[Dict[str, Any]],
+    ) -> tuple[bool, int, int]:
+        """Send one DM; returns ``(ok, retries, throttled)``.
+
+        Throttled attempts do not count against ``max_attempts`` (up to
+        :data:`_MAX_THROTTLES`) since the shared pause already spaces them.
+        """
+        attempt = 1
+        retries = throttled = 0
+        while True:
+            wait = self._bucket.reserve()
+            if wait > 0:
+                self._sleep(wait)
+            try:
+                client.chat_postMessage(channel=user_id, text=text, blocks=blocks)
+                return True, retries, throttled
+            except SlackApiError as exc:
+                error = exc.response.get("error", str(exc))
+                if _is_throttled(exc):
+                    throttled += 1
+                    # Every sender waits, not just this one
+                    self._bucket.pause(retry_after_seconds(exc) or _DEFAULT_RETRY_AFTER)
+                    if throttled <= _MAX_THROTTLES:
+                        retries += 1
+                        continue
+                elif error not in TRANSIENT_ERRORS and _status(exc) < 500:
+                    logger.warning(
+                        "Failed to send feedback invitation to %s: %s", user_id, error
+                    )
+                    return False, retries, throttled
+            except (ConnectionError, TimeoutError) as exc:
+                error = str(exc)
+            if attempt >= self._max_attempts or throttled > _MAX_THROTTLES:
+                break
+            self._sleep(self._backoff * 2 ** (attempt - 1))
+            attempt += 1
+            retries += 1
+        logger.warning(
+            "Giving up on feedback invitation to %s after %d attempts: %s",
+            user_id,
+            retries + 1,
+            error,
+        )
+        return False, retries, throttled
+
+
+def _status(exc: SlackApiError) -> int:
+    return getattr(exc.response, "status_code", 0) or 0
+
+
+def _is_throttled(exc: SlackApiError) -> bool:
+    return _status(exc) == 429 or exc.response.get("error") == "ratelimited"
@@ -36,13 +36,16 @@ class _SentimentIter:
         self._labels = labels
         self._idx = 0
 
-    def __call__(self, _text: str):
-        label = self._labels[self._idx % len(self._labels)]
-        self._idx += 1
-        return SentimentResult(label=SentimentLabel(label), score=0.9)
+    def __call__(self, texts: list[str], **_kwargs):
+        results = []
+        for _text in texts:
+            label = self._labels[self._idx % len(self._labels)]
+            self._idx += 1
+            results.append(SentimentResult(label=SentimentLabel(label), score=0.9))
+        return results
 
 
-@patch("src.reporting.aggregator.analyze_sentiment")
+@patch("src.reporting.aggregator.analyze_sentiments")
 def test_process_session_happy_path(mock_analyze):
     """Sentiment counts and stats are calculated correctly."""
 
@@ -64,7 +67,7 @@ def test_process_session_happy_path(mock_analyze):
     }
 
 
-@patch("src.reporting.aggregator.analyze_sentiment")
+@patch("src.reporting.aggregator.analyze_sentiments")
 def test_low_participation_flag(mock_analyze):
     """Low participation flagged when submissions < ceil(total/2)."""
 
@@ -77,7 +80,7 @@ def test_low_participation_flag(mock_analyze):
     assert processed.stats["low_participation"] is True
 
 
-@patch("src.reporting.aggregator.analyze_sentiment")
+@patch("src.reporting.aggregator.analyze_sentiments")
 def test_empty_feedback_safe(mock_analyze):
     """Aggregator handles sessions with no feedback gracefully."""
 
@@ -90,3 +93,77 @@ def test_empty_feedback_safe(mock_analyze):
     assert processed.sentiment_counts == {}
     assert processed.stats["submitted"] == 0
     assert processed.stats["low_participation"] is True
+
+
+@patch("src.reporting.aggregator.analyze_sentiments")
+def test_failed_items_skipped(mock_analyze):
+    """Items the model could not classify are left out of the counts."""
+
+    mock_analyze.return_value = [
+        SentimentResult(label=SentimentLabel.POSITIVE, score=0.5),
+        None,
+    ]
+
+    session = _make_session(2, 2, ["A", "B"])
+    processed = process_session(session)
+
+    assert processed.sentiment_counts == {"positive": 1}
+    mock_analyze.assert_called_once()
+
+
+def test_structured_mode_tallies_selected_labels(monkeypatch):
+    """Modal-selected labels are counted without calling the model."""
+
+    from src.reporting import config
+
+    monkeypatch.setattr(config, "SENTIMENT_MODE", "structured")
+    session = _make_session(
+        3,
+        3,
+        [
+            "sentiment=positive, well=a, improve=b",
+            "sentiment=negative, well=c, improve=d",
+            "sentiment=None, well=e, improve=f",
+        ],
+    )
+    with patch(
+        "src.reporting.aggregator.analyze_sentiments",
+        side_effect=_SentimentIter(["neutral"]),
+    ) as mock_analyze:
+        processed = process_session(session)
+
+    # Only the item without a selection is sent to the model
+    mock_analyze.assert_called_once()
+    assert mock_analyze.call_args.args[0] == ["well=e, improve=f"]
+    assert processed.sentiment_counts == {"positive": 1, "negative": 1, "neutral": 1}
+
+
+def test_model_mode_ignores_selected_labels(monkeypatch):
+    from src.reporting import config
+
+    monkeypatch.setattr(config, "SENTIMENT_MODE", "model")
+    session = _make_session(2, 2, ["sentiment=positive, well=a, improve=b"])
+    with patch(
+        "src.reporting.aggregator.analyze_sentiments",
+        side_effect=_SentimentIter(["negative"]),
+    ):
+        processed = process_session(session)
+
+    assert processed.sentiment_counts == {"negative": 1}
+
+
+def test_verify_mode_logs_disagreements(monkeypatch, caplog):
+    from src.reporting import config
+
+    monkeypatch.setattr(config, "SENTIMENT_MODE", "verify")
+    session = _make_session(2, 2, ["sentiment=positive, well=a, improve=b"])
+    with patch(
+        "src.reporting.aggregator.analyze_sentiments",
+        side_effect=_SentimentIter(["negative"]),
+    ) as mock_analyze, caplog.at_level("INFO"):
+        processed = process_session(session)
+
+    # The chosen label wins; the model only scores the prefix-free text
+    assert processed.sentiment_counts == {"positive": 1}
+    assert mock_analyze.call_args.args[0] == ["well=a, improve=b"]
+    assert "differs from chosen label for 1 of 1" in caplog.text
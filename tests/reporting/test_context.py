@@ -69,6 +69,7 @@ def test_build_report_context(monkeypatch):
 
     # Patch external helpers to deterministic output
     monkeypatch.setattr("src.reporting.context.anonymize_quotes", lambda items: items)
+    monkeypatch.setattr("src.reporting.context.generate_summary", lambda *a, **k: "")
     monkeypatch.setattr(
         "src.reporting.context.extract_themes",
         lambda items: ["teamwork", "communication"],
@@ -115,6 +116,7 @@ def test_truncation_and_order(monkeypatch):
     from src.reporting.models import ProcessedFeedback
 
     monkeypatch.setattr("src.reporting.context.anonymize_quotes", lambda items: items)
+    monkeypatch.setattr("src.reporting.context.generate_summary", lambda *a, **k: "")
     monkeypatch.setattr("src.reporting.context.extract_themes", lambda items: [])
 
     # Over-provide 10 items (> default 5)
@@ -141,6 +143,7 @@ def test_low_participation_flag(monkeypatch):
     from src.reporting.models import ProcessedFeedback
 
     monkeypatch.setattr("src.reporting.context.anonymize_quotes", lambda items: items)
+    monkeypatch.setattr("src.reporting.context.generate_summary", lambda *a, **k: "")
     monkeypatch.setattr("src.reporting.context.extract_themes", lambda items: [])
 
     processed = ProcessedFeedback(
@@ -154,3 +157,42 @@ def test_low_participation_flag(monkeypatch):
     ctx = build_report_context(processed)
 
     assert ctx.stats.low_participation is True
+
+
+def test_abuild_report_context_matches_sync(monkeypatch):
+    """The async builder should produce the same context as the sync one."""
+
+    import asyncio
+
+    from src.reporting.context import abuild_report_context, build_report_context
+    from src.reporting.models import ProcessedFeedback
+
+    async def _same(items):
+        return items
+
+    async def _themes(items):
+        return ["teamwork"]
+
+    async def _summary(*_a, **_k):
+        return "All good."
+
+    monkeypatch.setattr("src.reporting.context.anonymize_quotes", lambda items: items)
+    monkeypatch.setattr("src.reporting.context.extract_themes", lambda i: ["teamwork"])
+    monkeypatch.setattr(
+        "src.reporting.context.generate_summary", lambda *a, **k: "All good."
+    )
+    monkeypatch.setattr("src.reporting.context.aanonymize_quotes", _same)
+    monkeypatch.setattr("src.reporting.context.aextract_themes", _themes)
+    monkeypatch.setattr("src.reporting.context.agenerate_summary", _summary)
+
+    processed = ProcessedFeedback(
+        session_id="sess-async",
+        per_user={},
+        all_items=_make_items(3),
+        sentiment_counts={"positive": 3},
+        stats={"submitted": 3, "total_participants": 3, "low_participation": False},
+    )
+
+    assert asyncio.run(abuild_report_context(processed)) == build_report_context(
+        processed
+    )
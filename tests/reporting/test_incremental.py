@@ -0,0 +1,152 @@
+"""Tests for incremental (submission-time) feedback analysis."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from src.analysis.sentiment import SentimentLabel, SentimentResult
+from src.reporting import config, incremental
+from src.reporting.aggregator import process_session
+from src.reporting.context import build_report_context
+from src.session_data import SessionData
+from src.session_store import ThreadSafeSessionStore
+
+
+def _session(users: int = 3) -> SessionData:
+    return SessionData(
+        session_id="S-inc",
+        initiator_user_id="U0",
+        channel_id="C1",
+        target_user_ids=[f"U{i}" for i in range(1, users + 1)],
+    )
+
+
+def _positive(_text: str, **_kwargs) -> SentimentResult:
+    return SentimentResult(label=SentimentLabel.POSITIVE, score=0.8)
+
+
+def test_enqueue_is_noop_when_disabled(monkeypatch):
+    monkeypatch.setattr(config, "INCREMENTAL_ANALYSIS", False)
+    assert incremental.enqueue_feedback_analysis(_session(), "x") is None
+
+
+@patch("src.reporting.incremental.anonymize_quotes")
+@patch("src.reporting.incremental.analyze_sentiment", side_effect=_positive)
+def test_item_results_are_memoized(_mock_sentiment, mock_anonymize, monkeypatch):
+    monkeypatch.setattr(config, "SENTIMENT_MODE", "model")
+    mock_anonymize.side_effect = lambda quotes: [f"anon {q}" for q in quotes]
+    session = _session()
+    item = "sentiment=positive, well=Alice helped, improve=more tests"
+    session.feedback_items.append(item)
+
+    incremental.analyze_feedback_item(session, item)
+
+    assert session.item_sentiments == {
+        "well=Alice helped, improve=more tests": "positive"
+    }
+    assert session.anonymized_quotes == {
+        "Alice helped": "anon Alice helped",
+        "more tests": "anon more tests",
+    }
+
+
+@patch("src.reporting.incremental.anonymize_quotes")
+@patch("src.reporting.incremental.analyze_sentiment")
+def test_failures_are_not_memoized(mock_sentiment, mock_anonymize):
+    mock_sentiment.side_effect = RuntimeError("down")
+    mock_anonymize.side_effect = lambda quotes: [f"[unredacted] {q}" for q in quotes]
+    session = _session()
+    item = "sentiment=neutral, well=ok, improve=ok"
+    session.feedback_items.append(item)
+
+    incremental.analyze_feedback_item(session, item)
+
+    assert session.item_sentiments == {}
+    assert session.anonymized_quotes == {}
+
+
+@patch("src.reporting.incremental.anonymize_quotes")
+@patch("src.reporting.incremental.analyze_sentiment", side_effect=_positive)
+def test_items_beyond_highlights_are_not_anonymized(
+    _mock_sentiment, mock_anonymize, monkeypatch
+):
+    monkeypatch.setattr(config, "SENTIMENT_MODE", "model")
+    session = _session(users=10)
+    session.feedback_items.extend(
+        f"sentiment=positive, well=w{i}, improve=i{i}" for i in range(10)
+    )
+
+    incremental.analyze_feedback_item(session, session.feedback_items[-1])
+
+    mock_anonymize.assert_not_called()
+    assert "well=w9, improve=i9" in session.item_sentiments
+
+
+@patch("src.reporting.incremental.anonymize_quotes", side_effect=lambda q: q)
+@patch("src.reporting.incremental.analyze_sentiment")
+def test_structured_items_skip_incremental_sentiment(
+    mock_sentiment, _mock_anonymize, monkeypatch
+):
+    monkeypatch.setattr(config, "SENTIMENT_MODE", "structured")
+    session = _session()
+    item = "sentiment=negative, well=x, improve=y"
+    session.feedback_items.append(item)
+
+    incremental.analyze_feedback_item(session, item)
+
+    mock_sentiment.assert_not_called()
+    assert session.item_sentiments == {}
+
+
+def test_report_reuses_memoized_results(monkeypatch):
+    monkeypatch.setattr(config, "SENTIMENT_MODE", "model")
+    session = _session()
+    item = "sentiment=positive, well=good, improve=bad"
+    session.feedback_items.append(item)
+    session.item_sentiments["well=good, improve=bad"] = "positive"
+    session.anonymized_quotes.update({"good": "GOOD", "bad": "BAD"})
+
+    def _fail(items, **_kwargs):
+        if items:
+            raise AssertionError("memoized items should not be re-analysed")
+        return []
+
+    monkeypatch.setattr("src.reporting.aggregator.analyze_sentiments", _fail)
+    monkeypatch.setattr("src.reporting.context.anonymize_quotes", _fail)
+    monkeypatch.setattr("src.reporting.context.extract_themes", lambda _i: [])
+    monkeypatch.setattr("src.reporting.context.generate_summary", lambda *a, **k: "")
+
+    processed = process_session(session)
+    ctx = build_report_context(processed)
+
+    assert processed.sentiment_counts == {"positive": 1}
+    assert ctx.bullets_well == ["• GOOD"]
+    assert ctx.bullets_improve == ["• BAD"]
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_submit_feedback_enqueues_when_enabled(monkeypatch, enabled):
+    monkeypatch.setattr(config, "INCREMENTAL_ANALYSIS", enabled)
+    calls = []
+    monkeypatch.setattr(
+        "src.reporting.incremental.submit",
+        lambda call_type, func, *args: calls.append((call_type, args)) or _DoneFuture(),
+    )
+    store = ThreadSafeSessionStore()
+    session = _session()
+    store.add_session(session)
+
+    store.submit_feedback("S-inc", "U1", "sentiment=positive, well=a, improve=b")
+
+    assert bool(calls) is enabled
+    if enabled:
+        assert calls[0] == (
+            "incremental",
+            (session, "sentiment=positive, well=a, improve=b"),
+        )
+
+
+class _DoneFuture:
+    def add_done_callback(self, _callback):
+        return None
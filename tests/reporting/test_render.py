@@ -34,7 +34,9 @@ def test_render_report_basic(processed: ProcessedFeedback):
         "src.reporting.context.anonymize_quotes", side_effect=lambda x: x
     ) as anon_mp, patch(
         "src.reporting.context.extract_themes", return_value=["communication"]
-    ) as theme_mp:
+    ) as theme_mp, patch(
+        "src.reporting.context.generate_summary", return_value=""
+    ):
         out = render_report(processed)
 
     anon_mp.assert_called_once()
@@ -73,3 +75,36 @@ def test_post_report_long_upload(processed: ProcessedFeedback):
     client.chat_postMessage.assert_called_once_with(
         channel="C123", text="*Sentiment Report for sess1*"
     )
+
+
+def test_dispatch_report_sync_by_default(processed: ProcessedFeedback):
+    from src.reporting.render import dispatch_report
+
+    with patch("src.reporting.render.post_report_to_slack") as post_mp:
+        assert dispatch_report(processed=processed, client="c", channel="C1") is None
+
+    post_mp.assert_called_once_with(processed=processed, client="c", channel="C1")
+
+
+def test_dispatch_report_async_pipeline(monkeypatch, processed: ProcessedFeedback):
+    from src import async_runtime
+    from src.reporting import config
+    from src.reporting.render import dispatch_report
+
+    async def _render(_processed):
+        return "async short"
+
+    monkeypatch.setattr(config, "ASYNC_PIPELINE", True)
+    monkeypatch.setattr("src.reporting.render.arender_report", _render)
+    client = MagicMock()
+    client.chat_postMessage.return_value = {"ts": "1.0"}
+
+    try:
+        future = dispatch_report(processed=processed, client=client, channel="C9")
+        future.result(timeout=2)
+    finally:
+        async_runtime.shutdown_loop()
+
+    client.chat_postMessage.assert_any_call(
+        channel="C9", text="async short", thread_ts="1.0"
+    )
@@ -0,0 +1,141 @@
+"""Tests for the report stage DAG runner."""
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from src.reporting.stages import Stage, StageError, arun_stages, run_stages
+
+
+def _sleepy(value, delay=0.1):
+    def _run(_results):
+        time.sleep(delay)
+        return value
+
+    return _run
+
+
+def test_independent_stages_overlap():
+    stages = [
+        Stage("root", lambda _r: 1),
+        Stage("left", _sleepy("l"), deps=("root",)),
+        Stage("right", _sleepy("r"), deps=("root",)),
+        Stage("join", lambda r: r["left"] + r["right"], deps=("left", "right")),
+    ]
+
+    run = run_stages(stages)
+
+    assert run.results["join"] == "lr"
+    # Sum of stages would be ~0.2s; the critical path is ~0.1s.
+    assert run.wall_seconds < 0.18
+    path, seconds = run.critical_path(stages)
+    assert path[0] == "root" and path[-1] == "join"
+    assert seconds == pytest.approx(0.1, abs=0.05)
+    assert {t.status for t in run.timings.values()} == {"ok"}
+
+
+def test_failure_and_timeout_use_fallbacks():
+    def boom(_results):
+        raise RuntimeError("nope")
+
+    stages = [
+        Stage("failing", boom, fallback=lambda _r: "fallback"),
+        Stage("slow", _sleepy("late", 1.0), timeout=0.05, fallback=lambda _r: "t/o"),
+        Stage("after", lambda r: (r["failing"], r["slow"]), deps=("failing", "slow")),
+    ]
+
+    start = time.monotonic()
+    run = run_stages(stages)
+
+    assert time.monotonic() - start < 0.5
+    assert run.results["after"] == ("fallback", "t/o")
+    assert run.timings["failing"].status == "failed"
+    assert run.timings["slow"].status == "timeout"
+
+
+def test_failure_without_fallback_raises():
+    def boom(_results):
+        raise RuntimeError("nope")
+
+    with pytest.raises(StageError):
+        run_stages([Stage("only", boom)])
+
+
+def test_invalid_graphs_rejected():
+    with pytest.raises(ValueError):
+        run_stages([Stage("a", lambda _r: 1, deps=("missing",))])
+    with pytest.raises(ValueError):
+        run_stages(
+            [
+                Stage("a", lambda _r: 1, deps=("b",)),
+                Stage("b", lambda _r: 1, deps=("a",)),
+            ]
+        )
+
+
+def test_arun_stages_overlaps_and_falls_back():
+    async def slow(value):
+        await asyncio.sleep(0.1)
+        return value
+
+    async def left(_results):
+        return await slow("l")
+
+    async def right(_results):
+        return await slow("r")
+
+    async def hang(_results):
+        await asyncio.sleep(5)
+
+    stages = [
+        Stage("left", left),
+        Stage("right", right),
+        Stage("hang", hang, timeout=0.05, fallback=lambda _r: "t/o"),
+        Stage("sync", lambda r: r["left"] + r["right"], deps=("left", "right")),
+    ]
+
+    run = asyncio.run(arun_stages(stages))
+
+    assert run.results["sync"] == "lr"
+    assert run.results["hang"] == "t/o"
+    assert run.timings["hang"].status == "timeout"
+    assert run.wall_seconds < 0.18
+
+
+def test_session_report_overlaps_sentiment_and_anonymization(monkeypatch):
+    """Sentiment scoring and the anonymize → themes chain run side by side."""
+
+    from src.reporting import render
+    from src.session_data import SessionData
+
+    def slow_tally(_items):
+        time.sleep(0.15)
+        return {"positive": 2}
+
+    def slow_anonymize(items):
+        time.sleep(0.15)
+        return items
+
+    monkeypatch.setattr("src.reporting.aggregator._tally_sentiments", slow_tally)
+    monkeypatch.setattr("src.reporting.context.anonymize_quotes", slow_anonymize)
+    monkeypatch.setattr("src.reporting.context.extract_themes", lambda _i: ["pace"])
+    monkeypatch.setattr(
+        "src.reporting.context.generate_summary", lambda *_a, **_k: "Summary."
+    )
+
+    session = SessionData(
+        session_id="sess-dag",
+        initiator_user_id="U1",
+        channel_id="C1",
+        target_user_ids=["U2", "U3"],
+    )
+    session.feedback_items = ["well=a, improve=b", "well=c, improve=d"]
+
+    start = time.monotonic()
+    processed, text = render.build_session_report(session)
+
+    assert time.monotonic() - start < 0.28
+    assert processed.sentiment_counts == {"positive": 2}
+    assert "pace" in text and "Summary." in text
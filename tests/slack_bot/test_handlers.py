@@ -1,8 +1,10 @@
 import logging
 import unittest
-from unittest.mock import ANY, MagicMock
+from unittest.mock import ANY, MagicMock, patch
 
+from src.admission import Overloaded
 from src.session_data import SessionData
+from src.slack_bot import handlers
 from src.slack_bot.handlers import handle_feedback_modal_submission
 
 
@@ -172,3 +174,24 @@ class TestHandlers(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main()
+
+
+def test_shed_report_is_retried_with_capped_backoff():
+    """A shed completion report keeps being re-queued, never dropped."""
+    job = MagicMock()
+    with patch("src.app.submit_background", side_effect=Overloaded("full")), patch(
+        "src.app.scheduler"
+    ) as mock_scheduler:
+        for attempt in range(1, 41):
+            handlers._queue_report("S1", job, attempt)
+
+    delays = [c.args[0] for c in mock_scheduler.schedule.call_args_list]
+    assert len(delays) == 40
+    assert delays[:3] == [2.0, 4.0, 6.0]
+    assert max(delays) == handlers.REPORT_RETRY_MAX_SECONDS
+    assert mock_scheduler.schedule.call_args.args[1:] == (
+        handlers._queue_report,
+        "S1",
+        job,
+        41,
+    )
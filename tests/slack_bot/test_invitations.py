@@ -0,0 +1,135 @@
+"""Tests for the rate-limit-aware invitation dispatcher."""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web import SlackResponse
+
+from src.executor_lanes import LaneFullError
+from src.slack_bot.invitations import InvitationDispatcher
+
+BLOCKS = [{"type": "section"}]
+
+
+def _error(code: str, status: int = 200, headers=None) -> SlackApiError:
+    response = SlackResponse(
+        client=None,
+        http_verb="POST",
+        api_url="https://slack.com/api/chat.postMessage",
+        req_args={},
+        data={"ok": False, "error": code},
+        headers=headers or {},
+        status_code=status,
+    )
+    return SlackApiError(code, response)
+
+
+def _dispatcher(**kwargs) -> tuple[InvitationDispatcher, list]:
+    sleeps: list = []
+    kwargs.setdefault("rate_per_minute", 60_000)
+    return InvitationDispatcher(sleep=sleeps.append, **kwargs), sleeps
+
+
+def test_sends_each_user_once_with_bounded_parallelism():
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+    gate = threading.Barrier(3, timeout=1)
+
+    def _post(**_kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        try:
+            gate.wait()
+        except threading.BrokenBarrierError:
+            pass
+        with lock:
+            in_flight -= 1
+
+    client = MagicMock()
+    client.chat_postMessage.side_effect = _post
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        dispatcher, _ = _dispatcher(executor=pool, concurrency=3)
+        users = [f"U{i}" for i in range(9)] + ["U0"]
+        tally = dispatcher.send(client, users, text="hi", blocks=BLOCKS)
+
+    assert (tally.total, tally.sent, tally.failed) == (9, 9, 0)
+    assert client.chat_postMessage.call_count == 9
+    assert peak == 3
+
+
+def test_throttled_call_pauses_and_retries():
+    client = MagicMock()
+    client.chat_postMessage.side_effect = [
+        _error("ratelimited", 429, {"Retry-After": "7"}),
+        None,
+    ]
+    dispatcher, sleeps = _dispatcher()
+
+    tally = dispatcher.send(client, ["U1"], text="hi", blocks=BLOCKS)
+
+    assert (tally.sent, tally.throttled, tally.retried) == (1, 1, 1)
+    # The next reservation waited out the Retry-After hint
+    assert sleeps and sleeps[-1] == pytest.approx(7, abs=0.1)
+
+
+def test_transient_errors_retry_with_backoff_then_give_up():
+    client = MagicMock()
+    client.chat_postMessage.side_effect = _error("internal_error", 500)
+    dispatcher, sleeps = _dispatcher(max_attempts=3, backoff_seconds=0.5)
+
+    tally = dispatcher.send(client, ["U1"], text="hi", blocks=BLOCKS)
+
+    assert client.chat_postMessage.call_count == 3
+    assert (tally.sent, tally.failed, tally.retried) == (0, 1, 2)
+    assert tally.failed_user_ids == ["U1"]
+    assert [s for s in sleeps if s >= 0.5] == [0.5, 1.0]
+
+
+def test_permanent_error_fails_without_retry():
+    client = MagicMock()
+    client.chat_postMessage.side_effect = [_error("user_not_found"), None]
+    dispatcher, _ = _dispatcher()
+
+    tally = dispatcher.send(client, ["U1", "U2"], text="hi", blocks=BLOCKS)
+
+    assert client.chat_postMessage.call_count == 2
+    assert (tally.sent, tally.failed, tally.failed_user_ids) == (1, 1, ["U1"])
+
+
+def test_rate_budget_paces_requests():
+    client = MagicMock()
+    dispatcher, sleeps = _dispatcher(rate_per_minute=60, concurrency=2)
+
+    dispatcher.send(client, [f"U{i}" for i in range(5)], text="hi", blocks=BLOCKS)
+
+    # Two requests fit the burst; the rest wait about a second each
+    assert len(sleeps) == 3
+    assert sleeps[-1] == pytest.approx(3, abs=0.1)
+
+
+def test_progress_and_full_lane_fallback():
+    client = MagicMock()
+    lane = MagicMock()
+    lane.submit.side_effect = LaneFullError("full")
+    dispatcher, _ = _dispatcher(executor=lane, concurrency=4)
+    seen = []
+
+    tally = dispatcher.send(
+        client,
+        [f"U{i}" for i in range(8)],
+        text="hi",
+        blocks=BLOCKS,
+        on_progress=lambda t: seen.append(t.done),
+        progress_every=2,
+    )
+
+    assert tally.sent == 8
+    assert seen == [2, 4, 6]
+    lane.submit.assert_called_once()
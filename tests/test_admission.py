@@ -0,0 +1,70 @@
+"""Tests for priority-aware admission control."""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from src.admission import AdmissionController, Overloaded, Priority, shares_from_env
+from src.executor_lanes import ExecutorLane
+
+
+@pytest.fixture()
+def lanes():
+    gate = threading.Event()
+    created = {
+        "interactive": ExecutorLane("interactive", workers=1, queue=3),
+        "reporting": ExecutorLane("reporting", workers=1, queue=3),
+    }
+    yield created, gate
+    gate.set()
+    for lane in created.values():
+        lane.shutdown()
+
+
+def test_priorities_fill_different_shares(lanes):
+    created, gate = lanes
+    admission = AdmissionController(created, {Priority.LOW: 0.5, Priority.NORMAL: 0.75})
+
+    for _ in range(2):
+        admission.submit("interactive", Priority.LOW, gate.wait, 1)
+    with pytest.raises(Overloaded):
+        admission.submit("interactive", Priority.LOW, gate.wait, 1)
+
+    # NORMAL (0.75 of 4) admits one more, HIGH may use the last slot
+    admission.submit("interactive", Priority.NORMAL, gate.wait, 1)
+    with pytest.raises(Overloaded):
+        admission.submit("interactive", Priority.NORMAL, gate.wait, 1)
+    admission.submit("interactive", Priority.HIGH, gate.wait, 1)
+    with pytest.raises(Overloaded):
+        admission.submit("interactive", Priority.HIGH, gate.wait, 1)
+
+    stats = admission.stats()
+    assert stats["shed_total"] == 3
+    assert stats["shed"] == {
+        "interactive.low": 1,
+        "interactive.normal": 1,
+        "interactive.high": 1,
+    }
+
+
+def test_reporting_backlog_sheds_new_sessions(lanes):
+    created, gate = lanes
+    admission = AdmissionController(created)
+
+    for _ in range(3):
+        admission.submit("reporting", Priority.HIGH, gate.wait, 1)
+
+    with pytest.raises(Overloaded, match="reporting"):
+        admission.submit("interactive", Priority.LOW, lambda: None)
+    # Other interactive work is unaffected by the reporting backlog
+    assert admission.submit("interactive", Priority.NORMAL, lambda: 1).result(1) == 1
+    assert admission.shed_total == 1
+
+
+def test_shares_from_env(monkeypatch):
+    monkeypatch.setenv("ADMISSION_LOW_SHARE", "0.5")
+    monkeypatch.setenv("ADMISSION_NORMAL_SHARE", "1.5")
+    shares = shares_from_env()
+    assert shares[Priority.LOW] == 0.5
+    assert shares[Priority.NORMAL] == 0.9
@@ -0,0 +1,109 @@
+"""Tests for the bounded-concurrency fan-out helper."""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from src.analysis import concurrency as cc
+
+
+@pytest.fixture(autouse=True)
+def fresh_pools():
+    """Recreate pools per test so env-configured limits take effect."""
+
+    cc.shutdown_pools()
+    yield
+    cc.shutdown_pools()
+
+
+def test_results_keep_input_order():
+    def slow_echo(x: int) -> int:
+        time.sleep(0.01 * (5 - x))  # later items finish first
+        return x
+
+    outcomes = cc.fan_out("test", slow_echo, list(range(5)))
+    assert [o.value for o in outcomes] == [0, 1, 2, 3, 4]
+    assert all(o.ok for o in outcomes)
+
+
+def test_failure_does_not_cancel_siblings():
+    def maybe_fail(x: int) -> int:
+        if x == 1:
+            raise RuntimeError("boom")
+        return x * 10
+
+    outcomes = cc.fan_out("test", maybe_fail, [0, 1, 2])
+    assert outcomes[0].value == 0
+    assert not outcomes[1].ok and isinstance(outcomes[1].error, RuntimeError)
+    assert outcomes[2].value == 20
+
+
+def test_concurrency_is_bounded_per_call_type(monkeypatch):
+    monkeypatch.setenv("ANALYSIS_CONCURRENCY_BOUNDED", "2")
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def track(_x: int) -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+
+    cc.fan_out("bounded", track, list(range(8)))
+    assert peak == 2
+
+
+def test_concurrency_limit_env_fallbacks(monkeypatch):
+    monkeypatch.delenv("ANALYSIS_CONCURRENCY", raising=False)
+    monkeypatch.delenv("ANALYSIS_CONCURRENCY_SENTIMENT", raising=False)
+    assert cc.concurrency_limit("sentiment") == 4
+
+    monkeypatch.setenv("ANALYSIS_CONCURRENCY", "6")
+    assert cc.concurrency_limit("sentiment") == 6
+
+    monkeypatch.setenv("ANALYSIS_CONCURRENCY_SENTIMENT", "3")
+    assert cc.concurrency_limit("sentiment") == 3
+
+    monkeypatch.setenv("ANALYSIS_CONCURRENCY_SENTIMENT", "zero")
+    assert cc.concurrency_limit("sentiment") == 6
+
+
+def test_nested_fan_out_runs_inline():
+    """Fanning out from a worker of the same pool must not deadlock."""
+
+    limit = cc.concurrency_limit("nested")
+
+    def outer(x: int) -> list[int]:
+        return [o.value for o in cc.fan_out("nested", lambda y: y + x, [1, 2])]
+
+    outcomes = cc.fan_out("nested", outer, list(range(limit + 1)))
+    assert [o.value for o in outcomes][:2] == [[1, 2], [2, 3]]
+
+
+def test_afan_out_keeps_order_and_bounds_concurrency(monkeypatch):
+    import asyncio
+
+    monkeypatch.setenv("ANALYSIS_CONCURRENCY_ABOUNDED", "2")
+    active = 0
+    peak = 0
+
+    async def work(x: int) -> int:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if x == 3:
+            raise ValueError("boom")
+        return x * 10
+
+    outcomes = asyncio.run(cc.afan_out("abounded", work, list(range(6))))
+    assert peak == 2
+    assert [o.value for o in outcomes if o.ok] == [0, 10, 20, 40, 50]
+    assert isinstance(outcomes[3].error, ValueError)
@@ -1,6 +1,6 @@
 # tests/test_app.py
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import src.app as app
 from src.app import process_gather_feedback_request  # Import the worker function
@@ -53,22 +53,23 @@ def test_custom_error_handler(mock_app_logger):
 # --- Tests for /gather-feedback Command Handler --- #
 
 
-@patch("src.app.executor")
 @patch("src.app.logger")
-def test_handle_gather_feedback_command_submits_to_executor(mock_logger, mock_executor):
-    """Test that handle_gather_feedback_command submits the worker to the executor."""
+def test_handle_gather_feedback_command_submits_to_executor(mock_logger):
+    """Test that handle_gather_feedback_command submits to the interactive lane."""
     mock_ack = MagicMock()
     mock_respond = MagicMock()
     mock_client = MagicMock()
     command_payload = {"user_id": "U_TESTER"}
+    mock_executor = MagicMock()
 
-    handle_gather_feedback_command(
-        ack=mock_ack,
-        command=command_payload,
-        client=mock_client,
-        logger=mock_logger,
-        respond=mock_respond,
-    )
+    with patch.dict(app.lanes, {"interactive": mock_executor}):
+        handle_gather_feedback_command(
+            ack=mock_ack,
+            command=command_payload,
+            client=mock_client,
+            logger=mock_logger,
+            respond=mock_respond,
+        )
 
     mock_ack.assert_called_once()
     mock_executor.submit.assert_called_once_with(
@@ -83,23 +84,24 @@ def test_handle_gather_feedback_command_submits_to_executor(mock_logger, mock_ex
     )
 
 
-@patch("src.app.executor")
 @patch("src.app.logger")
-def test_handle_gather_feedback_command_submission_error(mock_logger, mock_executor):
+def test_handle_gather_feedback_command_submission_error(mock_logger):
     """Test error handling when executor.submit fails."""
     mock_ack = MagicMock()
     mock_respond = MagicMock()
     command_payload = {"user_id": "U_ERROR_USER"}
     test_exception = Exception("Pool is closed")
+    mock_executor = MagicMock()
     mock_executor.submit.side_effect = test_exception
 
-    handle_gather_feedback_command(
-        ack=mock_ack,
-        command=command_payload,
-        client=MagicMock(),
-        logger=mock_logger,
-        respond=mock_respond,
-    )
+    with patch.dict(app.lanes, {"interactive": mock_executor}):
+        handle_gather_feedback_command(
+            ack=mock_ack,
+            command=command_payload,
+            client=MagicMock(),
+            logger=mock_logger,
+            respond=mock_respond,
+        )
 
     mock_ack.assert_called_once()
     mock_respond.assert_called_once_with(
@@ -111,6 +113,28 @@ def test_handle_gather_feedback_command_submission_error(mock_logger, mock_execu
     )
 
 
+@patch("src.app.logger")
+def test_handle_gather_feedback_command_shed_when_busy(mock_logger):
+    """A full lane sheds the command with a friendly retry message."""
+    mock_respond = MagicMock()
+    mock_executor = MagicMock()
+    mock_executor.has_room.return_value = False
+
+    with patch.dict(app.lanes, {"interactive": mock_executor}):
+        handle_gather_feedback_command(
+            ack=MagicMock(),
+            command={"user_id": "U_BUSY"},
+            client=MagicMock(),
+            logger=mock_logger,
+            respond=mock_respond,
+        )
+
+    mock_executor.submit.assert_not_called()
+    mock_executor.has_room.assert_called_once_with(0.75)
+    assert "try again in a minute" in mock_respond.call_args.args[0]
+    mock_logger.warning.assert_called_once()
+
+
 # --- Tests for process_gather_feedback_request Worker Function --- #
 
 
@@ -143,11 +167,15 @@ class TestProcessGatherFeedbackRequest:
                 logger=mock_logger,
             )
 
-        mock_respond.assert_called_once_with(
-            f"Okay, I've initiated a feedback session (ID: {session_id}) for "
-            "<!subteam^SGROUPID|@test-group> (with 2 member(s)), "
-            "for 5 minutes. I'll reach out to them shortly."
-        )
+        assert mock_respond.call_args_list == [
+            call(
+                f"Okay, I've initiated a feedback session (ID: {session_id}) for "
+                "<!subteam^SGROUPID|@test-group> (with 2 member(s)), "
+                "for 5 minutes. I'll reach out to them shortly."
+            ),
+            call(f"Invitations for session {session_id}: 2 of 2 sent."),
+        ]
+        assert mock_client.chat_postMessage.call_count == 2
         assert mock_session_store.add_session.call_count == 1
         added_session = mock_session_store.add_session.call_args[0][0]
         assert isinstance(added_session, SessionData)
@@ -180,7 +208,7 @@ class TestProcessGatherFeedbackRequest:
         mock_session_store.add_session.assert_called_once()
         added_session = mock_session_store.add_session.call_args[0][0]
         assert added_session.time_limit_minutes == 10
-        mock_respond.assert_called_once_with(
+        mock_respond.assert_any_call(
             "Okay, I've initiated a feedback session (ID: fake-uuid-time) for "
             "<!subteam^SGROUPID|@group> (with 1 member(s)), "
             "for 10 minutes. I'll reach out to them shortly."
@@ -205,7 +233,8 @@ class TestProcessGatherFeedbackRequest:
         )
         # Should call get_channel_members once
         mock_members.assert_called_once_with(mock_client, "C123")
-        mock_respond.assert_called_once()
+        assert mock_respond.call_count == 2
+        assert mock_respond.call_args.args[0].endswith("2 of 2 sent.")
 
     @patch("src.app.logger")
     def test_invalid_format_totally_unparseable(self, mock_logger):
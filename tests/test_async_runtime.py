@@ -0,0 +1,41 @@
+"""Tests for the shared background event loop."""
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from src import async_runtime
+
+
+def test_run_coroutine_executes_on_background_thread():
+    async def where() -> str:
+        await asyncio.sleep(0)
+        return threading.current_thread().name
+
+    try:
+        assert async_runtime.run_coroutine(where()).result(timeout=2) == (
+            "async-runtime"
+        )
+        # The same loop is reused for subsequent work.
+        assert async_runtime.get_loop() is async_runtime.get_loop()
+    finally:
+        async_runtime.shutdown_loop()
+
+
+def test_shutdown_cancels_pending_tasks_and_restarts_lazily():
+    started = threading.Event()
+
+    async def forever() -> None:
+        started.set()
+        await asyncio.sleep(3600)
+
+    future = async_runtime.run_coroutine(forever())
+    assert started.wait(timeout=2)
+    async_runtime.shutdown_loop()
+    assert future.cancelled()
+
+    # A fresh loop is started on next use.
+    try:
+        assert async_runtime.run_coroutine(asyncio.sleep(0, "ok")).result(2) == "ok"
+    finally:
+        async_runtime.shutdown_loop()
@@ -0,0 +1,66 @@
+"""Tests for bounded executor lanes."""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from src.executor_lanes import ExecutorLane, LaneFullError, create_lanes
+from src.scheduler import Scheduler
+
+
+def test_lane_rejects_when_full_and_reports_saturation():
+    lane = ExecutorLane("reporting", workers=1, queue=1)
+    gate = threading.Event()
+    started = threading.Event()
+
+    def _block() -> None:
+        started.set()
+        gate.wait(1)
+
+    first = lane.submit(_block)
+    assert started.wait(1)
+    second = lane.submit(lambda: "queued")
+    assert lane.saturation == 1.0
+    with pytest.raises(LaneFullError):
+        lane.submit(lambda: None)
+
+    gate.set()
+    first.result(1)
+    assert second.result(1) == "queued"
+    lane.shutdown()
+    stats = lane.stats()
+    assert stats["rejected"] == 1
+    assert stats["completed"] == 2
+    assert stats["saturation"] == 0.0
+
+
+def test_lane_sizes_from_env(monkeypatch):
+    monkeypatch.setenv("LANE_REPORTING_WORKERS", "3")
+    monkeypatch.setenv("LANE_REPORTING_QUEUE", "oops")
+    lanes = create_lanes()
+    try:
+        assert set(lanes) == {"interactive", "fanout", "reporting", "timers"}
+        assert lanes["reporting"].workers == 3
+        assert lanes["reporting"].queue_limit == 50  # invalid value ignored
+    finally:
+        for lane in lanes.values():
+            lane.shutdown()
+
+
+def test_scheduler_retries_tasks_its_lane_rejected():
+    timers = ExecutorLane("timers", workers=1, queue=0)
+    reporting = ExecutorLane("reporting", workers=1, queue=0)
+    gate = threading.Event()
+    done = threading.Event()
+    sched = Scheduler(timers)
+    sched.register_task("report", lambda: done.set(), executor=reporting)
+
+    reporting.submit(gate.wait, 1)  # lane is now full
+    sched.schedule_task("report", 0)
+    assert not done.wait(0.2)
+    gate.set()
+    assert done.wait(1)
+    sched.shutdown()
+    timers.shutdown()
+    reporting.shutdown()
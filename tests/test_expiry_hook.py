@@ -39,3 +39,34 @@ def test_expire_feedback_session(monkeypatch, session_present):
         mock_client.chat_postMessage.assert_called_once()
     else:
         mock_client.chat_postMessage.assert_not_called()
+
+
+def test_sweep_evicts_and_reschedules(monkeypatch):
+    """The abandoned-session sweep runs eviction and queues its next run."""
+    mock_store = MagicMock()
+    mock_store.evict_expired.return_value = [MagicMock()]
+    mock_scheduler = MagicMock()
+    monkeypatch.setattr(app, "session_store", mock_store)
+    monkeypatch.setattr(app, "scheduler", mock_scheduler)
+
+    app._sweep_abandoned_sessions()
+
+    mock_store.evict_expired.assert_called_once_with()
+    mock_scheduler.schedule.assert_called_once_with(
+        app.SESSION_SWEEP_INTERVAL_SECONDS, app._sweep_abandoned_sessions
+    )
+
+
+def test_session_close_cancels_timers(monkeypatch):
+    """Removing a session cancels its expiry and reminder."""
+    mock_scheduler = MagicMock()
+    mock_scheduler.schedule_task.side_effect = [11, 12]
+    monkeypatch.setattr(app, "scheduler", mock_scheduler)
+    session = MagicMock(session_id="sess-timers", initiator_user_id="UINIT")
+    session.time_remaining.return_value = 600
+
+    app._schedule_session_timers(session)
+    app._cancel_session_timers("sess-timers")
+    app._cancel_session_timers("sess-timers")
+
+    assert [c.args for c in mock_scheduler.cancel.call_args_list] == [(11,), (12,)]
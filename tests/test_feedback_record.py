@@ -0,0 +1,74 @@
+"""Tests for typed feedback records."""
+from __future__ import annotations
+
+from src.feedback_record import FeedbackRecord, to_record
+from src.reporting.aggregator import process_session
+from src.reporting.context import highlight_texts
+from src.session_data import SessionData
+
+
+def test_record_normalises_fields():
+    record = FeedbackRecord(
+        user_id="U1", sentiment="excited", well="  ", improve="None"
+    )
+    assert record.sentiment is None
+    assert record.well is None
+    assert record.improve is None
+
+
+def test_highlights_survive_commas_and_markers():
+    """Answers containing commas or 'well=' are no longer truncated."""
+
+    record = FeedbackRecord(
+        user_id="U1",
+        sentiment="positive",
+        well="pairing, reviews, and well=everything",
+        improve="fewer meetings, please",
+    )
+    texts, split = highlight_texts([record])
+    assert texts == ["pairing, reviews, and well=everything", "fewer meetings, please"]
+    assert split == 1
+
+
+def test_legacy_strings_are_parsed_once():
+    record = to_record("sentiment=negative, well=ok, sort of, improve=tests")
+    assert (record.sentiment, record.well, record.improve) == (
+        "negative",
+        "ok, sort of",
+        "tests",
+    )
+    free = to_record("Just some free text")
+    assert free.comment == "Just some free text"
+    assert free.free_text == "Just some free text"
+    assert to_record(record) is record
+
+
+def test_free_text_skips_empty_fields():
+    record = FeedbackRecord(user_id="U1", sentiment="neutral", well="pairing")
+    assert record.free_text == "well=pairing"
+    assert record.as_text() == "sentiment=neutral, well=pairing"
+    assert FeedbackRecord(user_id="U1", sentiment="neutral").free_text == ""
+
+
+def test_aggregator_groups_records_by_user(monkeypatch):
+    from src.reporting import config
+
+    monkeypatch.setattr(config, "SENTIMENT_MODE", "structured")
+    session = SessionData(
+        session_id="S1",
+        initiator_user_id="U0",
+        channel_id="C1",
+        target_user_ids=["U1", "U2"],
+    )
+    session.submit(
+        "U1", FeedbackRecord(user_id="U1", sentiment="positive", well="a", improve="b")
+    )
+    session.submit(
+        "U2", FeedbackRecord(user_id="U2", sentiment="neutral", well="c", improve="d")
+    )
+
+    processed = process_session(session)
+
+    assert processed.sentiment_counts == {"positive": 1, "neutral": 1}
+    assert set(processed.per_user) == {"U1", "U2"}
+    assert processed.all_items[0] == "sentiment=positive, well=a, improve=b"
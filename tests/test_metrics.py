@@ -0,0 +1,17 @@
+"""Tests for the in-process Histogram."""
+from __future__ import annotations
+
+from src.metrics import Histogram
+
+
+def test_histogram_snapshot_and_quantiles():
+    hist = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 3.0):
+        hist.observe(value)
+
+    snap = hist.snapshot()
+    assert snap["count"] == 4
+    assert snap["buckets"] == {"0.1": 2, "1.0": 1, "+Inf": 1}
+    assert snap["p50"] == 0.1
+    assert snap["p99"] == 3.0  # +Inf bucket reports the observed maximum
+    assert Histogram().quantile(0.5) == 0.0
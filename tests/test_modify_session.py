@@ -56,6 +56,67 @@ class TestModifySession(unittest.TestCase):
         final = self.store.get_session(self.session_id)
         self.assertIn(final.feedback_sentiment, sentiments)
 
+    def test_modify_does_not_block_other_sessions(self):
+        self.store.add_session(
+            SessionData(
+                session_id="s2",
+                initiator_user_id="u2",
+                channel_id="c2",
+                target_user_ids=["t2"],
+            )
+        )
+        entered = threading.Event()
+        release = threading.Event()
+
+        def slow(s: SessionData) -> None:
+            entered.set()
+            release.wait(5)
+
+        holder = threading.Thread(
+            target=self.store.modify_session, args=(self.session_id, slow)
+        )
+        holder.start()
+        try:
+            self.assertTrue(entered.wait(5))
+            # s1's lock is held; s2 and the session table stay available.
+            self.store.modify_session(
+                "s2", lambda s: setattr(s, "feedback_sentiment", "ok")
+            )
+            self.assertEqual(self.store.get_session("s2").feedback_sentiment, "ok")
+            self.assertEqual(self.store.count(), 2)
+        finally:
+            release.set()
+            holder.join(5)
+
+    def test_modify_raises_if_removed_while_waiting(self):
+        entered = threading.Event()
+        release = threading.Event()
+        errors: List[Exception] = []
+
+        def slow(s: SessionData) -> None:
+            entered.set()
+            release.wait(5)
+
+        def waiter() -> None:
+            try:
+                self.store.modify_session(self.session_id, lambda s: None)
+            except ValueError as exc:
+                errors.append(exc)
+
+        holder = threading.Thread(
+            target=self.store.modify_session, args=(self.session_id, slow)
+        )
+        holder.start()
+        self.assertTrue(entered.wait(5))
+        second = threading.Thread(target=waiter)
+        second.start()
+        self.store.remove_session(self.session_id)
+        release.set()
+        holder.join(5)
+        second.join(5)
+
+        self.assertEqual(len(errors), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,121 @@
+"""Tests for the chat completion response cache."""
+from __future__ import annotations
+
+import importlib
+import sys
+from types import ModuleType
+
+import pytest
+
+from src.openai_cache import ResponseCache, make_cache_key
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_key_is_stable_and_parameter_sensitive():
+    msgs = [{"role": "user", "content": "hi"}]
+    k1 = make_cache_key("m", msgs, {"temperature": 0, "max_tokens": 5})
+    k2 = make_cache_key("m", msgs, {"max_tokens": 5, "temperature": 0})
+    k3 = make_cache_key("m", msgs, {"temperature": 0, "max_tokens": 6})
+    assert k1 == k2
+    assert k1 != k3
+    assert k1 != make_cache_key("other", msgs, {"temperature": 0, "max_tokens": 5})
+
+
+def test_lru_eviction_and_counters():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    assert cache.get("a") == {"v": 1}  # touch "a" so "b" is least recent
+    cache.set("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+    assert cache.stats() == {"hits": 2, "misses": 1, "size": 2}
+
+
+def test_ttl_expiry():
+    clock = _Clock()
+    cache = ResponseCache(ttl_seconds=10, clock=clock)
+    cache.set("k", {"v": 1})
+    clock.now += 9
+    assert cache.get("k") == {"v": 1}
+    clock.now += 2
+    assert cache.get("k") is None
+
+
+def test_hits_return_independent_copies():
+    cache = ResponseCache()
+    cache.set("k", {"choices": [1]})
+    first = cache.get("k")
+    first["choices"].append(2)
+    assert cache.get("k") == {"choices": [1]}
+
+
+def test_sqlite_tier_survives_new_instance(tmp_path):
+    db = str(tmp_path / "cache.db")
+    first = ResponseCache(db_path=db)
+    first.set("k", {"v": "persisted"})
+    first.close()
+
+    second = ResponseCache(db_path=db)
+    assert second.get("k") == {"v": "persisted"}
+    assert second.hits == 1
+    second.close()
+
+
+class _CountingChatCompletion:
+    calls = 0
+
+    @classmethod
+    def create(cls, **kwargs):
+        cls.calls += 1
+        return {"choices": [{"message": {"content": "nothing"}}], "n": cls.calls}
+
+
+@pytest.fixture()
+def client_module(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.delenv("OPENAI_CACHE_PATH", raising=False)
+    monkeypatch.delenv("OPENAI_CACHE_ENABLED", raising=False)
+    fake_openai = ModuleType("openai")
+    _CountingChatCompletion.calls = 0
+    fake_openai.ChatCompletion = _CountingChatCompletion  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "openai", fake_openai)
+    monkeypatch.delitem(sys.modules, "src.openai_client", raising=False)
+    return importlib.import_module("src.openai_client")
+
+
+def test_deterministic_calls_are_cached(client_module):
+    msgs = [{"role": "user", "content": "nothing"}]
+    first = client_module.chat_completion(msgs, temperature=0)
+    second = client_module.chat_completion(msgs, temperature=0)
+
+    assert first == second
+    assert _CountingChatCompletion.calls == 1
+    assert client_module.cache_stats()["hits"] == 1
+
+
+def test_sampled_calls_bypass_cache_unless_forced(client_module):
+    msgs = [{"role": "user", "content": "summarise"}]
+    client_module.chat_completion(msgs, temperature=0.4)
+    client_module.chat_completion(msgs, temperature=0.4)
+    assert _CountingChatCompletion.calls == 2
+
+    client_module.chat_completion(msgs, temperature=0.4, cache=True)
+    client_module.chat_completion(msgs, temperature=0.4, cache=True)
+    assert _CountingChatCompletion.calls == 3
+
+
+def test_cache_can_be_disabled(client_module, monkeypatch):
+    monkeypatch.setenv("OPENAI_CACHE_ENABLED", "false")
+    msgs = [{"role": "user", "content": "nothing"}]
+    client_module.chat_completion(msgs, temperature=0)
+    client_module.chat_completion(msgs, temperature=0)
+    assert _CountingChatCompletion.calls == 2
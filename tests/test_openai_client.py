@@ -78,3 +78,159 @@ def test_chat_completion_wrapper(monkeypatch):
     assert result["called_with"]["model"] == "gpt-4.1"
     assert result["called_with"]["messages"][0]["content"] == "Hello"
     assert result["called_with"]["temperature"] == 0
+
+
+class _FakeLimits:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+class _FakeTimeout:
+    def __init__(self, read, *, connect):
+        self.read = read
+        self.connect = connect
+
+
+class _FakeHttpClient:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeCompletions:
+    def create(self, **kwargs):
+        from types import SimpleNamespace
+
+        message = SimpleNamespace(content=f"echo {kwargs['messages'][0]['content']}")
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=message)], model=kwargs["model"]
+        )
+
+
+class _FakeOpenAIClient:
+    instances = 0
+
+    def __init__(self, **kwargs):
+        from types import SimpleNamespace
+
+        type(self).instances += 1
+        self.kwargs = kwargs
+        self.chat = SimpleNamespace(completions=_FakeCompletions())
+
+    def close(self):
+        self.kwargs["http_client"].close()
+
+
+def _install_v1_stub(monkeypatch):
+    fake_openai = ModuleType("openai")
+    fake_openai.OpenAI = _FakeOpenAIClient  # type: ignore[attr-defined]
+    fake_openai.DefaultHttpxClient = _FakeHttpClient  # type: ignore[attr-defined]
+    fake_openai.DEFAULT_CONNECTION_LIMITS = _FakeLimits()  # type: ignore[attr-defined]
+    fake_openai.Timeout = _FakeTimeout  # type: ignore[attr-defined]
+    _FakeOpenAIClient.instances = 0
+    monkeypatch.setitem(sys.modules, "openai", fake_openai)
+    return fake_openai
+
+
+def test_pooled_client_is_built_once(monkeypatch):
+    """The ≥1.0 client is created once with tuned pool limits and reused."""
+
+    import threading
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_MAX_CONNECTIONS", "7")
+    monkeypatch.setenv("OPENAI_TIMEOUT_SECONDS", "12")
+    _install_v1_stub(monkeypatch)
+    oc = reload_client_module()
+
+    seen = []
+    threads = [
+        threading.Thread(target=lambda: seen.append(oc.get_openai_client()))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert _FakeOpenAIClient.instances == 1
+    assert all(c is seen[0] for c in seen)
+
+    client = seen[0]
+    http_client = client.kwargs["http_client"]
+    assert http_client.kwargs["limits"].kwargs["max_connections"] == 7
+    assert client.kwargs["timeout"].read == 12.0
+    assert client.kwargs["api_key"] == "test-key"
+
+
+def test_pooled_client_chat_completion_and_close(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    _install_v1_stub(monkeypatch)
+    oc = reload_client_module()
+
+    result = oc.chat_completion([{"role": "user", "content": "Hi"}])
+    assert result["choices"][0]["message"]["content"] == "echo Hi"
+
+    http_client = oc.get_openai_client().kwargs["http_client"]
+    oc.close_openai_client()
+    assert http_client.closed
+    oc.get_openai_client()
+    assert _FakeOpenAIClient.instances == 2
+
+
+class _FakeAsyncHttpClient(_FakeHttpClient):
+    async def aclose(self):
+        self.closed = True
+
+
+class _FakeAsyncCompletions:
+    async def create(self, **kwargs):
+        return _FakeCompletions().create(**kwargs)
+
+
+class _FakeAsyncOpenAIClient(_FakeOpenAIClient):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.chat.completions = _FakeAsyncCompletions()
+
+    async def close(self):
+        await self.kwargs["http_client"].aclose()
+
+
+def test_async_chat_completion_uses_async_client(monkeypatch):
+    import asyncio
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    fake_openai = _install_v1_stub(monkeypatch)
+    fake_openai.AsyncOpenAI = _FakeAsyncOpenAIClient  # type: ignore[attr-defined]
+    fake_openai.DefaultAsyncHttpxClient = (  # type: ignore[attr-defined]
+        _FakeAsyncHttpClient
+    )
+    oc = reload_client_module()
+
+    async def run():
+        result = await oc.achat_completion([{"role": "user", "content": "Hi"}])
+        client = oc.get_async_openai_client()
+        await oc.aclose_openai_client()
+        return result, client
+
+    result, client = asyncio.run(run())
+    assert result["choices"][0]["message"]["content"] == "echo Hi"
+    assert isinstance(client, _FakeAsyncOpenAIClient)
+    assert client.kwargs["http_client"].closed
+
+
+def test_async_chat_completion_legacy_sdk_falls_back_to_thread(monkeypatch):
+    import asyncio
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    _install_openai_stub(monkeypatch)
+    oc = reload_client_module()
+
+    result = asyncio.run(
+        oc.achat_completion([{"role": "user", "content": "Hello"}], temperature=0)
+    )
+    assert result["called_with"]["messages"][0]["content"] == "Hello"
@@ -0,0 +1,133 @@
+"""Tests for the OpenAI rate limiter primitives and chat_completion wiring."""
+from __future__ import annotations
+
+import importlib
+import sys
+from types import ModuleType, SimpleNamespace
+
+from src.openai_ratelimit import (
+    AdaptiveConcurrency,
+    RateLimiter,
+    TokenBucket,
+    is_rate_limit_error,
+    retry_after_seconds,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_queues_after_burst():
+    clock = _Clock()
+    bucket = TokenBucket(60, burst=2, clock=clock)  # 1 token / second
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 1.0  # third caller waits one refill
+    assert bucket.reserve() == 2.0  # and the next one queues behind it
+
+    clock.now += 10
+    assert bucket.reserve() == 0
+
+
+def test_token_bucket_pause_honours_retry_after():
+    clock = _Clock()
+    bucket = TokenBucket(600, clock=clock)
+    bucket.pause(5)
+    assert bucket.reserve() == 5.0
+    clock.now += 5
+    assert bucket.reserve() == 0
+
+
+def test_aimd_window():
+    clock = _Clock()
+    window = AdaptiveConcurrency(8, minimum=1, maximum=8, clock=clock)
+
+    window.on_throttle()
+    assert window.limit == 4
+    window.on_throttle()  # echo within cooldown is ignored
+    assert window.limit == 4
+
+    clock.now += 2
+    window.on_throttle()
+    assert window.limit == 2
+
+    for _ in range(2):
+        window.on_success()  # +1/limit per success → +1 per window
+    assert window.limit == 2
+    window.on_success()
+    assert window.limit == 3
+
+
+def test_aimd_blocks_when_window_full():
+    window = AdaptiveConcurrency(1)
+    assert window.try_acquire()
+    assert not window.try_acquire()
+    window.release()
+    assert window.try_acquire()
+
+
+def test_limiter_sleeps_for_budget():
+    sleeps = []
+    limiter = RateLimiter(tokens_per_minute=60, sleep=sleeps.append)
+    with limiter.slot(60):
+        pass
+    with limiter.slot(30):
+        pass
+    assert len(sleeps) == 1 and 29 < sleeps[0] <= 30
+
+
+def _rate_limit_error(headers):
+    exc = Exception("slow down")
+    exc.status_code = 429  # type: ignore[attr-defined]
+    exc.response = SimpleNamespace(headers=headers)  # type: ignore[attr-defined]
+    return exc
+
+
+def test_retry_after_parsing():
+    assert retry_after_seconds(_rate_limit_error({"Retry-After": "3"})) == 3.0
+    assert retry_after_seconds(_rate_limit_error({"retry-after-ms": "250"})) == 0.25
+    assert (
+        retry_after_seconds(
+            _rate_limit_error(
+                {"x-ratelimit-reset-requests": "1s", "x-ratelimit-reset-tokens": "1m2s"}
+            )
+        )
+        == 62.0
+    )
+    assert retry_after_seconds(_rate_limit_error({})) is None
+    assert is_rate_limit_error(_rate_limit_error({}))
+    assert not is_rate_limit_error(ValueError("nope"))
+
+
+class _ThrottlingChatCompletion:
+    calls = 0
+
+    @classmethod
+    def create(cls, **kwargs):
+        cls.calls += 1
+        if cls.calls == 1:
+            raise _rate_limit_error({"retry-after": "0"})
+        return {"choices": [{"message": {"content": "ok"}}]}
+
+
+def test_chat_completion_requeues_throttled_request(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_CACHE_ENABLED", "false")
+    fake_openai = ModuleType("openai")
+    fake_openai.ChatCompletion = _ThrottlingChatCompletion  # type: ignore[attr-defined]
+    _ThrottlingChatCompletion.calls = 0
+    monkeypatch.setitem(sys.modules, "openai", fake_openai)
+    monkeypatch.delitem(sys.modules, "src.openai_client", raising=False)
+    oc = importlib.import_module("src.openai_client")
+
+    result = oc.chat_completion([{"role": "user", "content": "hi"}])
+
+    assert result["choices"][0]["message"]["content"] == "ok"
+    assert _ThrottlingChatCompletion.calls == 2
+    assert oc.get_rate_limiter().stats()["throttled"] == 1
@@ -0,0 +1,116 @@
+"""Tests for the shared retry/back-off and circuit breaker layer."""
+from __future__ import annotations
+
+import pytest
+
+from src.openai_resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    Resilience,
+    RetryPolicy,
+    classify_error,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class APITimeoutError(Exception):
+    """Named like the SDK's timeout error."""
+
+
+class _StatusError(Exception):
+    def __init__(self, status: int) -> None:
+        super().__init__(f"HTTP {status}")
+        self.status_code = status
+
+
+def test_classify_error():
+    assert classify_error(_StatusError(429)) == "rate_limit"
+    assert classify_error(APITimeoutError()) == "timeout"
+    assert classify_error(ConnectionResetError()) == "connection"
+    assert classify_error(_StatusError(503)) == "server"
+    assert classify_error(_StatusError(400)) == "client"
+    assert classify_error(KeyError("x")) == "fatal"
+
+
+def test_backoff_is_exponential_with_jitter_and_capped():
+    policy = RetryPolicy(base_delay=1, max_delay=5)
+    assert policy.delay(1, rng=lambda: 1.0) == 1
+    assert policy.delay(3, rng=lambda: 1.0) == 4
+    assert policy.delay(10, rng=lambda: 1.0) == 5
+    assert policy.delay(3, rng=lambda: 0.5) == 2
+    assert policy.delay(3, retry_after=7) == 7
+
+
+def test_transient_errors_are_retried():
+    sleeps = []
+    calls = {"n": 0}
+
+    def flaky():
+        calls["n"] += 1
+        if calls["n"] < 3:
+            raise _StatusError(502)
+        return "ok"
+
+    res = Resilience(sleep=sleeps.append, rng=lambda: 1.0)
+    assert res.call(flaky) == "ok"
+    assert sleeps == [0.5, 1.0]
+
+
+def test_client_errors_are_not_retried():
+    calls = {"n": 0}
+
+    def bad_request():
+        calls["n"] += 1
+        raise _StatusError(400)
+
+    res = Resilience(sleep=lambda _s: None)
+    with pytest.raises(_StatusError):
+        res.call(bad_request)
+    assert calls["n"] == 1
+
+
+def test_breaker_opens_fails_fast_and_recovers():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+    res = Resilience(
+        policies={"timeout": RetryPolicy(max_attempts=1)},
+        breaker=breaker,
+        sleep=lambda _s: None,
+    )
+    calls = {"n": 0}
+
+    def down():
+        calls["n"] += 1
+        raise APITimeoutError()
+
+    for _ in range(2):
+        with pytest.raises(APITimeoutError):
+            res.call(down)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        res.call(down)
+    assert calls["n"] == 2  # no network attempt while open
+
+    clock.now += 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert res.call(lambda: "probe ok") == "probe ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_failed_probe_reopens():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5, clock=clock)
+    breaker.record_failure()
+    clock.now += 5
+    assert breaker.allow()
+    assert not breaker.allow()  # only one probe at a time
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
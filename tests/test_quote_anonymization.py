@@ -32,3 +32,21 @@ def test_anonymize_basic():
 
 def test_anonymize_empty():
     assert az.anonymize_quotes([]) == []
+
+
+def test_anonymize_failed_batch_falls_back(monkeypatch):
+    """A failing chunk is returned unredacted without affecting other chunks."""
+
+    def _flaky_chat(messages, **__):
+        if "quote 10" in messages[1]["content"]:
+            raise RuntimeError("API down")
+        count = messages[1]["content"].count("\n")
+        content = "[" + ", ".join(['"ok"'] * count) + "]"
+        return {"choices": [{"message": {"content": content}}]}
+
+    monkeypatch.setattr(az, "chat_completion", _flaky_chat)
+    quotes = [f"quote {i}" for i in range(12)]
+    result = az.anonymize_quotes(quotes)
+
+    assert result[:10] == ["ok"] * 10
+    assert result[10:] == ["[unredacted] quote 10", "[unredacted] quote 11"]
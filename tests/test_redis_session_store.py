@@ -0,0 +1,238 @@
+"""Tests for the Redis-backed session store (run against fakeredis)."""
+from __future__ import annotations
+
+from concurrent.futures import Future
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # Lua scripting support for fakeredis
+
+from src.exceptions import AlreadySubmittedError  # noqa: E402
+from src.feedback_record import FeedbackRecord  # noqa: E402
+from src.redis_session_store import RedisSessionStore  # noqa: E402
+from src.session_data import SessionData  # noqa: E402
+
+
+@pytest.fixture()
+def server():
+    return fakeredis.FakeServer()
+
+
+def _replica(server, **kwargs) -> RedisSessionStore:
+    """A store as one bot replica would see it."""
+    client = fakeredis.FakeRedis(server=server, decode_responses=True)
+    return RedisSessionStore(client, **kwargs)
+
+
+def _session(session_id: str = "s1") -> SessionData:
+    return SessionData(
+        session_id=session_id,
+        initiator_user_id="U0",
+        channel_id="C1",
+        target_user_ids=["U1", "U2"],
+        time_limit_minutes=10,
+    )
+
+
+def test_replicas_share_sessions(server):
+    first, second = _replica(server), _replica(server)
+    first.add_session(_session())
+    record = FeedbackRecord(user_id="U1", sentiment="positive", well="pairing")
+
+    second.submit_feedback("s1", "U1", record)
+
+    seen = first.get_session("s1")
+    assert seen.feedback_items == [record]
+    assert seen.pending_users == {"U2"}
+    assert seen.submitted_users == {"U1"}
+    assert list(first.get_all_sessions()) == ["s1"]
+
+
+def test_duplicate_submission_rejected_across_replicas(server):
+    first, second = _replica(server), _replica(server)
+    first.add_session(_session())
+    first.submit_feedback("s1", "U1", "one")
+
+    with pytest.raises(AlreadySubmittedError):
+        second.submit_feedback("s1", "U1", "two")
+    with pytest.raises(ValueError):
+        second.submit_feedback("s1", "U9", "stranger")
+    assert first.get_session("s1").feedback_items == ["one"]
+
+
+def test_stale_copy_cannot_double_submit(server):
+    store = _replica(server)
+    store.add_session(_session())
+    stale = store.get_session("s1")
+    store.submit_feedback("s1", "U1", "first")
+
+    # A modifier run on a copy loaded before the first submission still loses.
+    with pytest.raises(AlreadySubmittedError):
+        store._persist(stale, [("U1", "again")])
+
+
+def test_modify_reports_completion_and_fields(server):
+    store = _replica(server)
+    store.add_session(_session())
+    store.submit_feedback("s1", "U1", "a")
+
+    def _apply(session: SessionData) -> None:
+        session.submit("U2", "b")
+        session.feedback_sentiment = "neutral"
+
+    updated = store.modify_session("s1", _apply)
+
+    assert updated.is_complete
+    assert store.get_session("s1").feedback_sentiment == "neutral"
+
+
+def test_remove_is_won_by_one_replica(server):
+    first, second = _replica(server), _replica(server)
+    first.add_session(_session())
+
+    assert first.remove_session("s1") is not None
+    assert second.remove_session("s1") is None
+    assert second.count() == 0
+
+
+def test_limits_and_ttl(server):
+    store = _replica(server, max_sessions=1, max_age_seconds=60)
+    store.add_session(_session())
+    with pytest.raises(ValueError, match="Maximum concurrent"):
+        store.add_session(_session("s2"))
+    with pytest.raises(ValueError, match="already exists"):
+        _replica(server).add_session(_session())
+
+    client = fakeredis.FakeRedis(server=server, decode_responses=True)
+    # Time limit (10 min) outlasts max_age, so the TTL covers it.
+    assert 540 < client.ttl("sentiment:{s1}:meta") <= 600
+
+    client.delete("sentiment:{s1}:meta")  # as if it expired server-side
+    assert store.evict_expired() == []
+    assert store.eviction_stats()["indexed"] == 0
+    store.add_session(_session("s2"))
+
+
+def test_pending_sessions_for_user(server):
+    first, second = _replica(server), _replica(server)
+    first.add_session(_session("s1"))
+    second.add_session(_session("s2"))
+
+    assert [s.session_id for s in first.pending_sessions_for("U1")] == ["s1", "s2"]
+
+    second.submit_feedback("s1", "U1", "done")
+    second.remove_session("s2")
+
+    assert first.pending_sessions_for("U1") == []
+    assert [s.session_id for s in first.pending_sessions_for("U2")] == ["s1"]
+
+
+def test_incremental_results_reach_fresh_copies(server, monkeypatch):
+    from src.analysis.sentiment import SentimentLabel, SentimentResult
+    from src.reporting import config, incremental
+
+    def _run_now(_call_type, func, *args):
+        future: Future = Future()
+        future.set_result(func(*args))
+        return future
+
+    monkeypatch.setattr(config, "INCREMENTAL_ANALYSIS", True)
+    monkeypatch.setattr(config, "SENTIMENT_MODE", "model")
+    monkeypatch.setattr(incremental, "submit", _run_now)
+    monkeypatch.setattr(incremental, "ai_available", lambda: True)
+    monkeypatch.setattr(
+        incremental,
+        "analyze_sentiment",
+        lambda _text: SentimentResult(label=SentimentLabel.POSITIVE, score=0.8),
+    )
+    monkeypatch.setattr(
+        incremental, "anonymize_quotes", lambda quotes: [f"anon {q}" for q in quotes]
+    )
+    first, second = _replica(server), _replica(server)
+    first.add_session(_session())
+
+    first.submit_feedback("s1", "U1", "sentiment=positive, well=pairing, improve=docs")
+
+    # The report replica sees the results instead of analysing again
+    seen = second.get_session("s1")
+    assert seen.item_sentiments == {"well=pairing, improve=docs": "positive"}
+    assert seen.anonymized_quotes == {"pairing": "anon pairing", "docs": "anon docs"}
+
+    # Results arriving after the session is gone are dropped
+    second.remove_session("s1")
+    first._save_analysis("s1", {"late": "neutral"}, {})
+    assert not fakeredis.FakeRedis(server=server).exists("sentiment:{s1}:meta")
+
+
+def test_modal_submission_analysis_reaches_the_report(server, monkeypatch):
+    from unittest.mock import MagicMock, patch
+
+    from src.analysis.sentiment import SentimentLabel, SentimentResult
+    from src.reporting import config, incremental
+    from src.slack_bot.handlers import handle_feedback_modal_submission
+
+    def _run_now(_call_type, func, *args):
+        future: Future = Future()
+        future.set_result(func(*args))
+        return future
+
+    monkeypatch.setattr(config, "INCREMENTAL_ANALYSIS", True)
+    monkeypatch.setattr(config, "SENTIMENT_MODE", "model")
+    monkeypatch.setattr(incremental, "submit", _run_now)
+    monkeypatch.setattr(incremental, "ai_available", lambda: True)
+    monkeypatch.setattr(
+        incremental,
+        "analyze_sentiment",
+        lambda _text: SentimentResult(label=SentimentLabel.POSITIVE, score=0.8),
+    )
+    monkeypatch.setattr(
+        incremental, "anonymize_quotes", lambda quotes: [f"anon {q}" for q in quotes]
+    )
+    store = _replica(server)
+    store.add_session(_session())
+
+    def _view(well: str, improve: str) -> dict:
+        return {
+            "private_metadata": "s1",
+            "state": {
+                "values": {
+                    "sentiment_input_block": {
+                        "sentiment_dropdown_action": {
+                            "selected_option": {"value": "positive"}
+                        }
+                    },
+                    "feedback_question_well_block": {
+                        "feedback_question_well_input": {"value": well}
+                    },
+                    "feedback_question_improve_block": {
+                        "feedback_question_improve_input": {"value": improve}
+                    },
+                }
+            },
+        }
+
+    reported = []
+    with patch(
+        "src.app.submit_background", side_effect=lambda job, **_kw: job()
+    ), patch(
+        "src.reporting.render.dispatch_session_report",
+        side_effect=lambda session, **_kw: reported.append(session),
+    ):
+        for user, well, improve in (("U1", "pairing", "docs"), ("U2", "demos", "ci")):
+            handle_feedback_modal_submission(
+                ack=MagicMock(),
+                body={"user": {"id": user}},
+                client=MagicMock(),
+                view=_view(well, improve),
+                logger=MagicMock(),
+                session_store=store,
+            )
+
+    [session] = reported
+    assert session.item_sentiments == {
+        "well=pairing, improve=docs": "positive",
+        "well=demos, improve=ci": "positive",
+    }
+    assert session.anonymized_quotes["pairing"] == "anon pairing"
+    assert store.get_session("s1") is None  # marked done after the report
@@ -1,12 +1,15 @@
 """Unit tests for the custom Scheduler class."""
 from __future__ import annotations
 
+import math
+import random
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-from src.scheduler import Scheduler
+from src.scheduler import Scheduler, _ScheduledItem, _TimingWheel
 
 
 class TestScheduler:
@@ -43,3 +46,119 @@ class TestScheduler:
             sched.shutdown()
             # After shutdown, thread should have terminated
             assert not sched._thread.is_alive()
+
+    def test_cancel_prevents_callback(self):
+        fired = []
+        kept = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            sched = Scheduler(executor)
+            task_id = sched.schedule(0.05, fired.append, "cancelled")
+            sched.schedule(0.1, kept.set)
+
+            assert sched.cancel(task_id)
+            assert not sched.cancel(task_id)
+            assert kept.wait(0.5)
+            assert fired == []
+            assert sched.pending == 0
+            sched.shutdown()
+
+    def test_reschedule_moves_task_and_keeps_id(self):
+        fired = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            sched = Scheduler(executor)
+            task_id = sched.schedule(60, fired.set)
+
+            assert sched.reschedule(task_id, 0.05)
+            assert fired.wait(0.5)
+            assert not sched.reschedule(task_id, 1)
+            assert not sched.cancel(task_id)
+            sched.shutdown()
+
+    def test_cancelled_entries_are_compacted(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            sched = Scheduler(executor)
+            task_ids = [sched.schedule(60, lambda: None) for _ in range(200)]
+            for task_id in task_ids[:150]:
+                sched.cancel(task_id)
+
+            assert sched.pending == 50
+            assert len(sched._queue._queue) < 200
+            sched.shutdown()
+
+    def test_wheel_engine_dispatches_and_cancels(self):
+        fired = threading.Event()
+        dropped = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            sched = Scheduler(executor, engine="wheel", resolution=0.005)
+            task_id = sched.schedule(0.02, dropped.append, "cancelled")
+            sched.schedule(0.05, fired.set)
+            assert sched.cancel(task_id)
+
+            assert fired.wait(0.5)
+            assert dropped == []
+            assert sched.pending == 0
+            sched.shutdown()
+
+    def test_unknown_engine_raises(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with pytest.raises(ValueError):
+                Scheduler(executor, engine="calendar")
+
+    def test_wall_clock_steps_do_not_affect_timers(self, monkeypatch):
+        fired = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            sched = Scheduler(executor)
+            sched.schedule(0.05, fired.set)
+            # NTP-style step back by an hour
+            wall = time.time() - 3600
+            monkeypatch.setattr(time, "time", lambda: wall)
+
+            assert fired.wait(0.5)
+            sched.shutdown()
+
+    def test_stats_record_lag_and_queue_wait(self):
+        gate = threading.Event()
+        done = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            sched = Scheduler(executor)
+            sched.schedule(0, gate.wait, 1)  # occupies the only worker
+            sched.schedule(0, done.set)
+            deadline = time.monotonic() + 1
+            while sched.stats()["executor_queued"] < 1:
+                assert time.monotonic() < deadline
+                time.sleep(0.005)
+            time.sleep(0.05)
+            gate.set()
+            assert done.wait(1)
+            sched.shutdown()
+
+        stats = sched.stats()
+        assert stats["pending"] == 0
+        assert stats["dispatched"] == 2
+        assert stats["queue_wait"]["count"] == 2
+        assert stats["queue_wait"]["max"] >= 0.05
+        assert stats["dispatch_lag"]["max"] >= 0.05
+        assert stats["executor_queued"] == stats["running"] == 0
+
+
+def test_timing_wheel_fires_each_task_in_its_tick():
+    """Tiny wheel (two levels of four slots) exercises cascades and overflow."""
+    rnd = random.Random(7)
+    wheel = _TimingWheel(resolution=1.0, bits=2, levels=2, now=0.0)
+    now, live = 0.0, {}
+    for task_id in range(2000):
+        if rnd.random() < 0.5:
+            item = _ScheduledItem(now + rnd.uniform(0, 60), task_id, print, (), {})
+            wheel.push(item)
+            live[task_id] = item
+        elif rnd.random() < 0.2 and live:
+            wheel.remove(live.pop(rnd.choice(list(live))))
+        else:
+            now += rnd.uniform(0, 5)
+            for item in wheel.pop_due(now):
+                assert item.run_at <= now
+                del live[item.task_id]
+            # Nothing whose tick has passed is left behind
+            assert all(math.ceil(i.run_at) > math.floor(now) for i in live.values())
+    wheel.pop_due(now + 1000)
+    assert wheel.next_deadline() is None
@@ -0,0 +1,73 @@
+"""Tests for durable scheduler tasks and the SQLite journal."""
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.scheduler import Scheduler
+from src.scheduler_journal import SQLiteSchedulerJournal
+
+
+def _scheduler(executor, path, **kwargs) -> Scheduler:
+    return Scheduler(executor, journal=SQLiteSchedulerJournal(str(path)), **kwargs)
+
+
+def test_durable_tasks_survive_restart(tmp_path):
+    db = tmp_path / "timers.db"
+    ran = []
+    done = threading.Event()
+
+    def _task(session_id: str, attempt: int) -> None:
+        ran.append((session_id, attempt))
+        done.set()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        first = _scheduler(executor, db)
+        first.register_task("expire", _task)
+        first.schedule_task("expire", 0.3, "s1", 1)
+        cancelled = first.schedule_task("expire", 60, "s2", 1)
+        first.cancel(cancelled)
+        first.shutdown()  # "deploy" before the task is due
+
+        second = _scheduler(executor, db)
+        second.register_task("expire", _task)
+        replayed = second.replay()
+        assert [(kind, args) for _id, kind, args in replayed] == [("expire", ("s1", 1))]
+        assert done.wait(1)
+        assert ran == [("s1", 1)]
+        second.shutdown()
+
+    # Ran tasks are forgotten
+    assert SQLiteSchedulerJournal(str(db)).load() == []
+
+
+def test_overdue_tasks_replay_in_bounded_bursts(tmp_path):
+    db = tmp_path / "timers.db"
+    journal = SQLiteSchedulerJournal(str(db))
+    for i in range(5):
+        journal.add("nudge", [f"U{i}"], time.time() - 600)
+    journal.close()
+
+    ran = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        sched = _scheduler(executor, db, catchup_burst=2, catchup_interval=60)
+        sched.register_task("nudge", ran.append)
+        sched.replay()
+
+        deadline = time.time() + 1
+        while len(ran) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        assert ran == ["U0", "U1"]
+        assert sched.pending == 3
+        sched.shutdown()
+
+
+def test_schedule_task_requires_registered_kind(tmp_path):
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        sched = _scheduler(executor, tmp_path / "timers.db")
+        with pytest.raises(ValueError):
+            sched.schedule_task("missing", 1)
+        sched.shutdown()
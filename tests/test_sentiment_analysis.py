@@ -69,3 +69,87 @@ def test_bad_json():
     sa.chat_completion = bad_chat  # type: ignore[assignment]
     with pytest.raises(ValueError):
         sa.analyze_sentiment("oops")
+
+
+def _batch_reply(entries):
+    import json
+
+    return {"choices": [{"message": {"content": json.dumps(entries)}}]}
+
+
+def test_batch_single_request(monkeypatch):
+    calls = []
+
+    def fake_chat(messages, **_):
+        calls.append(messages)
+        return _batch_reply(
+            [
+                {"i": 0, "label": "positive", "score": 0.9},
+                {"i": 1, "label": "negative", "score": -0.7},
+                {"i": 2, "label": "neutral", "score": 0.0},
+            ]
+        )
+
+    monkeypatch.setattr(sa, "chat_completion", fake_chat)
+    res = sa.analyze_sentiments(["great", "awful", "meh"])
+
+    assert len(calls) == 1
+    assert [r.label for r in res] == [
+        sa.SentimentLabel.POSITIVE,
+        sa.SentimentLabel.NEGATIVE,
+        sa.SentimentLabel.NEUTRAL,
+    ]
+
+
+def test_batch_respects_batch_size(monkeypatch):
+    sizes = []
+
+    def fake_chat(messages, **_):
+        prompt = messages[1]["content"]
+        count = int(prompt.split("Texts (", 1)[1].split(")", 1)[0])
+        sizes.append(count)
+        return _batch_reply(
+            [{"i": i, "label": "neutral", "score": 0} for i in range(count)]
+        )
+
+    monkeypatch.setattr(sa, "chat_completion", fake_chat)
+    res = sa.analyze_sentiments([f"t{i}" for i in range(5)], batch_size=2)
+
+    assert sizes == [2, 2]  # trailing single item uses the per-item prompt
+    assert len(res) == 5
+
+
+def test_batch_out_of_order_splits(monkeypatch):
+    """A reordered array is rejected and the batch is split until it parses."""
+
+    def fake_chat(messages, **_):
+        if messages[0]["content"] == sa._BATCH_PROMPT_SYSTEM:
+            return _batch_reply(
+                [
+                    {"i": 1, "label": "negative", "score": -0.5},
+                    {"i": 0, "label": "positive", "score": 0.5},
+                ]
+            )
+        prompt = messages[1]["content"]
+        label = "positive" if "great" in prompt else "negative"
+        return {
+            "choices": [
+                {"message": {"content": f'{{"label": "{label}", "score": 0.1}}'}}
+            ]
+        }
+
+    monkeypatch.setattr(sa, "chat_completion", fake_chat)
+    res = sa.analyze_sentiments(["great", "awful"])
+
+    assert [r.label for r in res] == [
+        sa.SentimentLabel.POSITIVE,
+        sa.SentimentLabel.NEGATIVE,
+    ]
+
+
+def test_batch_unparseable_item_is_none(monkeypatch):
+    def fake_chat(*_, **__):
+        return {"choices": [{"message": {"content": "no json here"}}]}
+
+    monkeypatch.setattr(sa, "chat_completion", fake_chat)
+    assert sa.analyze_sentiments(["a", "b", "c"]) == [None, None, None]
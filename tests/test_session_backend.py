@@ -0,0 +1,117 @@
+"""Tests for persistent session backends."""
+from __future__ import annotations
+
+import datetime
+from unittest.mock import MagicMock
+
+import src.app as app
+from src.feedback_record import FeedbackRecord
+from src.session_backend import SessionBackend, SQLiteSessionBackend
+from src.session_data import SessionData
+from src.session_store import ThreadSafeSessionStore
+
+
+def _session(session_id: str = "s1", minutes: int = 10) -> SessionData:
+    return SessionData(
+        session_id=session_id,
+        initiator_user_id="U0",
+        channel_id="C1",
+        target_user_ids=["U1", "U2", "U3"],
+        time_limit_minutes=minutes,
+        reason="retro",
+    )
+
+
+def _store(path) -> ThreadSafeSessionStore:
+    return ThreadSafeSessionStore(
+        backend=SQLiteSessionBackend(str(path), commit_interval=0.01)
+    )
+
+
+def test_sessions_survive_restart(tmp_path):
+    db = tmp_path / "sessions.db"
+    store = _store(db)
+    session = _session()
+    store.add_session(session)
+    record = FeedbackRecord(user_id="U1", sentiment="positive", well="a, b")
+    store.submit_feedback("s1", "U1", record)
+    store.submit_feedback("s1", "U2", "free text")
+
+    def _label(s: SessionData) -> None:
+        s.feedback_sentiment = "neutral"
+
+    store.modify_session("s1", _label)
+    store.add_session(_session("gone"))
+    store.mark_done("gone")
+    store.close()
+
+    restored = _store(db)
+    recovered = restored.recover()
+
+    assert [s.session_id for s in recovered] == ["s1"]
+    again = restored.get_session("s1")
+    assert again.feedback_items == [record, "free text"]
+    assert again.pending_users == {"U3"}
+    assert again.submitted_users == {"U1", "U2"}
+    assert again.feedback_sentiment == "neutral"
+    assert again.reason == "retro"
+    assert again.created_at == session.created_at
+    assert 0 < again.time_remaining() <= 600
+    restored.close()
+
+
+def test_submissions_share_group_commits(tmp_path):
+    backend = SQLiteSessionBackend(str(tmp_path / "s.db"), commit_interval=0.2)
+    store = ThreadSafeSessionStore(backend=backend)
+    store.add_session(_session())
+    for user in ("U1", "U2", "U3"):
+        store.submit_feedback("s1", user, f"from {user}")
+
+    assert backend.flush(timeout=5)
+    # The insert and all three submissions landed in a single transaction.
+    assert backend.commits == 1
+    store.close()
+
+
+def test_default_backend_is_memory_only():
+    store = ThreadSafeSessionStore()
+    store.add_session(_session())
+    assert isinstance(store._backend, SessionBackend)
+    assert store._backend.load_sessions() == []
+    assert store.recover() == []
+
+
+def test_recovery_reregisters_timers(monkeypatch):
+    session = _session(minutes=10)
+    session.backdate(
+        datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(minutes=4)
+    )
+    mock_store = MagicMock()
+    mock_store.recover.return_value = [session]
+    mock_scheduler = MagicMock()
+    monkeypatch.setattr(app, "session_store", mock_store)
+    monkeypatch.setattr(app, "scheduler", mock_scheduler)
+
+    app._recover_sessions()
+
+    expiry, reminder = mock_scheduler.schedule_task.call_args_list
+    assert expiry.args[0] == app._EXPIRE_TASK
+    assert 355 < expiry.args[1] <= 360
+    assert reminder.args[0] == app._REMINDER_TASK
+    assert reminder.args[1] == expiry.args[1] - 60
+
+
+def test_recovery_keeps_journaled_timers(monkeypatch):
+    session = _session(minutes=10)
+    mock_store = MagicMock()
+    mock_store.recover.return_value = [session]
+    mock_scheduler = MagicMock()
+    mock_scheduler.replay.return_value = [(7, app._EXPIRE_TASK, ("s1", "U0"))]
+    monkeypatch.setattr(app, "session_store", mock_store)
+    monkeypatch.setattr(app, "scheduler", mock_scheduler)
+    monkeypatch.setattr(app, "_session_timers", {})
+
+    app._recover_sessions()
+
+    mock_scheduler.schedule_task.assert_not_called()
+    assert app._session_timers == {"s1": [7]}
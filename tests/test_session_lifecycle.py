@@ -72,3 +72,25 @@ def test_store_submit_and_mark_done():
     assert store.get_session("sess-2") is None
     # second call no error
     store.mark_done("sess-2")
+
+
+def test_session_membership_views():
+    """pending/submitted behave like sets but share one interned ID list."""
+    targets = ["".join(("U", str(i))) for i in (3, 1, 2, 1)]
+    session = SessionData("s", "UINIT", "C001", targets)
+
+    assert session.target_user_ids == ["U3", "U1", "U2"]
+    assert not hasattr(session, "__dict__")
+
+    session.pending_users -= {"U1"}
+    session.submitted_users.update(["U1"])
+    assert session.pending_users == {"U2", "U3"}
+    assert sorted(session.submitted_users) == ["U1"]
+    assert session.pending_users | {"U1"} == set(session.target_user_ids)
+    assert "UX" not in session.pending_users
+
+    with pytest.raises(ValueError):
+        session.pending_users.add("UX")
+
+    session.pending_users.clear()
+    assert session.is_complete
@@ -221,6 +221,122 @@ class TestThreadSafeSessionStore(unittest.TestCase):
         )  # Original store should be unaffected
         self.assertIs(self.store.get_session("s1"), self.session_data1)
 
+    def test_snapshot_is_read_only_and_versioned(self):
+        self.store.add_session(self.session_data1)
+        snapshot = self.store.snapshot()
+        version = self.store.version
+
+        self.store.add_session(self.session_data2)
+        self.store.remove_session("s1")
+
+        # The earlier view is unaffected by later writes...
+        self.assertEqual(list(snapshot), ["s1"])
+        with self.assertRaises(TypeError):
+            snapshot["s3"] = self.session_data1  # type: ignore[index]
+        # ...while the store publishes a new one.
+        self.assertEqual(list(self.store.get_active_sessions()), ["s2"])
+        self.assertEqual(self.store.version, version + 2)
+
+    def test_last_accessed_at_tracks_monotonic_touch(self):
+        session = self.session_data1
+        session.last_accessed_monotonic = session.last_accessed_monotonic - 30
+        before = session.last_accessed_at
+        session.touch()
+        self.assertGreaterEqual((session.last_accessed_at - before).total_seconds(), 30)
+        # Assigning a datetime still works and round-trips.
+        session.last_accessed_at = before
+        self.assertAlmostEqual(
+            (session.last_accessed_at - before).total_seconds(), 0, places=3
+        )
+
+    def test_evict_expired_drops_only_idle_sessions(self):
+        store = ThreadSafeSessionStore(max_age_seconds=60)
+        store.add_session(self.session_data1)
+        store.add_session(self.session_data2)
+        base = self.session_data1.last_accessed_monotonic
+
+        # s2 is touched later, so only s1 is past its deadline.
+        self.session_data2.last_accessed_monotonic = base + 30
+        evicted = store.evict_expired(now=base + 61)
+
+        self.assertEqual(evicted, [self.session_data1])
+        self.assertIsNone(store.get_session("s1"))
+        # s2's entry was re-queued with its new deadline, not evicted.
+        self.assertEqual(store.evict_expired(now=base + 61), [])
+        self.assertEqual(store.evict_expired(now=base + 91), [self.session_data2])
+        self.assertEqual(
+            store.eviction_stats(),
+            {"evicted_total": 2, "sweeps": 3, "indexed": 0, "sessions": 0},
+        )
+
+    def test_evict_expired_skips_removed_and_running_sessions(self):
+        store = ThreadSafeSessionStore(max_age_seconds=60)
+        timed = SessionData(
+            session_id="timed",
+            initiator_user_id="u",
+            channel_id="c",
+            target_user_ids=["t"],
+            time_limit_minutes=5,
+        )
+        store.add_session(self.session_data1)
+        store.add_session(timed)
+        store.remove_session("s1")
+        base = timed.created_monotonic
+
+        # Idle for 2 minutes but its 5-minute time limit has not passed yet.
+        self.assertEqual(store.evict_expired(now=base + 120), [])
+        self.assertEqual(store.evicted_total, 0)
+        self.assertEqual(store.evict_expired(now=base + 301), [timed])
+
+    def test_evict_expired_disabled_by_default(self):
+        self.store.add_session(self.session_data1)
+        self.assertEqual(self.store.evict_expired(now=float("inf")), [])
+        self.assertEqual(self.store.count(), 1)
+
+    def test_pending_sessions_for_user(self):
+        shared = SessionData(
+            session_id="s3",
+            initiator_user_id="u",
+            channel_id="c",
+            target_user_ids=["u1_target", "u2_target"],
+        )
+        self.store.add_session(self.session_data1)
+        self.store.add_session(self.session_data2)
+        self.store.add_session(shared)
+
+        self.assertEqual(
+            self.store.pending_sessions_for("u1_target"), [self.session_data1, shared]
+        )
+
+        self.store.submit_feedback("s3", "u1_target", "done")
+        self.assertEqual(
+            self.store.pending_sessions_for("u1_target"), [self.session_data1]
+        )
+
+        self.store.remove_session("s1")
+        self.assertEqual(self.store.pending_sessions_for("u1_target"), [])
+        self.assertEqual(
+            self.store.pending_sessions_for("u2_target"), [self.session_data2, shared]
+        )
+        self.assertEqual(self.store.pending_sessions_for("nobody"), [])
+
+    def test_close_listener_on_removal_only(self):
+        closed = []
+        self.store.add_close_listener(closed.append)
+        self.store.add_session(self.session_data1)
+        self.store.add_session(self.session_data2)
+
+        self.store.modify_session("s1", lambda s: s.add_feedback("more"))
+        self.assertEqual(closed, [])
+
+        # Completion keeps the expiry timer as a safety net
+        self.store.submit_feedback("s1", "u1_target", "done")
+        self.assertEqual(closed, [])
+        self.store.mark_done("s1")
+        self.store.remove_session("s2")
+        self.store.remove_session("s2")
+        self.assertEqual(closed, ["s1", "s2"])
+
     def test_thread_safety_concurrent_adds(self):
         num_threads = 10
         sessions_per_thread = 50  # Reduced for faster test execution
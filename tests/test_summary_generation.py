@@ -36,3 +36,12 @@ def test_truncation():
     truncated = sm.generate_summary(["foo"], [])
     assert truncated.endswith("…")
     assert len(truncated) <= 901  # <= max_length_chars + ellipsis
+
+
+def test_failure_raises_runtime_error(monkeypatch):
+    def _boom(*_, **__):  # type: ignore[override]
+        raise ConnectionError("down")
+
+    monkeypatch.setattr(sm, "chat_completion", _boom)
+    with pytest.raises(RuntimeError):
+        sm.generate_summary(["foo"], [])